@@ -0,0 +1,25 @@
+"""Add indexes for dashboard capture and target listings
+
+Revision ID: c7d1e4f2a9b3
+Revises: b5c8d9e3f4a1
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d1e4f2a9b3'
+down_revision = 'b5c8d9e3f4a1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_capturelog_target_started_at', 'capturelog', ['target', 'started_at'])
+    op.create_index('ix_neoobservability_score', 'neoobservability', ['score'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_neoobservability_score', table_name='neoobservability')
+    op.drop_index('ix_capturelog_target_started_at', table_name='capturelog')
@@ -0,0 +1,27 @@
+"""Drop single-column candidate_id indexes covered by the candidate unique constraints
+
+Revision ID: d4a8f1c6e2b7
+Revises: c7d1e4f2a9b3
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a8f1c6e2b7'
+down_revision = 'c7d1e4f2a9b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (candidate_id, night_key) and (candidate_id, epoch) unique indexes already lead with
+    # candidate_id and are scanned backwards for newest-first lookups.
+    op.drop_index('ix_neoobservability_candidate_id', table_name='neoobservability')
+    op.drop_index('ix_neoephemeris_candidate_id', table_name='neoephemeris')
+
+
+def downgrade() -> None:
+    op.create_index('ix_neoephemeris_candidate_id', 'neoephemeris', ['candidate_id'])
+    op.create_index('ix_neoobservability_candidate_id', 'neoobservability', ['candidate_id'])
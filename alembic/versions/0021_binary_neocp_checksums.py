@@ -0,0 +1,43 @@
+"""Store NEOCP snapshot and payload checksums as raw 32-byte digests
+
+Revision ID: e9b3c5d7f1a2
+Revises: d4a8f1c6e2b7
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9b3c5d7f1a2'
+down_revision = 'd4a8f1c6e2b7'
+branch_labels = None
+depends_on = None
+
+_TABLES = ('neocpsnapshot', 'neoobservationpayload')
+
+
+def upgrade() -> None:
+    # Dependent unique constraints and indexes are rebuilt by ALTER ... TYPE.
+    for table in _TABLES:
+        op.alter_column(
+            table,
+            'checksum',
+            type_=sa.LargeBinary(),
+            existing_type=sa.String(length=64),
+            existing_nullable=False,
+            postgresql_using="decode(checksum, 'hex')",
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(
+            table,
+            'checksum',
+            type_=sa.String(length=64),
+            existing_type=sa.LargeBinary(),
+            existing_nullable=False,
+            postgresql_using="encode(checksum, 'hex')",
+        )
@@ -0,0 +1,49 @@
+"""Store JSON payload columns as JSONB instead of serialized text
+
+Revision ID: f2c6a8d4b1e3
+Revises: e9b3c5d7f1a2
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c6a8d4b1e3'
+down_revision = 'e9b3c5d7f1a2'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    ('neoobservationpayload', 'payload_json', False),
+    ('equipmentprofilerecord', 'payload_json', False),
+    ('astrometricsolution', 'solver_info', True),
+    ('neoobservability', 'score_breakdown', True),
+    ('weathersnapshot', 'payload', False),
+)
+
+
+def upgrade() -> None:
+    for table, column, nullable in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.Text(),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    for table, column, nullable in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::text',
+        )
@@ -0,0 +1,48 @@
+"""Default NEOCP created/updated timestamps on the server
+
+Revision ID: a7e1d3f5c9b2
+Revises: f2c6a8d4b1e3
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7e1d3f5c9b2'
+down_revision = 'f2c6a8d4b1e3'
+branch_labels = None
+depends_on = None
+
+_UTC_NOW = sa.text("timezone('utc', now())")
+
+_COLUMNS = (
+    ('neocandidate', 'created_at'),
+    ('neocandidate', 'updated_at'),
+    ('neocpsnapshot', 'created_at'),
+    ('neoobservationpayload', 'created_at'),
+    ('neoephemeris', 'created_at'),
+)
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=_UTC_NOW,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=None,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+        )
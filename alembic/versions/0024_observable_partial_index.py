@@ -0,0 +1,29 @@
+"""Partial index over observable NeoObservability rows
+
+Revision ID: b3f9c2e6d8a4
+Revises: a7e1d3f5c9b2
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f9c2e6d8a4'
+down_revision = 'a7e1d3f5c9b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_neoobservability_observable_score',
+        'neoobservability',
+        ['score'],
+        postgresql_where=sa.text('is_observable'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_neoobservability_observable_score', table_name='neoobservability')
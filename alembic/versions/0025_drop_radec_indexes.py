@@ -0,0 +1,25 @@
+"""Drop unused single-column RA/Dec indexes on astrometric solutions
+
+Revision ID: c8d2e4a6f0b5
+Revises: b3f9c2e6d8a4
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8d2e4a6f0b5'
+down_revision = 'b3f9c2e6d8a4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_astrometry_ra', table_name='astrometricsolution')
+    op.drop_index('ix_astrometry_dec', table_name='astrometricsolution')
+
+
+def downgrade() -> None:
+    op.create_index('ix_astrometry_ra', 'astrometricsolution', ['ra_deg'])
+    op.create_index('ix_astrometry_dec', 'astrometricsolution', ['dec_deg'])
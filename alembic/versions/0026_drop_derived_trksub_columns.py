@@ -0,0 +1,36 @@
+"""Drop trksub from ephemeris/observability rows and cluster ephemerides by candidate
+
+Revision ID: d5a9f3b7e1c6
+Revises: c8d2e4a6f0b5
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a9f3b7e1c6'
+down_revision = 'c8d2e4a6f0b5'
+branch_labels = None
+depends_on = None
+
+_TABLES = ('neoephemeris', 'neoobservability')
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.drop_index(f'ix_{table}_trksub', table_name=table)
+        op.drop_column(table, 'trksub')
+    # Keep each candidate's samples physically contiguous for (candidate_id, epoch) reads.
+    # CLUSTER is a one-off rewrite; a later ``CLUSTER neoephemeris`` reuses this index.
+    op.execute('CLUSTER neoephemeris USING uq_neoeph_candidate_epoch')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE neoephemeris SET WITHOUT CLUSTER')
+    for table in _TABLES:
+        op.add_column(table, sa.Column('trksub', sa.String(length=16), nullable=True))
+        op.execute(f'UPDATE {table} SET trksub = candidate_id')
+        op.alter_column(table, 'trksub', existing_type=sa.String(length=16), nullable=False)
+        op.create_index(f'ix_{table}_trksub', table, ['trksub'])
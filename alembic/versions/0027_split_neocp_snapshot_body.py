@@ -0,0 +1,35 @@
+"""Move NEOCP snapshot HTML into its own table
+
+Revision ID: e1b7c4d9a3f8
+Revises: d5a9f3b7e1c6
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1b7c4d9a3f8'
+down_revision = 'd5a9f3b7e1c6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'neocpsnapshotbody',
+        sa.Column('snapshot_id', sa.Integer(), sa.ForeignKey('neocpsnapshot.id'), primary_key=True),
+        sa.Column('html', sa.Text(), nullable=False),
+    )
+    op.execute('INSERT INTO neocpsnapshotbody (snapshot_id, html) SELECT id, html FROM neocpsnapshot')
+    op.drop_column('neocpsnapshot', 'html')
+
+
+def downgrade() -> None:
+    op.add_column('neocpsnapshot', sa.Column('html', sa.Text(), nullable=True))
+    op.execute(
+        'UPDATE neocpsnapshot SET html = b.html FROM neocpsnapshotbody b WHERE b.snapshot_id = neocpsnapshot.id'
+    )
+    op.alter_column('neocpsnapshot', 'html', existing_type=sa.Text(), nullable=False)
+    op.drop_table('neocpsnapshotbody')
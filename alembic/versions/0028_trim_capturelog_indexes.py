@@ -0,0 +1,27 @@
+"""Drop single-column CaptureLog indexes covered by or unused beside (target, started_at)
+
+Revision ID: f6c3a9e2d4b7
+Revises: e1b7c4d9a3f8
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6c3a9e2d4b7'
+down_revision = 'e1b7c4d9a3f8'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ('created_at', 'index', 'kind', 'sequence', 'started_at', 'target')
+
+
+def upgrade() -> None:
+    for column in _COLUMNS:
+        op.drop_index(f'ix_capturelog_{column}', table_name='capturelog')
+
+
+def downgrade() -> None:
+    for column in _COLUMNS:
+        op.create_index(f'ix_capturelog_{column}', 'capturelog', [column], unique=False)
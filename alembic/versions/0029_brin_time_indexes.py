@@ -0,0 +1,42 @@
+"""Replace time-column B-trees on ephemeris/observability with BRIN indexes
+
+Revision ID: a2d8e5f1c7b9
+Revises: f6c3a9e2d4b7
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a2d8e5f1c7b9'
+down_revision = 'f6c3a9e2d4b7'
+branch_labels = None
+depends_on = None
+
+_BRIN = (
+    ('neoephemeris', 'created_at'),
+    ('neoobservability', 'night_key'),
+    ('neoobservability', 'computed_at'),
+)
+
+
+def upgrade() -> None:
+    # Epoch lookups always name a candidate and are served by uq_neoeph_candidate_epoch.
+    op.drop_index('ix_neoephemeris_epoch', table_name='neoephemeris')
+    for table, column in _BRIN:
+        op.drop_index(f'ix_{table}_{column}', table_name=table)
+        op.create_index(
+            f'brin_{table}_{column}',
+            table,
+            [column],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+
+
+def downgrade() -> None:
+    for table, column in _BRIN:
+        op.drop_index(f'brin_{table}_{column}', table_name=table)
+        op.create_index(f'ix_{table}_{column}', table, [column])
+    op.create_index('ix_neoephemeris_epoch', 'neoephemeris', ['epoch'])
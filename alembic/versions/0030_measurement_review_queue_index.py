@@ -0,0 +1,32 @@
+"""Covering partial index for the reviewed-measurement submission queue
+
+Revision ID: b4e0f6a2d8c3
+Revises: a2d8e5f1c7b9
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4e0f6a2d8c3'
+down_revision = 'a2d8e5f1c7b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_measurement_review_queue',
+        'measurement',
+        ['target', 'obs_time'],
+        postgresql_include=['created_at'],
+        postgresql_where=sa.text('reviewed'),
+    )
+    op.drop_index('ix_measurement_reviewed', table_name='measurement')
+
+
+def downgrade() -> None:
+    op.create_index('ix_measurement_reviewed', 'measurement', ['reviewed'])
+    op.drop_index('ix_measurement_review_queue', table_name='measurement')
@@ -0,0 +1,56 @@
+"""Store JSON-encoded list columns as native Postgres arrays
+
+Revision ID: c9f1a7b3e5d2
+Revises: b4e0f6a2d8c3
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9f1a7b3e5d2'
+down_revision = 'b4e0f6a2d8c3'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    ('submissionlog', 'measurement_ids', sa.Integer(), 'integer'),
+    ('measurement', 'flags', sa.Text(), 'text'),
+    ('astrometricsolution', 'flags', sa.Text(), 'text'),
+    ('neoobservability', 'limiting_factors', sa.Text(), 'text'),
+)
+
+
+def upgrade() -> None:
+    for table, column, item_type, sql_type in _COLUMNS:
+        # '[1, 2]' / '["a", "b"]' become the array literals '{1, 2}' / '{"a", "b"}'
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.ARRAY(item_type),
+            existing_type=sa.Text(),
+            existing_nullable=True,
+            postgresql_using=f"translate({column}, '[]', '{{}}')::{sql_type}[]",
+        )
+    op.create_index(
+        'ix_submissionlog_measurement_ids',
+        'submissionlog',
+        ['measurement_ids'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_submissionlog_measurement_ids', table_name='submissionlog')
+    for table, column, item_type, _sql_type in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            existing_type=postgresql.ARRAY(item_type),
+            existing_nullable=True,
+            postgresql_using=f'array_to_json({column})::text',
+        )
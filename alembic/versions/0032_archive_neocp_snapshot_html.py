@@ -0,0 +1,28 @@
+"""Add a pointer from NEOCP snapshots to their on-disk HTML archive
+
+Revision ID: d0a4b8c2f6e1
+Revises: c9f1a7b3e5d2
+Create Date: 2026-10-17
+
+Schema only: existing bodies stay in ``neocpsnapshotbody`` until
+``scripts/archive_neocp_snapshots.py`` moves them to the archive directory on the
+app host and fills in ``payload_path``.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd0a4b8c2f6e1'
+down_revision = 'c9f1a7b3e5d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('neocpsnapshot', sa.Column('payload_path', sa.String(length=512), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('neocpsnapshot', 'payload_path')
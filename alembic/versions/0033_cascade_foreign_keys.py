@@ -0,0 +1,40 @@
+"""Push dependent-row cleanup into the database with ON DELETE actions
+
+Revision ID: e7c5d1a9b3f4
+Revises: d0a4b8c2f6e1
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7c5d1a9b3f4'
+down_revision = 'd0a4b8c2f6e1'
+branch_labels = None
+depends_on = None
+
+# (table, column, referenced table, ON DELETE action)
+_FOREIGN_KEYS = (
+    ('astrometricsolution', 'capture_id', 'capturelog', 'CASCADE'),
+    ('candidateassociation', 'capture_id', 'capturelog', 'CASCADE'),
+    ('measurement', 'capture_id', 'capturelog', 'SET NULL'),
+    ('neoephemeris', 'candidate_id', 'neocandidate', 'CASCADE'),
+    ('neoobservability', 'candidate_id', 'neocandidate', 'CASCADE'),
+    ('system_events', 'session_id', 'observing_sessions', 'CASCADE'),
+)
+
+
+def _recreate(ondelete_for) -> None:
+    for table, column, referent, action in _FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referent, [column], ['id'], ondelete=ondelete_for(action))
+
+
+def upgrade() -> None:
+    _recreate(lambda action: action)
+
+
+def downgrade() -> None:
+    _recreate(lambda action: None)
@@ -0,0 +1,43 @@
+"""Move NeoCandidate.raw_entry into a sibling table
+
+Revision ID: f3b9e7c1a5d6
+Revises: e7c5d1a9b3f4
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b9e7c1a5d6'
+down_revision = 'e7c5d1a9b3f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'neocandidateraw',
+        sa.Column(
+            'candidate_id',
+            sa.String(),
+            sa.ForeignKey('neocandidate.id', ondelete='CASCADE'),
+            primary_key=True,
+        ),
+        sa.Column('raw_entry', sa.Text(), nullable=False),
+    )
+    op.execute(
+        'INSERT INTO neocandidateraw (candidate_id, raw_entry) '
+        'SELECT id, raw_entry FROM neocandidate WHERE raw_entry IS NOT NULL'
+    )
+    op.drop_column('neocandidate', 'raw_entry')
+
+
+def downgrade() -> None:
+    op.add_column('neocandidate', sa.Column('raw_entry', sa.Text(), nullable=True))
+    op.execute(
+        'UPDATE neocandidate SET raw_entry = r.raw_entry '
+        'FROM neocandidateraw r WHERE r.candidate_id = neocandidate.id'
+    )
+    op.drop_table('neocandidateraw')
@@ -1,14 +1,24 @@
 """ASTRO-NEO FastAPI application package."""
 
+import asyncio
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from .api import api_router
 from .core.config import settings
 from .core.logging_config import setup_logging
+from .core.partial_cache import install_partial_cache
+from .core.profiling import install_profiler
 from .core.site_config import bootstrap_site_config
 from .db.session import init_db
-from .dashboard import router as dashboard_router
+from .dashboard import (
+    prewarm_dashboard_caches,
+    prune_preview_cache,
+    router as dashboard_router,
+    warm_templates,
+)
 from .services.captures import prune_missing_captures
 
 
@@ -19,7 +29,15 @@ def create_app() -> FastAPI:
     logger = logging.getLogger(__name__)
     logger.info("Initializing ASTRO-NEO API with DEBUG logging enabled")
 
-    app = FastAPI(title=settings.app_name, version=settings.app_version)
+    app = FastAPI(
+        title=settings.app_name,
+        version=settings.app_version,
+        default_response_class=ORJSONResponse,
+    )
+    if settings.debug:
+        install_profiler(app)
+    if settings.dashboard_partial_cache_seconds > 0:
+        install_partial_cache(app, settings.dashboard_partial_cache_seconds)
     app.include_router(api_router, prefix=settings.api_prefix)
     app.include_router(dashboard_router)
     app.mount("/static", StaticFiles(directory="app/static"), name="static")
@@ -40,6 +58,15 @@ def create_app() -> FastAPI:
         bootstrap_site_config()
         init_db()
         prune_missing_captures()
+        prune_preview_cache()
+        warm_templates()
+
+    @app.on_event("startup")
+    async def _start_dashboard_prewarm() -> None:
+        if settings.dashboard_prewarm_seconds > 0 and not settings.debug:
+            app.state.dashboard_prewarm = asyncio.create_task(
+                prewarm_dashboard_caches(settings.dashboard_prewarm_seconds)
+            )
 
     return app
 
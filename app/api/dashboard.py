@@ -10,8 +10,9 @@ from sqlmodel import Session, select
 from app.api.session import dashboard_status as session_dashboard_status
 from app.services.notifications import NOTIFICATIONS
 from app.api.deps import get_db
-from app.models import AstrometricSolution
-from app.services.kpis import KPIService
+from app.models import AstrometricSolution, SubmissionLog
+from app.services.kpis import cached_daily_counts
+from app.services.session import SESSION_STATE
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -39,62 +40,55 @@ def dashboard_status() -> Any:
 
 @router.get("/partials/captures")
 def captures_partial() -> Any:
-    from app.services.session import SESSION_STATE
-
     return SESSION_STATE.current.captures if SESSION_STATE.current else []
 
 
 @router.get("/partials/solutions")
 def solutions_partial(session: Session = Depends(get_db)) -> Any:
-    stmt = select(AstrometricSolution).order_by(AstrometricSolution.solved_at.desc()).limit(15)
+    # Only the listed columns are fetched, so rows come back as plain tuples (no ORM hydration)
+    stmt = (
+        select(
+            AstrometricSolution.id,
+            AstrometricSolution.capture_id,
+            AstrometricSolution.path,
+            AstrometricSolution.ra_deg,
+            AstrometricSolution.dec_deg,
+            AstrometricSolution.uncertainty_arcsec,
+            AstrometricSolution.snr,
+            AstrometricSolution.mag_inst,
+            AstrometricSolution.flags,
+            AstrometricSolution.solved_at,
+            AstrometricSolution.success,
+            AstrometricSolution.target,
+        )
+        .order_by(AstrometricSolution.solved_at.desc())
+        .limit(15)
+    )
     rows = session.exec(stmt).all()
-    return {
-        "solutions": [
-            {
-                "id": row.id,
-                "capture_id": row.capture_id,
-                "measurement_id": getattr(row, "measurement_id", None),
-                "path": row.path,
-                "ra_deg": row.ra_deg,
-                "dec_deg": row.dec_deg,
-                "uncertainty_arcsec": row.uncertainty_arcsec,
-                "snr": getattr(row, "snr", None),
-                "mag_inst": getattr(row, "mag_inst", None),
-                "flags": row.flags,
-                "solved_at": row.solved_at,
-                "success": row.success,
-                "target": row.target,
-            }
-            for row in rows
-        ]
-    }
+    # measurement_id is not a column on AstrometricSolution; kept as null for API compatibility
+    return {"solutions": [{**row._mapping, "measurement_id": None} for row in rows]}
 
 
 @router.get("/partials/kpis")
 def kpis_partial() -> Any:
-    svc = KPIService()
-    data = svc.daily_counts()
-    return {"kpis": data}
+    return {"kpis": cached_daily_counts()}
 
 
 @router.get("/partials/submissions")
 def submissions_partial(session: Session = Depends(get_db)) -> Any:
-    from app.models import SubmissionLog
-
-    stmt = select(SubmissionLog).order_by(SubmissionLog.created_at.desc()).limit(10)
+    stmt = (
+        select(
+            SubmissionLog.id,
+            SubmissionLog.status,
+            SubmissionLog.channel,
+            SubmissionLog.created_at,
+            SubmissionLog.report_path,
+        )
+        .order_by(SubmissionLog.created_at.desc())
+        .limit(10)
+    )
     rows = session.exec(stmt).all()
-    return {
-        "submissions": [
-            {
-                "id": row.id,
-                "status": row.status,
-                "channel": row.channel,
-                "created_at": row.created_at,
-                "report_path": row.report_path,
-            }
-            for row in rows
-        ]
-    }
+    return {"submissions": [dict(row._mapping) for row in rows]}
 
 
 __all__ = ["router"]
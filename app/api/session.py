@@ -7,7 +7,7 @@ from typing import Any
 from fastapi import APIRouter, Body, HTTPException
 from pydantic import BaseModel, Field
 
-from app.services.nina_client import NinaBridgeService
+from app.services.nina_client import cached_bridge_status
 from app.services.night_ops import NightSessionError, kickoff_imaging
 from app.services.session import SESSION_STATE
 from datetime import datetime
@@ -222,8 +222,7 @@ def start_sequence(payload: TargetSequencePayload) -> Any:
 def dashboard_status() -> Any:
     """Bundle bridge + session info for a lightweight dashboard poll."""
 
-    bridge = NinaBridgeService()
-    bridge_status = bridge.get_status()
+    bridge_status = cached_bridge_status()
     session_info = SESSION_STATE.current.to_dict() if SESSION_STATE.current else None
 
     # Fetch local weather status
@@ -87,9 +87,8 @@ def activate_site(
     return site
 
 
-@router.post("/", response_model=SiteConfig)
-async def upsert_site(config: SiteConfig, session: Session = Depends(get_db)) -> SiteConfig:
-    """Create or update a site configuration."""
+def save_site_config(config: SiteConfig, session: Session) -> SiteConfig:
+    """Create or update the site named ``config.name``; synchronous so callers can offload it."""
     # Auto-configure Open-Meteo if not present
     if not config.weather_sensors:
         import json
@@ -115,16 +114,6 @@ async def upsert_site(config: SiteConfig, session: Session = Depends(get_db)) ->
         session.add(existing)
         session.commit()
         session.refresh(existing)
-        
-        # Trigger async horizon fetch
-        try:
-            from app.services.horizon import fetch_horizon_profile
-            profile = await fetch_horizon_profile(existing.latitude, existing.longitude)
-            existing.horizon_mask_json = json.dumps(profile)
-            session.add(existing)
-            session.commit()
-        except Exception:
-            logger.error("Failed to auto-fetch horizon", exc_info=True)
         return existing
 
     # Create new
@@ -136,18 +125,26 @@ async def upsert_site(config: SiteConfig, session: Session = Depends(get_db)) ->
     session.add(config)
     session.commit()
     session.refresh(config)
+    return config
+
+
+@router.post("/", response_model=SiteConfig)
+async def upsert_site(config: SiteConfig, session: Session = Depends(get_db)) -> SiteConfig:
+    """Create or update a site configuration."""
+    record = save_site_config(config, session)
 
     # Trigger async horizon fetch
     try:
+        import json
         from app.services.horizon import fetch_horizon_profile
-        profile = await fetch_horizon_profile(config.latitude, config.longitude)
-        config.horizon_mask_json = json.dumps(profile)
-        session.add(config)
+        profile = await fetch_horizon_profile(record.latitude, record.longitude)
+        record.horizon_mask_json = json.dumps(profile)
+        session.add(record)
         session.commit()
     except Exception:
         logger.error("Failed to auto-fetch horizon", exc_info=True)
 
-    return config
+    return record
 
 
 @router.get("/{name}", response_model=SiteConfig)
@@ -6,8 +6,12 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     app_name: str = "ASTRO-NEO"
     app_version: str = "0.1.0"
+    debug: bool = False
     api_prefix: str = "/api"
     database_url: str = "postgresql+psycopg://astro:astro@db:5432/astro"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle_seconds: int = 1800
     site_name: str = "default"
     site_latitude: float = 0.0
     site_longitude: float = 0.0
@@ -18,6 +22,7 @@ class Settings(BaseSettings):
     neocp_local_html: str = "/data/neocp_snapshots/toconfirm.html"
     neocp_text_url: str = "https://minorplanetcenter.net/iau/NEO/neocp.txt"
     neocp_local_text: str = "/data/neocp_snapshots/neocp.txt"
+    neocp_snapshot_archive_dir: str = "/data/neocp_archive"
     neocp_fetch_timeout: float = 30.0
     neocp_use_local_sample: bool = False
     neocp_api_url: str = "https://data.minorplanetcenter.net/api/get-obs-neocp"
@@ -74,6 +79,8 @@ class Settings(BaseSettings):
     nina_bridge_timeout: float = 300.0  # 5 minutes to handle long exposures + plate solving
     data_root: str = "/data"
     fits_retention_days: int = 14
+    dashboard_prewarm_seconds: float = 30.0  # 0 disables the summary cache prewarm loop
+    dashboard_partial_cache_seconds: float = 3.0  # 0 disables the partial response cache
     astrometry_worker_url: str | None = "http://astrometry-worker:8100"
     astrometry_worker_timeout: float = 300.0
     astrometry_config_path: str = "/app/astrometry.cfg"
@@ -81,6 +88,7 @@ class Settings(BaseSettings):
     astrometry_scale_high_arcsec: float | None = None
     astrometry_search_radius_deg: float | None = None
     astrometry_downsample: int | None = None
+    astrometry_solve_cache_dir: str = "/data/solver_cache"
     calibration_dark_counts: int = 10
     calibration_flat_counts: int = 10
     calibration_bias_counts: int = 20
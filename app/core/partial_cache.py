@@ -0,0 +1,60 @@
+"""Short-lived response cache for polled dashboard partials."""
+
+from __future__ import annotations
+
+import threading
+
+from cachetools import TTLCache
+from fastapi import FastAPI, Request, Response
+
+CACHED_PREFIX = "/dashboard/partials/"
+
+_SAFE_METHODS = frozenset({"GET", "HEAD"})
+
+
+def install_partial_cache(app: FastAPI, ttl: float) -> None:
+    """Serve repeat GETs of ``/dashboard/partials/*`` from memory for ``ttl`` seconds.
+
+    Entries are keyed on the URL and the HTMX target. Any non-GET request bumps an
+    epoch that is part of the key, so a form post is never followed by a stale partial.
+    Conditional requests bypass the cache so ETag revalidation keeps working.
+    """
+
+    cache: TTLCache = TTLCache(maxsize=256, ttl=ttl)
+    lock = threading.Lock()
+    epoch = 0
+
+    @app.middleware("http")
+    async def _cache_partials(request: Request, call_next):  # type: ignore[no-untyped-def]
+        nonlocal epoch
+        if request.method not in _SAFE_METHODS:
+            # Bump before and after, so a GET racing the write cannot cache pre-write state
+            epoch += 1
+            response = await call_next(request)
+            epoch += 1
+            return response
+        if (
+            request.method != "GET"
+            or not request.url.path.startswith(CACHED_PREFIX)
+            or "if-none-match" in request.headers
+        ):
+            return await call_next(request)
+
+        key = (epoch, str(request.url), request.headers.get("hx-target", ""))
+        with lock:
+            hit = cache.get(key)
+        if hit is not None:
+            body, headers = hit
+            return Response(content=body, headers=headers)
+
+        response = await call_next(request)
+        if response.status_code != 200 or not response.headers.get("content-type", "").startswith("text/html"):
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+        with lock:
+            cache[key] = (body, headers)
+        return Response(content=body, headers=headers)
+
+
+__all__ = ["install_partial_cache", "CACHED_PREFIX"]
@@ -0,0 +1,41 @@
+"""Opt-in request profiling for dashboard routes."""
+
+from __future__ import annotations
+
+import logging
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse
+
+logger = logging.getLogger(__name__)
+
+PROFILED_PREFIX = "/dashboard"
+
+
+def install_profiler(app: FastAPI) -> None:
+    """Return pyinstrument output for ``/dashboard/*`` requests sent with ``?profile=1``.
+
+    Only ``async def`` handlers are sampled meaningfully; sync handlers run in the
+    threadpool and show up as a single await.
+    """
+
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        logger.warning("Debug profiling requested but pyinstrument is not installed")
+        return
+
+    @app.middleware("http")
+    async def _profile_dashboard(request: Request, call_next):  # type: ignore[no-untyped-def]
+        if not request.url.path.startswith(PROFILED_PREFIX) or request.query_params.get("profile") != "1":
+            return await call_next(request)
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            await call_next(request)
+        finally:
+            profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
+
+__all__ = ["install_profiler", "PROFILED_PREFIX"]
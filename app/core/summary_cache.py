@@ -0,0 +1,62 @@
+"""Short-lived in-process cache for dashboard summary contexts."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import threading
+import time
+from typing import Any, Callable, Mapping
+
+import orjson
+
+_CACHE: dict[str, tuple[float, Any]] = {}
+_LOCK = threading.Lock()
+
+
+def cache_key(endpoint: str, params: Mapping[str, Any] | None = None) -> str:
+    """Build a versioned key from an endpoint name and its query parameters."""
+    digest = hashlib.blake2b(
+        orjson.dumps(sorted((params or {}).items()), default=str), digest_size=8
+    ).hexdigest()
+    return f"v1:dash:{endpoint}:{digest}"
+
+
+def lookup(key: str) -> Any | None:
+    """Return the cached value for ``key``, or ``None`` if missing or expired."""
+    with _LOCK:
+        entry = _CACHE.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del _CACHE[key]
+            return None
+        return value
+
+
+def store(key: str, value: Any, ttl: float = 60.0) -> None:
+    """Cache ``value``; the TTL is jittered so polled keys do not all expire together."""
+    with _LOCK:
+        _CACHE[key] = (time.monotonic() + ttl * random.uniform(0.8, 1.0), value)
+
+
+def cached(endpoint: str, params: Mapping[str, Any] | None, compute: Callable[[], Any], ttl: float = 60.0) -> Any:
+    """Cache-aside: return the cached value for the endpoint/params, computing it on a miss."""
+    key = cache_key(endpoint, params)
+    value = lookup(key)
+    if value is None:
+        value = compute()
+        store(key, value, ttl)
+    return value
+
+
+def invalidate(endpoint: str) -> None:
+    """Drop every cached entry for ``endpoint``."""
+    prefix = f"v1:dash:{endpoint}:"
+    with _LOCK:
+        for key in [k for k in _CACHE if k.startswith(prefix)]:
+            del _CACHE[key]
+
+
+__all__ = ["cache_key", "cached", "invalidate", "lookup", "store"]
@@ -2,56 +2,199 @@
 
 from __future__ import annotations
 
-import base64
-import json
+import asyncio
+import hashlib
+import os
+import shutil
+import threading
+import warnings
+import zoneinfo
+from datetime import datetime, time as dt_time, timedelta, timezone
+from email.utils import format_datetime
+from html import escape
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 import logging
 from typing import Any
 
 import numpy as np
+import orjson
+from cachetools import LRUCache, TTLCache
 from astropy.io import fits
 from astropy.visualization import ZScaleInterval
-from fastapi import APIRouter, Depends, Request, Form
-from fastapi.responses import HTMLResponse, JSONResponse
+from astropy.wcs import WCS
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Form, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 from PIL import Image
 from sqlmodel import Session, select, update
-from sqlalchemy import func
+from sqlalchemy import Integer, any_, bindparam, func, text, true
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import load_only
 
-from app.services.nina_client import NinaBridgeService
+from app.services.nina_client import NinaBridgeService, cached_bridge_status, invalidate_bridge_status
 
 from app.api.session import dashboard_status as session_dashboard_status
-from app.db.session import get_session
+from app.api.site import activate_site, save_site_config
+from app.core.site_config import db_site_to_file_config
+from app.db.session import get_async_session, get_session
 from app.models import (
     AstrometricSolution,
     CandidateAssociation,
     EquipmentProfileRecord,
     CaptureLog,
     NeoCandidate,
+    NeoCandidateRaw,
     NeoEphemeris,
     NeoObservability,
     Measurement,
     SubmissionLog,
     SiteConfig,
 )
+from app.core import summary_cache
 from app.core.config import settings
+from app.services.analysis import AnalysisService
 from app.services.equipment import (
+    CameraCapabilities,
     EquipmentProfileSpec,
+    MountCapabilities,
+    TelescopeCapabilities,
     activate_profile,
+    delete_profile,
     get_active_equipment_profile,
     list_profiles,
     save_profile,
 )
-from app.services.kpis import KPIService
+from app.services.horizon import fetch_horizon_profile
+from app.services.kpis import cached_daily_counts, refresh_daily_counts
+from app.services.motion import estimate_motion_rate_arcsec_per_min
+from app.services.neocp_fetcher import NeoCPFetcherService
+from app.services.observability import ObservabilityService
+from app.services.presets import select_preset
+from app.services.reporting import ReportService
 from app.services.session import SESSION_STATE
 from app.services.night_ops import NightSessionError, kickoff_imaging
+from app.services.synthetic_targets import SyntheticTargetService
 from app.services.weather import WeatherService
 
 templates = Jinja2Templates(directory="app/templates")
+# Outside debug, compiled templates are reused without stat-ing the source on every render.
+templates.env.auto_reload = settings.debug
 templates.env.filters["basename"] = lambda p: Path(p).name if p else ""
 router = APIRouter()
 logger = logging.getLogger(__name__)
+if not settings.debug:
+    # Compiled template bytecode survives restarts, so workers skip re-parsing on first render.
+    _TEMPLATE_BYTECODE_DIR = Path(settings.data_root) / "jinja_cache"
+    try:
+        _TEMPLATE_BYTECODE_DIR.mkdir(parents=True, exist_ok=True)
+        templates.env.bytecode_cache = FileSystemBytecodeCache(str(_TEMPLATE_BYTECODE_DIR))
+    except OSError:
+        logger.warning("Template bytecode cache disabled; %s is not writable", _TEMPLATE_BYTECODE_DIR)
+
+# FITS previews only change when the file on disk does; let the browser revalidate briefly.
+_PREVIEW_CACHE_CONTROL = "private, max-age=30"
+_REPORTS_CACHE_CONTROL = "private, no-cache"
+# Largest preview edge (pixels) rendered for thumbnail-style views.
+_PREVIEW_MAX_DIM = 1024
+# Encoded previews keyed by file identity, so repeat views skip FITS decoding.
+_PREVIEW_DIR = Path(settings.data_root) / "preview_cache"
+# Preview URLs carry the frame mtime, so the bytes behind one URL never change.
+_PREVIEW_IMAGE_CACHE_CONTROL = "private, max-age=3600"
+_PREVIEW_JPEG_QUALITY = 80
+# Hot previews stay in memory (bounded by total bytes) in front of the disk cache.
+_PREVIEW_MEMORY: LRUCache = LRUCache(maxsize=64 * 1024 * 1024, getsizeof=len)
+_PREVIEW_MEMORY_LOCK = threading.Lock()
+# Per-key render locks so concurrent requests for one frame render it once.
+_PREVIEW_RENDER_LOCKS: dict[str, threading.Lock] = {}
+# Disk entries older than this are removed at startup; they are re-rendered on demand.
+_PREVIEW_DISK_MAX_AGE_S = 24 * 3600
+
+# Static error fragments for the report submission form, encoded once at import.
+_ERR_NO_IDS = b"<div>Error: No measurements selected.</div>"
+_ERR_BAD_IDS = b"<div>Error: Invalid measurement IDs.</div>"
+_ERR_NOT_FOUND = b"<div>Error: Measurements not found.</div>"
+_HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+
+# Everything targets_clear wipes; the set is closed under foreign keys so TRUNCATE needs no CASCADE.
+_NEOCP_CLEAR_MODELS = (
+    Measurement,
+    AstrometricSolution,
+    CandidateAssociation,
+    SubmissionLog,
+    NeoObservability,
+    NeoEphemeris,
+    NeoCandidateRaw,
+    NeoCandidate,
+)
+
+# Bridge blockers that are expected while imaging and are not shown on the status panel.
+_IGNORED_BLOCKERS = frozenset({"camera_exposing", "sequence_running"})
+
+# IANA zone names only change with the tzdata package; enumerate and sort them once.
+_TIMEZONES: tuple[str, ...] = tuple(sorted(zoneinfo.available_timezones()))
+
+# NINA sometimes files frames under a date folder; those are not real targets.
+_DATE_LIKE_TARGET = r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$"
+
+# Hot statements are built once at import; per-request values go in as bound parameters.
+_RECENT_SUBMISSIONS_STMT = (
+    select(
+        SubmissionLog.id,
+        SubmissionLog.status,
+        SubmissionLog.channel,
+        SubmissionLog.created_at,
+        SubmissionLog.report_path,
+    )
+    .order_by(SubmissionLog.created_at.desc())
+    .limit(bindparam("limit", type_=Integer))
+)
+# Deepest submission log view (Reports tab); shallower views slice the shared fetch.
+_RECENT_SUBMISSIONS_MAX = 15
+_ACTIVE_TIMEZONE_STMT = select(SiteConfig.timezone).where(SiteConfig.is_active == True)
+_CAPTURE_BY_PATH_STMT = select(CaptureLog).where(CaptureLog.path == bindparam("path"))
+# One int[] parameter regardless of selection size, instead of one bind per id.
+_MEASUREMENTS_BY_IDS_STMT = select(Measurement).where(
+    Measurement.id == any_(bindparam("ids", type_=postgresql.ARRAY(Integer)))
+)
+
+
+def _etag_for(*parts: Any) -> str:
+    """Build a strong ETag from the values that determine a rendered partial."""
+    digest = hashlib.blake2b(":".join(str(p) for p in parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def _file_mtime(path: str) -> float | None:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _render_partial(
+    name: str,
+    context: dict[str, Any],
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> HTMLResponse:
+    """Render a small fragment straight to an HTMLResponse.
+
+    For partials whose templates never touch ``request``; skips the per-call
+    TemplateResponse setup (request/url_for injection, debug extensions).
+    """
+    body = templates.get_template(name).render(context)
+    return HTMLResponse(content=body, status_code=status_code, headers=headers)
 
 
 @router.get("/dashboard", response_class=HTMLResponse)
@@ -73,21 +216,16 @@ def _render_status_panel(
     oob: bool = False,
 ) -> HTMLResponse:
     bundle = bundle or session_dashboard_status()
-    raw_blockers = bundle.get("bridge_blockers") or []
-    ignored = {"camera_exposing", "sequence_running"}
-    filtered_blockers = []
-    for item in raw_blockers:
-        reason = item.get("reason") if isinstance(item, dict) else item
-        if reason in ignored:
-            continue
-        filtered_blockers.append(item)
-    bundle = dict(bundle)
-    bundle["bridge_blockers_filtered"] = filtered_blockers
-    return templates.TemplateResponse(
+    blockers = [
+        item
+        for item in bundle.get("bridge_blockers") or []
+        if (item.get("reason") if isinstance(item, dict) else item) not in _IGNORED_BLOCKERS
+    ]
+    return _render_partial(
         "dashboard/partials/status.html",
         {
-            "request": request,
             "bundle": bundle,
+            "blockers": blockers,
             "status_banner": status_banner,
             "oob": oob,
             "timezone": SESSION_STATE.timezone,
@@ -96,10 +234,23 @@ def _render_status_panel(
     )
 
 
+def _render_status_banner(
+    request: Request,
+    status_banner: dict[str, str],
+    status_code: int = 200,
+) -> HTMLResponse:
+    """Swap only the banner slot of the status panel when nothing else changed."""
+    return _render_partial(
+        "dashboard/partials/status_banner.html",
+        {"status_banner": status_banner},
+        status_code=status_code,
+        headers={"HX-Retarget": "#status-banner", "HX-Reswap": "outerHTML"},
+    )
+
+
 @router.get("/dashboard/partials/status", response_class=HTMLResponse)
 def dashboard_status_partial(request: Request) -> Any:
     """HTMX-friendly status bundle."""
-    import logging
     logging.getLogger("uvicorn").info("Overview status update requested")
     return _render_status_panel(request)
 
@@ -107,19 +258,20 @@ def dashboard_status_partial(request: Request) -> Any:
 @router.post("/dashboard/weather/override", response_class=HTMLResponse)
 def weather_override(request: Request, ignore: bool = Form(...)) -> Any:
     """Toggle weather override."""
-    from app.services.nina_client import NinaBridgeService
     bridge = NinaBridgeService()
     bridge.set_ignore_weather(ignore)
+    invalidate_bridge_status()
     return _render_status_panel(request)
 
 
 @router.get("/dashboard/partials/captures", response_class=HTMLResponse)
 def captures_partial(request: Request) -> Any:
     """Render recent captures from session state (in-memory + DB seeded)."""
-    captures = SESSION_STATE.current.captures if SESSION_STATE.current else []
-    return templates.TemplateResponse(
+    snap = SESSION_STATE.snapshot
+    captures = snap.current.captures if snap.current else []
+    return _render_partial(
         "dashboard/partials/captures.html",
-        {"request": request, "captures": captures, "timezone": SESSION_STATE.timezone},
+        {"captures": captures, "timezone": snap.timezone},
     )
 
 
@@ -128,37 +280,53 @@ def solutions_partial(request: Request) -> Any:
     """Render solver view with target selector and per-frame solve status."""
     selected_target = request.query_params.get("target")
     with get_session() as session:
-        # Fetch all targets, then filter out invalid ones (dates, directory names, etc.)
+        # Fetch targets, skipping frame-type placeholders and date-named folders
         target_rows = session.exec(
             select(CaptureLog.target, func.count().label("count"), func.max(CaptureLog.started_at).label("latest"))
             .where(CaptureLog.target.notin_(["Unknown", "LIGHT", "DARK", "BIAS", "FLAT", "SNAPSHOT", "Snapshot"]))
+            .where(~CaptureLog.target.regexp_match(_DATE_LIKE_TARGET))
             .group_by(CaptureLog.target)
             .order_by(func.max(CaptureLog.started_at).desc())
             .limit(30)
         ).all()
-        # Filter out targets that look like dates (YYYY-MM-DD pattern)
-        import re
-        date_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-        targets = [{"name": row[0], "count": row[1], "latest": row[2]} for row in target_rows if not date_pattern.match(row[0])]
-        if not selected_target and targets:
+        targets = [{"name": row[0], "count": row[1], "latest": row[2]} for row in target_rows]
+        if not targets:
+            # Nothing captured yet: skip the per-target capture/solution join entirely
+            return templates.TemplateResponse(
+                "dashboard/partials/solutions.html",
+                {
+                    "request": request,
+                    "targets": [],
+                    "selected_target": None,
+                    "captures": [],
+                    "solutions_map": {},
+                    "solver_activity": None,
+                    "timezone": SESSION_STATE.timezone,
+                },
+            )
+        if not selected_target:
             selected_target = targets[0]["name"]
         captures = []
         solutions_map: dict[int, AstrometricSolution] = {}
         solver_activity = None
         if selected_target:
-            capture_rows = session.exec(
-                select(CaptureLog).where(CaptureLog.target == selected_target).order_by(CaptureLog.started_at.desc())
+            rows = session.exec(
+                select(CaptureLog, AstrometricSolution)
+                .outerjoin(AstrometricSolution, AstrometricSolution.capture_id == CaptureLog.id)
+                .options(load_only(*_CAPTURE_LISTING_COLUMNS))
+                .where(CaptureLog.target == selected_target)
+                .order_by(CaptureLog.started_at.desc(), CaptureLog.id, AstrometricSolution.id)
             ).all()
-            captures = list(capture_rows)
-            capture_ids = [c.id for c in captures if c.id]
-            if capture_ids:
-                solution_rows = session.exec(
-                    select(AstrometricSolution).where(AstrometricSolution.capture_id.in_(capture_ids))
-                ).all()
-                solutions_map = {row.capture_id: row for row in solution_rows if row.capture_id}
-            pending = [c for c in captures if c.id not in solutions_map]
-            if pending:
-                solver_activity = f"Pending solves: {len(pending)}"
+            seen: set[int] = set()
+            for cap, solution in rows:
+                if cap.id not in seen:
+                    seen.add(cap.id)
+                    captures.append(cap)
+                if solution is not None:
+                    solutions_map[cap.id] = solution
+            pending_count = len(captures) - len(solutions_map)
+            if pending_count:
+                solver_activity = f"Pending solves: {pending_count}"
             elif solutions_map:
                 solver_activity = "All frames solved for this target."
     return templates.TemplateResponse(
@@ -175,36 +343,53 @@ def solutions_partial(request: Request) -> Any:
     )
 
 
+async def _recent_submissions(session: Any, limit: int) -> list[Any]:
+    """Newest submission log rows, shared by the submission views.
+
+    One fetch of ``_RECENT_SUBMISSIONS_MAX`` rows is cached under the "reports" namespace,
+    which every SubmissionLog write already invalidates.
+    """
+    key = summary_cache.cache_key("reports", {"recent": _RECENT_SUBMISSIONS_MAX})
+    rows = summary_cache.lookup(key)
+    if rows is None:
+        rows = (await session.exec(_RECENT_SUBMISSIONS_STMT, params={"limit": _RECENT_SUBMISSIONS_MAX})).all()
+        summary_cache.store(key, rows)
+    return rows[:limit]
+
+
+async def _active_timezone(session: Any) -> str:
+    """Async counterpart of ``SESSION_STATE.timezone`` on an existing async session."""
+    active = (await session.exec(_ACTIVE_TIMEZONE_STMT)).first()
+    return active or "UTC"
+
+
 @router.get("/dashboard/partials/submissions", response_class=HTMLResponse)
-def submissions_partial(request: Request) -> Any:
+async def submissions_partial(request: Request) -> Any:
     """Render recent submission log entries."""
-    with get_session() as session:
-        stmt = select(SubmissionLog).order_by(SubmissionLog.created_at.desc()).limit(10)
-        submissions = session.exec(stmt).all()
-    return templates.TemplateResponse(
+    async with get_async_session() as session:
+        submissions = await _recent_submissions(session, 10)
+        tz_name = await _active_timezone(session)
+    return _render_partial(
         "dashboard/partials/submissions.html",
-        {"request": request, "submissions": submissions, "timezone": SESSION_STATE.timezone},
+        {"submissions": submissions, "timezone": tz_name},
     )
 
 
 @router.get("/dashboard/partials/kpis", response_class=HTMLResponse)
 def kpis_partial(request: Request) -> Any:
     """Render KPI rollups (7-day window)."""
-    svc = KPIService()
-    kpis = svc.daily_counts()
-    return templates.TemplateResponse(
+    kpis = cached_daily_counts()
+    return _render_partial(
         "dashboard/partials/kpis.html",
-        {"request": request, "kpis": kpis},
+        {"kpis": kpis},
     )
 
 
 @router.get("/dashboard/partials/observatory", response_class=HTMLResponse)
 def observatory_partial(request: Request, edit_site_id: int | None = None) -> Any:
     """Render site config snapshot."""
-    from app.core.site_config import db_site_to_file_config
-    import zoneinfo
     
-    timezones = sorted(list(zoneinfo.available_timezones()))
+    timezones = _TIMEZONES
     
     with get_session() as session:
         sites = session.exec(select(SiteConfig).order_by(SiteConfig.name)).all()
@@ -234,10 +419,8 @@ def observatory_partial(request: Request, edit_site_id: int | None = None) -> An
         weather_summary = weather_service.get_status()
     
     # Fetch bridge status to get ignore_weather flag
-    from app.services.nina_client import NinaBridgeService
-    bridge = NinaBridgeService()
     try:
-        bridge_status = bridge.get_status()
+        bridge_status = cached_bridge_status()
         ignore_weather = bridge_status.get("ignore_weather", False)
     except Exception:
         ignore_weather = False
@@ -245,8 +428,8 @@ def observatory_partial(request: Request, edit_site_id: int | None = None) -> An
     weather_sources: list[dict[str, Any]] = []
     if context_site and context_site.weather_sensors:
         try:
-            payload = json.loads(context_site.weather_sensors)
-        except json.JSONDecodeError:
+            payload = orjson.loads(context_site.weather_sensors)
+        except orjson.JSONDecodeError:
             payload = None
         if isinstance(payload, list):
             for entry in payload:
@@ -276,7 +459,6 @@ def observatory_partial(request: Request, edit_site_id: int | None = None) -> An
 @router.post("/dashboard/observatory/activate", response_class=HTMLResponse)
 def observatory_activate(request: Request, site_id: int = Form(...)) -> Any:
     """Activate a site profile."""
-    from app.api.site import activate_site
     with get_session() as session:
         activate_site(site_id, session)
     return observatory_partial(request)
@@ -285,7 +467,6 @@ def observatory_activate(request: Request, site_id: int = Form(...)) -> Any:
 @router.post("/dashboard/observatory/delete", response_class=HTMLResponse)
 def observatory_delete(request: Request, site_id: int = Form(...)) -> Any:
     """Delete a site profile."""
-    from app.models import SiteConfig
     with get_session() as session:
         site = session.get(SiteConfig, site_id)
         if site and not site.is_active:
@@ -294,9 +475,25 @@ def observatory_delete(request: Request, site_id: int = Form(...)) -> Any:
     return observatory_partial(request)
 
 
+async def _refresh_site_horizon(site_id: int, latitude: float, longitude: float) -> None:
+    """Fetch the PVGIS horizon for a site and store it as the site's horizon mask."""
+    try:
+        profile = await fetch_horizon_profile(latitude, longitude)
+    except Exception as exc:
+        logger.error("Failed to refresh horizon for site %s: %s", site_id, exc, exc_info=True)
+        return
+    with get_session() as session:
+        site = session.get(SiteConfig, site_id)
+        if site:
+            site.horizon_mask_json = orjson.dumps(profile).decode()
+            session.add(site)
+            session.commit()
+
+
 @router.post("/dashboard/observatory/save", response_class=HTMLResponse)
 async def observatory_save(
     request: Request,
+    background_tasks: BackgroundTasks,
     name: str = Form(...),
     latitude: float = Form(...),
     longitude: float = Form(...),
@@ -307,68 +504,85 @@ async def observatory_save(
     site_id: int | None = Form(None),
 ) -> Any:
     """Save or update a site profile."""
-    from app.api.site import upsert_site
-    from app.models import SiteConfig
     
-    with get_session() as session:
-        if site_id:
-            # Update existing
-            existing = session.get(SiteConfig, site_id)
-            if existing:
-                existing.name = name
-                existing.latitude = latitude
-                existing.longitude = longitude
-                existing.altitude_m = altitude_m
-                existing.timezone = timezone
-                existing.bortle = bortle
-                
-                if activate:
-                     session.exec(update(SiteConfig).where(SiteConfig.id != site_id).values(is_active=False))
-                     existing.is_active = True
-                
-                session.add(existing)
-                session.commit()
-                
-                # Trigger horizon fetch
-                from app.services.horizon import fetch_horizon_profile
-                import asyncio
-                asyncio.create_task(fetch_horizon_profile(existing.latitude, existing.longitude))
-        else:
-            # Create new
-            payload = SiteConfig(
-                name=name,
-                latitude=latitude,
-                longitude=longitude,
-                altitude_m=altitude_m,
-                timezone=timezone,
-                bortle=bortle,
-                telescope_design="Reflector", # Default
-                telescope_aperture=0.0,
-                telescope_detector="CCD",
-                is_active=activate
-            )
-            
-            # Use upsert logic
-            await upsert_site(payload, session)
+    if site_id:
+        # Update existing off the event loop
+        updated = await run_in_threadpool(
+            _update_site, site_id, name, latitude, longitude, altitude_m, timezone, bortle, activate
+        )
+        if updated:
+            # Refresh the horizon once the response is sent
+            background_tasks.add_task(_refresh_site_horizon, site_id, latitude, longitude)
+        return await run_in_threadpool(observatory_partial, request)
+
+    # Create new
+    payload = SiteConfig(
+        name=name,
+        latitude=latitude,
+        longitude=longitude,
+        altitude_m=altitude_m,
+        timezone=timezone,
+        bortle=bortle,
+        telescope_design="Reflector", # Default
+        telescope_aperture=0.0,
+        telescope_detector="CCD",
+        is_active=activate
+    )
+    # Upsert off the event loop; the horizon is fetched after the response like updates
+    site_id, latitude, longitude = await run_in_threadpool(_create_site, payload)
+    background_tasks.add_task(_refresh_site_horizon, site_id, latitude, longitude)
+
+    return await run_in_threadpool(observatory_partial, request)
 
-    return observatory_partial(request)
+
+def _create_site(payload: SiteConfig) -> tuple[int, float, float]:
+    """Upsert a new site profile; returns the stored id and coordinates for the horizon refresh."""
+    with get_session() as session:
+        record = save_site_config(payload, session)
+        return record.id, record.latitude, record.longitude
+
+
+def _update_site(
+    site_id: int,
+    name: str,
+    latitude: float,
+    longitude: float,
+    altitude_m: float,
+    timezone: str,
+    bortle: int | None,
+    activate: bool,
+) -> bool:
+    """Apply the observatory form to an existing site; returns False if it no longer exists."""
+    with get_session() as session:
+        existing = session.get(SiteConfig, site_id)
+        if not existing:
+            return False
+        existing.name = name
+        existing.latitude = latitude
+        existing.longitude = longitude
+        existing.altitude_m = altitude_m
+        existing.timezone = timezone
+        existing.bortle = bortle
+        
+        if activate:
+             session.exec(update(SiteConfig).where(SiteConfig.id != site_id).values(is_active=False))
+             existing.is_active = True
+        
+        session.add(existing)
+        session.commit()
+    return True
 
 
 @router.post("/dashboard/observatory/{name}/refresh_horizon", response_class=HTMLResponse)
 async def observatory_refresh_horizon(request: Request, name: str) -> Any:
     """Trigger horizon refresh and return updated partial."""
-    from app.services.horizon import fetch_horizon_profile
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
     with get_session() as session:
         site = session.exec(select(SiteConfig).where(SiteConfig.name == name)).first()
         if site:
             logger.info("Refreshing horizon for site: %s", name)
             try:
                 profile = await fetch_horizon_profile(site.latitude, site.longitude)
-                site.horizon_mask_json = json.dumps(profile)
+                site.horizon_mask_json = orjson.dumps(profile).decode()
                 session.add(site)
                 session.commit()
             except Exception as exc:
@@ -380,30 +594,32 @@ async def observatory_refresh_horizon(request: Request, name: str) -> Any:
     return observatory_partial(request)
 
 
+# Map raw weather reasons to human-readable text
+_WEATHER_REASON_MAP = {
+    "weather_precip_chance": "High Rain Risk",
+    "weather_clouds": "Cloudy",
+    "weather_wind": "High Wind",
+    "weather_humidity": "High Humidity",
+    "weather_rain": "Raining",
+    "manual_override": "Manual Override",
+    "dome_closed": "Dome Closed",
+}
+
+
+def _round_opt(value: float | None, ndigits: int = 1) -> float | None:
+    return None if value is None else round(value, ndigits)
+
+
 def _format_weather_summary(summary: Any) -> dict[str, Any] | None:
     if not summary:
         return None
-    
-    # Map raw reasons to human-readable text
-    reason_map = {
-        "weather_precip_chance": "High Rain Risk",
-        "weather_clouds": "Cloudy",
-        "weather_wind": "High Wind",
-        "weather_humidity": "High Humidity",
-        "weather_rain": "Raining",
-        "manual_override": "Manual Override",
-        "dome_closed": "Dome Closed",
-    }
-    
-    reasons = [reason_map.get(r, r) for r in summary.reasons]
-    
     return {
-        "temperature_c": round(summary.temperature_c, 1) if summary.temperature_c is not None else None,
-        "wind_speed_mps": round(summary.wind_speed_mps, 1) if summary.wind_speed_mps is not None else None,
-        "cloud_cover_pct": round(summary.cloud_cover_pct, 0) if summary.cloud_cover_pct is not None else None,
-        "precipitation_probability_pct": round(summary.precipitation_probability_pct, 0) if summary.precipitation_probability_pct is not None else None,
+        "temperature_c": _round_opt(summary.temperature_c),
+        "wind_speed_mps": _round_opt(summary.wind_speed_mps),
+        "cloud_cover_pct": _round_opt(summary.cloud_cover_pct, 0),
+        "precipitation_probability_pct": _round_opt(summary.precipitation_probability_pct, 0),
         "is_safe": summary.is_safe,
-        "reasons": reasons,
+        "reasons": [_WEATHER_REASON_MAP.get(r, r) for r in summary.reasons],
         "fetched_at": summary.fetched_at,
     }
 
@@ -411,10 +627,10 @@ def _format_weather_summary(summary: Any) -> dict[str, Any] | None:
 @router.get("/dashboard/partials/equipment", response_class=HTMLResponse)
 def equipment_partial(request: Request, edit_profile_id: int | None = None) -> Any:
     """Render the equipment management panel."""
-    profiles = list_profiles()
-    
-    # Fetch site config for telescope details
+    # Fetch profiles, the active profile and site config for telescope details in one session
     with get_session() as session:
+        profiles = list_profiles(session)
+        active = get_active_equipment_profile(session)
         site_config = session.exec(select(SiteConfig).where(SiteConfig.name == settings.site_name)).first()
         
         # Determine which profile to load into the form
@@ -422,14 +638,8 @@ def equipment_partial(request: Request, edit_profile_id: int | None = None) -> A
         if edit_profile_id:
             form_profile = session.get(EquipmentProfileRecord, edit_profile_id)
             if form_profile:
-                # Parse JSON payload for template access
-                # The template expects an object with attributes, but payload_json is a string
-                # We need to attach the parsed payload to the object or return a dict
-                import json
-                payload = json.loads(form_profile.payload_json)
-                # Create a simple object wrapper or dict merge
-                # Let's just pass the payload dict, but we need 'name' from the record
-                form_profile_data = payload
+                # Copy the payload so adding 'name' does not dirty the JSONB column
+                form_profile_data = dict(form_profile.payload_json)
                 form_profile_data['name'] = form_profile.name
                 form_profile = form_profile_data
         else:
@@ -440,14 +650,13 @@ def equipment_partial(request: Request, edit_profile_id: int | None = None) -> A
             # But the user might want to see the active config.
             # Let's stick to: if edit_profile_id is passed, use that.
             # If not, use active profile (current behavior).
-            active = get_active_equipment_profile()
             form_profile = active
         
     return templates.TemplateResponse(
         "dashboard/partials/equipment.html",
         {
             "request": request, 
-            "profile": get_active_equipment_profile(), # Always show active at top
+            "profile": active, # Always show active at top
             "profiles": profiles,
             "site_config": site_config,
             "form_profile": form_profile # Profile to populate the form
@@ -455,22 +664,72 @@ def equipment_partial(request: Request, edit_profile_id: int | None = None) -> A
     )
 
 
+# Columns the capture listing templates actually render; kind/sequence/created_at stay unloaded.
+_CAPTURE_LISTING_COLUMNS = (
+    CaptureLog.id,
+    CaptureLog.target,
+    CaptureLog.index,
+    CaptureLog.path,
+    CaptureLog.started_at,
+)
+
+_TARGETS_CACHE: TTLCache = TTLCache(maxsize=8, ttl=15)
+_TARGETS_CACHE_LOCK = threading.Lock()
+
+
+def _targets_entry(limit: int) -> tuple[list[dict[str, Any]], frozenset[str]]:
+    """Return the cached ranked targets and their trksub set, querying on a miss."""
+    # select_target/set_target_mode/captures bump the version, so a hit costs no DB round trip
+    key = (limit, SESSION_STATE.targets_version)
+    with _TARGETS_CACHE_LOCK:
+        cached = _TARGETS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    results = _query_targets(limit)
+    entry = (results, frozenset(t["trksub"] for t in results))
+    with _TARGETS_CACHE_LOCK:
+        _TARGETS_CACHE[key] = entry
+    return entry
+
+
 def _load_targets(limit: int = 20) -> list[dict[str, Any]]:
+    """Return ranked targets, served from a short TTL cache between state changes."""
+    return list(_targets_entry(limit)[0])
+
+
+def _visible_trksubs(limit: int = 20) -> frozenset[str]:
+    """Return the trksubs currently shown in the target list, for O(1) membership checks."""
+    return _targets_entry(limit)[1]
+
+
+def _query_targets(limit: int) -> list[dict[str, Any]]:
+    snap = SESSION_STATE.snapshot
     imaged_targets = set()
-    if SESSION_STATE.current:
-        for cap in SESSION_STATE.current.captures:
+    if snap.current:
+        for cap in snap.current.captures:
             t = cap.get("target")
             if t:
                 imaged_targets.add(t)
 
     # Ensure the currently selected target is NOT filtered out, even if it has captures
-    current_target = SESSION_STATE.selected_target
+    current_target = snap.selected_target
     if current_target and current_target in imaged_targets:
         imaged_targets.remove(current_target)
 
     with get_session() as session:
         stmt = (
-            select(NeoObservability, NeoCandidate)
+            select(
+                NeoCandidate.trksub,
+                NeoObservability.score,
+                NeoObservability.is_observable,
+                NeoObservability.duration_minutes,
+                NeoObservability.window_start,
+                NeoObservability.window_end,
+                NeoObservability.max_altitude_deg,
+                NeoObservability.min_moon_separation_deg,
+                NeoCandidate.vmag,
+                NeoCandidate.id.label("candidate_id"),
+            )
             .join(NeoCandidate, NeoCandidate.id == NeoObservability.candidate_id)
             .order_by(NeoObservability.score.desc(), NeoCandidate.updated_at.desc())
             .limit(limit)
@@ -478,33 +737,21 @@ def _load_targets(limit: int = 20) -> list[dict[str, Any]]:
         rows = session.exec(stmt).all()
     total_rows = len(rows)
     
-    from datetime import datetime
     now = datetime.utcnow()
     
     results = []
-    for obs, cand in rows:
+    for row in rows:
         # Filter out imaged targets
-        if obs.trksub in imaged_targets:
+        if row.trksub in imaged_targets:
             continue
             
         # Filter out targets that have already set (window end in past),
         # UNLESS it is the currently selected target (we might be finishing a run)
-        if obs.window_end and obs.window_end <= now:
-             if obs.trksub != SESSION_STATE.selected_target:
+        if row.window_end and row.window_end <= now:
+             if row.trksub != current_target:
                  continue
 
-        results.append({
-            "trksub": obs.trksub,
-            "score": obs.score,
-            "is_observable": obs.is_observable,
-            "duration_minutes": obs.duration_minutes,
-            "window_start": obs.window_start,
-            "window_end": obs.window_end,
-            "max_altitude_deg": obs.max_altitude_deg,
-            "min_moon_separation_deg": obs.min_moon_separation_deg,
-            "vmag": cand.vmag,
-            "candidate_id": cand.id,
-        })
+        results.append(dict(row._mapping))
     if not results:
         logger.info(
             "Targets refresh: no candidates available (rows=%s, imaged_filtered=%s, time=%s)",
@@ -515,6 +762,19 @@ def _load_targets(limit: int = 20) -> list[dict[str, Any]]:
     return results
 
 
+def _combine_partials(main: HTMLResponse, *oob: HTMLResponse) -> HTMLResponse:
+    """Send a main partial followed by its OOB partials in one body.
+
+    The main partial's status and HTMX headers apply to the combined swap; OOB
+    partials place themselves, so their headers would only misdirect it.
+    """
+    body = bytearray(main.body)
+    for response in oob:
+        body += response.body
+    headers = {k: v for k, v in main.headers.items() if k not in ("content-length", "content-type")}
+    return HTMLResponse(bytes(body), status_code=main.status_code, headers=headers)
+
+
 @router.post("/dashboard/targets/refresh", response_class=HTMLResponse)
 async def targets_refresh(
     request: Request,
@@ -522,18 +782,11 @@ async def targets_refresh(
     end_time: str | None = Form(None)
 ) -> Any:
     """Refresh targets with optional custom time window."""
-    from app.services.observability import ObservabilityService
-    from datetime import datetime, timedelta, timezone, time as dt_time
-    import zoneinfo
     
     if start_time and end_time:
         try:
             # Get local timezone
-            tz_name = SESSION_STATE.timezone
-            try:
-                tz = zoneinfo.ZoneInfo(tz_name)
-            except Exception:
-                tz = timezone.utc
+            tz = _zone(SESSION_STATE.timezone)
 
             now_utc = datetime.now(timezone.utc)
             now_local = now_utc.astimezone(tz)
@@ -566,50 +819,44 @@ async def targets_refresh(
                 
             # Persist to session state for UI stability
             SESSION_STATE.set_window(start_time, end_time)
-            import logging
+            SESSION_STATE.bump_targets_version()
             logging.getLogger("uvicorn").info(f"Persisted window: {start_time} - {end_time} (Local: {start_local} -> {end_local})")
                 
         except ValueError as e:
-            import logging
             logging.getLogger("uvicorn").error(f"Window update failed: {e}")
             pass # Invalid format, ignore
             
     # Render main targets partial
-    targets_response = _render_targets_partial(request, start_time=start_time, end_time=end_time)
+    # Rendering queries the DB and runs Jinja; keep both off the event loop
+    targets_response = await run_in_threadpool(
+        _render_targets_partial, request, start_time=start_time, end_time=end_time
+    )
     
     # Render OOB status partial
-    status_response = _render_status_panel(request, oob=True)
-    
-    # Concatenate responses
-    combined_content = targets_response.body + status_response.body
+    status_response = await run_in_threadpool(_render_status_panel, request, oob=True)
     
-    import logging
     logging.getLogger("uvicorn").info("Targets refreshed. Returning OOB update for Overview.")
     
-    return HTMLResponse(content=combined_content)
+    return _combine_partials(targets_response, status_response)
 
 
 @router.post("/dashboard/targets/clear", response_class=HTMLResponse)
 async def targets_clear(request: Request) -> Any:
     """Clear all NEOCP data and re-fetch fresh targets."""
-    from sqlmodel import delete
 
     try:
         with get_session() as session:
             # Delete all NEOCP-related data in correct order (respecting foreign keys)
             logger.info("Clearing database: deleting NEOCP-related records")
 
-            # Delete dependent records first
-            session.exec(delete(Measurement))
-            session.exec(delete(AstrometricSolution))
-            session.exec(delete(CandidateAssociation))
-            session.exec(delete(SubmissionLog))
-            session.exec(delete(NeoObservability))
-            session.exec(delete(NeoEphemeris))
-            session.exec(delete(NeoCandidate))
+            # One TRUNCATE covers every table (including all FK dependents) in a single statement
+            tables = ", ".join(model.__table__.name for model in _NEOCP_CLEAR_MODELS)
+            session.exec(text(f"TRUNCATE TABLE {tables}"))
 
             session.commit()
             logger.info("Database cleared successfully")
+        summary_cache.invalidate("reports")
+        SESSION_STATE.bump_targets_version()
 
         # Re-fetch targets using the appropriate service
         # Check if we're in synthetic mode or using real NEOCP data
@@ -617,16 +864,15 @@ async def targets_clear(request: Request) -> Any:
 
         if settings.neocp_use_local_sample:
             # Use synthetic targets for testing
-            from app.services.synthetic_targets import SyntheticTargetService
             service = SyntheticTargetService()
             service.seed_targets()
             logger.info("Targets seeded successfully")
         else:
             # Fetch from real NEOCP feed
-            from app.services.neocp_fetcher import NeoCPFetcherService
             service = NeoCPFetcherService()
             service.run_cycle()
             logger.info("NEOCP targets fetched successfully")
+        SESSION_STATE.bump_targets_version()
 
         # Render targets partial with success message
         status_banner = {
@@ -642,15 +888,14 @@ async def targets_clear(request: Request) -> Any:
         }
 
     # Render main targets partial
-    targets_response = _render_targets_partial(request)
+    targets_response = await run_in_threadpool(_render_targets_partial, request)
 
     # Render OOB status partial with banner
-    status_response = _render_status_panel(request, status_banner=status_banner, oob=True)
-
-    # Concatenate responses
-    combined_content = targets_response.body + status_response.body
+    status_response = await run_in_threadpool(
+        _render_status_panel, request, status_banner=status_banner, oob=True
+    )
 
-    return HTMLResponse(content=combined_content)
+    return _combine_partials(targets_response, status_response)
 
 
 @router.get("/dashboard/partials/targets", response_class=HTMLResponse)
@@ -659,12 +904,25 @@ def targets_partial(request: Request) -> Any:
     return _render_targets_partial(request)
 
 
+_TZ_CACHE: dict[str, Any] = {}
+
+
+def _zone(tz_name: str) -> Any:
+    """Resolve a timezone name once; unknown names fall back to UTC."""
+    tz = _TZ_CACHE.get(tz_name)
+    if tz is None:
+        try:
+            tz = zoneinfo.ZoneInfo(tz_name)
+        except Exception:
+            tz = timezone.utc
+        tz = _TZ_CACHE.setdefault(tz_name, tz)
+    return tz
+
+
 def to_local_filter(value: Any, tz_name: str = "UTC") -> str:
     if not value:
         return ""
     
-    from datetime import datetime, timezone
-    import zoneinfo
     
     if isinstance(value, str):
         try:
@@ -675,12 +933,7 @@ def to_local_filter(value: Any, tz_name: str = "UTC") -> str:
     if not value.tzinfo:
         value = value.replace(tzinfo=timezone.utc)
         
-    try:
-        tz = zoneinfo.ZoneInfo(tz_name)
-    except Exception:
-        tz = timezone.utc
-        
-    local_dt = value.astimezone(tz)
+    local_dt = value.astimezone(_zone(tz_name))
     return local_dt.strftime("%H:%M")
 
 templates.env.filters["to_local"] = to_local_filter
@@ -697,28 +950,27 @@ def _render_targets_partial(
         targets = _load_targets()
     
     # Default times if not provided (e.g. current night window)
+    window_start = SESSION_STATE.window_start
+    window_end = SESSION_STATE.window_end
     if not start_time:
-        start_time = SESSION_STATE.window_start or "18:00"
+        start_time = window_start or "18:00"
     if not end_time:
-        end_time = SESSION_STATE.window_end or "06:00"
+        end_time = window_end or "06:00"
 
-    import logging
-    logging.getLogger("uvicorn").info(f"Rendering targets with window: {start_time} - {end_time} (Session: {SESSION_STATE.window_start}-{SESSION_STATE.window_end})")
+    logging.getLogger("uvicorn").info(f"Rendering targets with window: {start_time} - {end_time} (Session: {window_start}-{window_end})")
 
     active_preset = None
     active_target_data = None
     
     # Determine which target is "active" (manual selection or top auto pick)
-    if SESSION_STATE.target_mode == "manual" and SESSION_STATE.selected_target:
-        active_target_data = next((t for t in targets if t["trksub"] == SESSION_STATE.selected_target), None)
+    snap = SESSION_STATE.snapshot
+    if snap.target_mode == "manual" and snap.selected_target:
+        active_target_data = next((t for t in targets if t["trksub"] == snap.selected_target), None)
     elif targets:
         # Pick the first target that is actually observable
         active_target_data = next((t for t in targets if t["is_observable"]), None)
         
     if active_target_data:
-        from app.services.presets import select_preset
-        from app.services.equipment import get_active_equipment_profile
-        from app.services.motion import estimate_motion_rate_arcsec_per_min
 
         profile = get_active_equipment_profile()
         score = active_target_data.get("score")
@@ -744,69 +996,172 @@ def _render_targets_partial(
         {
             "request": request,
             "targets": targets,
-            "target_mode": SESSION_STATE.target_mode,
-            "selected_target": SESSION_STATE.selected_target,
+            "target_mode": snap.target_mode,
+            "selected_target": snap.selected_target,
             "active_preset": active_preset,
             "active_target": active_target_data,
             "error": error,
             "start_time": start_time,
             "end_time": end_time,
-            "timezone": SESSION_STATE.timezone,
+            "timezone": snap.timezone,
         },
     )
 
 
 def _bridge_is_ready(bundle: dict[str, Any]) -> bool:
-    ready_flags = bundle.get("bridge_ready") or {}
-    return bool(ready_flags) and ready_flags.get("ready_to_slew") and ready_flags.get("ready_to_expose")
+    ready = bundle.get("bridge_ready")
+    return bool(ready and ready.get("ready_to_slew") and ready.get("ready_to_expose"))
 
 
-def _generate_fits_preview(path: str) -> str:
+def _preview_url(capture_id: int, mtime: float, full: bool = False) -> str:
+    url = f"/dashboard/preview/{capture_id}?v={int(mtime)}"
+    return f"{url}&full=1" if full else url
+
+
+def _generate_fits_jpeg_bytes(path: str, max_dim: int | None = _PREVIEW_MAX_DIM) -> bytes:
+    """Return a ZScale-stretched JPEG preview of a FITS frame.
+
+    Encoded previews are cached in memory and under ``_PREVIEW_DIR``, keyed by path,
+    mtime, size and ``max_dim``; a rewritten frame gets a new key, so stale entries
+    are never hit.
+    """
     fits_path = Path(path)
-    if not fits_path.exists():
-        raise FileNotFoundError("Capture file missing.")
-    data = fits.getdata(fits_path)
-    if data is None:
-        raise ValueError("No data in FITS frame.")
-    if data.ndim > 2:
-        data = data[0]
+    try:
+        st = fits_path.stat()
+    except OSError:
+        raise FileNotFoundError("Capture file missing.") from None
+    key = hashlib.blake2b(
+        f"{fits_path}:{st.st_mtime_ns}:{st.st_size}:{max_dim}".encode(), digest_size=16
+    ).hexdigest()
+    with _PREVIEW_MEMORY_LOCK:
+        jpeg = _PREVIEW_MEMORY.get(key)
+        if jpeg is not None:
+            return jpeg
+        render_lock = _PREVIEW_RENDER_LOCKS.setdefault(key, threading.Lock())
+    try:
+        with render_lock:
+            # Whoever held the lock first may have produced it while we waited.
+            with _PREVIEW_MEMORY_LOCK:
+                jpeg = _PREVIEW_MEMORY.get(key)
+            if jpeg is not None:
+                return jpeg
+            cache_path = _PREVIEW_DIR / f"{key}.jpg"
+            try:
+                jpeg = cache_path.read_bytes()
+            except OSError:
+                jpeg = _render_fits_jpeg(fits_path, max_dim)
+                _write_preview(cache_path, jpeg)
+            with _PREVIEW_MEMORY_LOCK:
+                _PREVIEW_MEMORY[key] = jpeg
+            return jpeg
+    finally:
+        with _PREVIEW_MEMORY_LOCK:
+            _PREVIEW_RENDER_LOCKS.pop(key, None)
+
+
+def _write_preview(cache_path: Path, jpeg: bytes) -> None:
+    try:
+        _PREVIEW_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(jpeg)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.warning("Unable to cache preview %s: %s", cache_path.name, exc)
+
+
+def warm_templates() -> int:
+    """Compile every dashboard template into the Jinja cache; returns the number loaded."""
+    names = templates.env.list_templates(filter_func=lambda name: name.startswith("dashboard/"))
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
+
+
+def prune_preview_cache(max_age_s: float = _PREVIEW_DISK_MAX_AGE_S) -> int:
+    """Delete on-disk previews older than ``max_age_s``; returns the number removed."""
+    cutoff = datetime.now().timestamp() - max_age_s
+    removed = 0
+    for entry in _PREVIEW_DIR.glob("*"):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def _render_fits_jpeg(fits_path: Path, max_dim: int | None) -> bytes:
+    """Render a ZScale-stretched JPEG of a FITS frame.
+
+    Frames larger than ``max_dim`` on either axis are decimated by striding so the
+    stretch and JPEG encode only touch the pixels that will actually be displayed.
+    Pass ``max_dim=None`` when pixel coordinates in the preview must match the frame.
+    """
+    # Memory-map the file and pull only the first 2-D plane through ``.section``,
+    # so cubes and large frames are never decoded whole.
+    with fits.open(fits_path, memmap=True, ignore_missing_end=True) as hdul:
+        hdu = next((h for h in hdul if h.is_image and h.header.get("NAXIS", 0) >= 2), None)
+        if hdu is None:
+            raise ValueError("No data in FITS frame.")
+        plane = (0,) * (hdu.header["NAXIS"] - 2)
+        # Ceiling division so the decimated frame never exceeds max_dim on either axis
+        stride = max(1, -(-max(hdu.shape[-2:]) // max_dim)) if max_dim else 1
+        # Decimate rows in the section read so skipped rows never leave the disk;
+        # columns are strided in memory (a stepped last axis reads pixel by pixel).
+        rows = hdu.section[plane + (slice(None, None, stride), slice(None))]
+        data = np.asarray(rows[:, ::stride], dtype=np.float32)
     interval = ZScaleInterval()
     vmin, vmax = interval.get_limits(data)
     if not np.isfinite(vmin) or not np.isfinite(vmax) or vmax <= vmin:
         vmin, vmax = np.nanmin(data), np.nanmax(data)
         if not np.isfinite(vmin) or not np.isfinite(vmax) or vmax <= vmin:
             raise ValueError("Unable to scale FITS data.")
-    clipped = np.clip(data, vmin, vmax)
-    norm = (clipped - vmin) / (vmax - vmin)
-    image_array = (norm * 255).astype(np.uint8)
-    img = Image.fromarray(image_array)
+    # One scratch buffer for the whole stretch; ``data`` may be a read-only view of the frame.
+    buf = np.empty(data.shape, dtype=np.float32)
+    np.subtract(data, np.float32(vmin), out=buf)
+    np.multiply(buf, np.float32(255.0 / (vmax - vmin)), out=buf)
+    np.clip(buf, 0, 255, out=buf)
+    img = Image.fromarray(buf.astype(np.uint8), mode="L")
     buffer = BytesIO()
-    img.save(buffer, format="PNG")
-    return base64.b64encode(buffer.getvalue()).decode("ascii")
+    img.save(buffer, format="JPEG", quality=_PREVIEW_JPEG_QUALITY)
+    return buffer.getvalue()
 
 
 @router.get("/dashboard/partials/reports", response_class=HTMLResponse)
-def reports_partial(request: Request) -> Any:
+async def reports_partial(request: Request) -> Any:
     """Render submission log for the Reports tab."""
-    with get_session() as session:
-        stmt = select(SubmissionLog).order_by(SubmissionLog.created_at.desc()).limit(15)
-        submissions = session.exec(stmt).all()
-    return templates.TemplateResponse(
+    key = summary_cache.cache_key("reports", request.query_params)
+    context = summary_cache.lookup(key)
+    if context is None:
+        context = await _warm_reports_context(key)
+    return _render_partial(
         "dashboard/partials/reports.html",
-        {"request": request, "submissions": submissions, "timezone": SESSION_STATE.timezone},
+        {**context},
     )
 
 
+async def _warm_reports_context(key: str) -> dict[str, Any]:
+    """Query the Reports submission log context and store it under ``key``."""
+    async with get_async_session() as session:
+        submissions = await _recent_submissions(session, _RECENT_SUBMISSIONS_MAX)
+        tz_name = await _active_timezone(session)
+    context = {"submissions": submissions, "timezone": tz_name}
+    summary_cache.store(key, context)
+    return context
+
+
 @router.get("/dashboard/partials/session_status", response_class=HTMLResponse)
 def session_status_partial_panel(request: Request) -> Any:
     """Render session status for the exposures tab."""
+    snap = SESSION_STATE.snapshot
     session_info = {"active": False}
-    if SESSION_STATE.current:
-        session_info = SESSION_STATE.current.to_dict()
+    if snap.current:
+        session_info = snap.current.to_dict()
         session_info["active"] = True
-    return templates.TemplateResponse(
+    return _render_partial(
         "dashboard/partials/session_status.html",
-        {"request": request, "session": session_info, "timezone": SESSION_STATE.timezone},
+        {"session": session_info, "timezone": snap.timezone},
     )
 
 
@@ -829,62 +1184,47 @@ def association_partial(request: Request, error: str | None = None) -> Any:
             selected_target = targets[0]["name"]
             
         captures = []
-        associations = {}
+        # Keyed by path for the template
+        associations_by_path: dict[str, CandidateAssociation] = {}
         predicted = {}
         
         if selected_target:
-            # Load captures for the selected target
-            capture_rows = session.exec(
-                select(CaptureLog).where(CaptureLog.target == selected_target).order_by(CaptureLog.started_at.desc())
+            # Captures, their associations and the nearest ephemeris point (within 5 minutes)
+            # in one round trip; the LATERAL subquery is an index range scan per capture.
+            window = timedelta(minutes=5)
+            nearest_eph = (
+                select(NeoEphemeris.ra_deg, NeoEphemeris.dec_deg)
+                .join(NeoCandidate, NeoCandidate.id == NeoEphemeris.candidate_id)
+                .where(
+                    NeoCandidate.trksub == selected_target,
+                    NeoEphemeris.epoch > CaptureLog.started_at - window,
+                    NeoEphemeris.epoch < CaptureLog.started_at + window,
+                )
+                .order_by(
+                    func.abs(func.extract("epoch", NeoEphemeris.epoch - CaptureLog.started_at)),
+                    NeoEphemeris.epoch,
+                )
+                .limit(1)
+                .lateral("nearest_eph")
+            )
+            rows = session.exec(
+                select(CaptureLog, CandidateAssociation, nearest_eph.c.ra_deg, nearest_eph.c.dec_deg)
+                .outerjoin(CandidateAssociation, CandidateAssociation.capture_id == CaptureLog.id)
+                .outerjoin(nearest_eph, true())
+                .options(load_only(*_CAPTURE_LISTING_COLUMNS))
+                .where(CaptureLog.target == selected_target)
+                .order_by(CaptureLog.started_at.desc(), CaptureLog.id, CandidateAssociation.id)
             ).all()
-            captures = list(capture_rows)
-            capture_ids = [c.id for c in captures if c.id]
-            
-            if capture_ids:
-                # Load existing manual associations
-                assoc_rows = session.exec(
-                    select(CandidateAssociation).where(CandidateAssociation.capture_id.in_(capture_ids))
-                ).all()
-                associations = {row.capture_id: row for row in assoc_rows}
-                
-                # Load predictions (ephemeris) - simplified logic: find nearest ephemeris
-                # Ideally we'd interpolate, but for now we'll just look for a close match if we have the candidate
-                candidate = session.exec(select(NeoCandidate).where(NeoCandidate.trksub == selected_target)).first()
-                if candidate:
-                    # Fetch ephemeris for the time range of captures
-                    min_time = min(c.started_at for c in captures)
-                    max_time = max(c.started_at for c in captures)
-                    # Pad the range slightly
-                    eph_rows = session.exec(
-                        select(NeoEphemeris)
-                        .where(
-                            NeoEphemeris.candidate_id == candidate.id,
-                            NeoEphemeris.epoch >= min_time,
-                            NeoEphemeris.epoch <= max_time
-                        )
-                    ).all()
-                    
-                    # Map each capture to the nearest ephemeris point (simple approach)
-                    for cap in captures:
-                        best_eph = None
-                        min_diff = float("inf")
-                        for eph in eph_rows:
-                            diff = abs((eph.epoch - cap.started_at).total_seconds())
-                            if diff < min_diff:
-                                min_diff = diff
-                                best_eph = eph
-                        
-                        if best_eph and min_diff < 300: # Within 5 minutes
-                             predicted[cap.path] = {"ra_deg": best_eph.ra_deg, "dec_deg": best_eph.dec_deg}
-                             # Also map by ID for template convenience if needed, but template uses path currently
-                             # We might need to adjust template to use ID or keep using path as key
+            seen: set[int] = set()
+            for cap, assoc, eph_ra, eph_dec in rows:
+                if cap.id not in seen:
+                    seen.add(cap.id)
+                    captures.append(cap)
+                    if eph_ra is not None:
+                        predicted[cap.path] = {"ra_deg": eph_ra, "dec_deg": eph_dec}
+                if assoc is not None:
+                    associations_by_path[cap.path] = assoc
                              
-    # Transform associations to map by path for the template compatibility
-    associations_by_path = {}
-    for cap in captures:
-        if cap.id in associations:
-            associations_by_path[cap.path] = associations[cap.id]
-
     return templates.TemplateResponse(
         "dashboard/partials/association.html",
         {
@@ -917,7 +1257,7 @@ async def association_manual(request: Request) -> Any:
             
             with get_session() as session:
                 # Find the capture log entry
-                capture = session.exec(select(CaptureLog).where(CaptureLog.path == path)).first()
+                capture = session.exec(_CAPTURE_BY_PATH_STMT, params={"path": path}).first()
                 if capture and capture.id:
                     # Check for existing association
                     existing = session.exec(
@@ -950,7 +1290,6 @@ async def association_manual(request: Request) -> Any:
                         session.add(measurement)
                     else:
                         # Create new measurement if missing (self-healing)
-                        from app.models import Measurement
                         measurement = Measurement(
                             capture_id=capture.id,
                             target=capture.target or "unknown",
@@ -978,55 +1317,59 @@ async def association_manual(request: Request) -> Any:
     return association_partial(request, error=error)
 
 
+@lru_cache(maxsize=128)
+def _wcs_for(path: str, mtime_ns: int) -> WCS:
+    """Build a WCS from a solver sidecar or FITS primary header; mtime keys out stale entries."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        if path.endswith(".wcs"):
+            return WCS(path)
+        return WCS(fits.getheader(path, 0, memmap=True))
+
+
 @router.post("/dashboard/analysis/project")
 async def analysis_project(request: Request) -> Any:
-    """Project RA/Dec to pixel coordinates for a given capture."""
+    """Project RA/Dec to pixel coordinates for a given capture.
+
+    ``ra_deg``/``dec_deg`` may be repeated to project a batch of points in one
+    WCS call; a single pair also gets top-level ``x``/``y`` for older callers.
+    """
     form = await request.form()
     path = form.get("path")
-    ra = form.get("ra_deg")
-    dec = form.get("dec_deg")
+    ras = form.getlist("ra_deg")
+    decs = form.getlist("dec_deg")
     
-    if not path or not ra or not dec:
-        return JSONResponse({"error": "Missing parameters"}, status_code=400)
+    if not path or not ras or not decs or len(ras) != len(decs):
+        return ORJSONResponse({"error": "Missing parameters"}, status_code=400)
         
     try:
-        ra_f = float(ra)
-        dec_f = float(dec)
-        
-        # Load WCS
-        from astropy.wcs import WCS
-        from astropy.io import fits
-        import warnings
+        ra_arr = np.asarray(ras, dtype=float)
+        dec_arr = np.asarray(decs, dtype=float)
         
-        with fits.open(path) as hdul:
-            header = hdul[0].header
-            
+        # Load WCS: prefer the solver sidecar, else parse only the primary header
         wcs_path = Path(path).with_suffix(".wcs")
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            if wcs_path.exists():
-                wcs = WCS(str(wcs_path))
-            else:
-                wcs = WCS(header)
+        source = wcs_path if wcs_path.exists() else Path(path)
+        wcs = _wcs_for(str(source), source.stat().st_mtime_ns)
                 
-        # Convert to pixels
-        x, y = wcs.all_world2pix(ra_f, dec_f, 1) # 1-based origin for FITS, but we might need 0-based for canvas?
-        # Astropy returns 0-based if origin=0. Let's use 0-based for canvas.
-        x, y = wcs.all_world2pix(ra_f, dec_f, 0)
-        
-        return JSONResponse({"x": float(x), "y": float(y)})
+        # Convert to pixels; origin=0 gives 0-based coordinates for the canvas
+        xs, ys = wcs.all_world2pix(ra_arr, dec_arr, 0)
+        points = [{"x": float(x), "y": float(y)} for x, y in zip(xs, ys)]
+        payload: dict[str, Any] = {"points": points}
+        if len(points) == 1:
+            payload.update(points[0])
+        return ORJSONResponse(payload)
         
     except Exception as e:
         logging.error(f"Projection error: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 
 @router.post("/dashboard/analysis/resolve_click")
 async def analysis_resolve_click(request: Request) -> Any:
     """Resolve a click on an image to a precise centroid and RA/Dec."""
     try:
-        data = await request.json()
-    except json.JSONDecodeError:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
         return {"error": "Invalid JSON"}
         
     path = data.get("path")
@@ -1038,11 +1381,10 @@ async def analysis_resolve_click(request: Request) -> Any:
         return {"error": "Missing path, x/y, or polygon"}
         
     with get_session() as session:
-        capture = session.exec(select(CaptureLog).where(CaptureLog.path == path)).first()
+        capture = session.exec(_CAPTURE_BY_PATH_STMT, params={"path": path}).first()
         if not capture:
             return {"error": "Capture not found"}
             
-        from app.services.analysis import AnalysisService
         svc = AnalysisService(session)
         
         x_val = float(click_x) if click_x is not None else None
@@ -1060,18 +1402,30 @@ def masters_partial(request: Request) -> Any:
     """Render master calibration upload/selection pane."""
     master_root = Path("/data/masters")
     types = ["bias", "dark", "flat"]
-    existing: dict[str, list[str]] = {}
-    for t in types:
-        paths = []
-        for p in (master_root / t).glob("*"):
-            if p.is_file():
-                paths.append(str(p))
-        existing[t] = sorted(paths)
     selected = SESSION_STATE.master_calibrations if SESSION_STATE else {}
-    return templates.TemplateResponse(
-        "dashboard/partials/masters.html",
-        {"request": request, "existing": existing, "selected": selected},
+    # Adding or removing a master bumps its directory mtime, which changes the key
+    key = summary_cache.cache_key(
+        "masters",
+        {
+            "mtimes": [_file_mtime(str(master_root / t)) for t in types],
+            "selected": sorted(selected.items()),
+        },
     )
+    body = summary_cache.lookup(key)
+    if body is None:
+        existing: dict[str, list[str]] = {}
+        for t in types:
+            # DirEntry.is_file() answers from d_type, so listing needs no per-file stat
+            try:
+                with os.scandir(master_root / t) as it:
+                    existing[t] = sorted(e.path for e in it if e.is_file())
+            except FileNotFoundError:
+                existing[t] = []
+        body = templates.get_template("dashboard/partials/masters.html").render(
+            existing=existing, selected=selected
+        )
+        summary_cache.store(key, body, ttl=300)
+    return HTMLResponse(content=body)
 
 
 @router.post("/dashboard/masters/upload", response_class=HTMLResponse)
@@ -1084,8 +1438,10 @@ async def masters_upload(request: Request) -> Any:
     master_root = Path("/data/masters") / cal_type
     master_root.mkdir(parents=True, exist_ok=True)
     dest = master_root / (file.filename or f"{cal_type}.fits")
-    content = await file.read()
-    dest.write_bytes(content)
+    # Copy the spooled upload in 1 MiB chunks off the event loop rather than buffering it whole
+    await file.seek(0)
+    with dest.open("wb") as out:
+        await run_in_threadpool(shutil.copyfileobj, file.file, out, 1 << 20)
     SESSION_STATE.set_master(cal_type, str(dest))
     return masters_partial(request)
 
@@ -1105,20 +1461,18 @@ def night_start(request: Request) -> Any:
     """Convenience button on Live tab to kick off nightly session prep."""
     bundle = session_dashboard_status()
     if not _bridge_is_ready(bundle):
-        return _render_status_panel(
+        return _render_status_banner(
             request,
-            status_banner={
+            {
                 "kind": "warn",
                 "text": "Bridge is not ready to image (check connections, blockers, or manual override).",
             },
             status_code=400,
-            bundle=bundle,
         )
     if SESSION_STATE.current:
-        return _render_status_panel(
+        return _render_status_banner(
             request,
-            status_banner={"kind": "info", "text": "Session already running. Use Pause or End to change state."},
-            bundle=bundle,
+            {"kind": "info", "text": "Session already running. Use Pause or End to change state."},
         )
     SESSION_STATE.start(notes="night-start")
     try:
@@ -1140,9 +1494,9 @@ def night_start(request: Request) -> Any:
 def night_pause(request: Request) -> Any:
     """Toggle pause/resume state for the current session."""
     if not SESSION_STATE.current:
-        return _render_status_panel(
+        return _render_status_banner(
             request,
-            status_banner={"kind": "warn", "text": "No active session to pause."},
+            {"kind": "warn", "text": "No active session to pause."},
             status_code=400,
         )
     if SESSION_STATE.current.paused:
@@ -1158,9 +1512,9 @@ def night_pause(request: Request) -> Any:
 def night_end(request: Request) -> Any:
     """End the current session."""
     if not SESSION_STATE.current:
-        return _render_status_panel(
+        return _render_status_banner(
             request,
-            status_banner={"kind": "warn", "text": "No active session to end."},
+            {"kind": "warn", "text": "No active session to end."},
             status_code=400,
         )
     SESSION_STATE.end()
@@ -1176,49 +1530,84 @@ async def capture_delete(request: Request) -> Any:
     form = await request.form()
     path = form.get("path")
     if not path:
-        return templates.TemplateResponse(
+        return _render_partial(
             "dashboard/partials/captures.html",
-            {"request": request, "captures": SESSION_STATE.current.captures if SESSION_STATE.current else []},
+            {"captures": SESSION_STATE.current.captures if SESSION_STATE.current else []},
             status_code=400,
         )
-    # Remove from DB and solutions
+    # Remove from DB and solutions in one statement: the capture DELETE ... RETURNING feeds
+    # the solution and association deletes through CTEs (FKs are checked at statement end)
+    deleted = CaptureLog.__table__.delete().where(CaptureLog.path == path).returning(CaptureLog.id).cte("deleted")
+    solutions = (
+        AstrometricSolution.__table__.delete()
+        .where(AstrometricSolution.capture_id.in_(select(deleted.c.id)))
+        .cte("solutions")
+    )
     with get_session() as session:
-        rows = session.exec(select(CaptureLog).where(CaptureLog.path == path)).all()
-        capture_ids = [row.id for row in rows if row.id]
-        if capture_ids:
-            session.exec(select(AstrometricSolution).where(AstrometricSolution.capture_id.in_(capture_ids))).all()
-            session.exec(AstrometricSolution.__table__.delete().where(AstrometricSolution.capture_id.in_(capture_ids)))
-            session.exec(CandidateAssociation.__table__.delete().where(CandidateAssociation.capture_id.in_(capture_ids)))
-        session.exec(CaptureLog.__table__.delete().where(CaptureLog.path == path))
+        session.exec(
+            CandidateAssociation.__table__.delete()
+            .where(CandidateAssociation.capture_id.in_(select(deleted.c.id)))
+            .add_cte(solutions)
+        )
         session.commit()
-    # Remove file on disk
+    # Remove file on disk once the rows are gone
     try:
         fits_path = Path(path)
         if fits_path.exists():
             fits_path.unlink()
     except Exception:
         pass
-    # Remove from in-memory session captures
-    if SESSION_STATE.current:
-        SESSION_STATE.current.captures = [c for c in SESSION_STATE.current.captures if c.get("path") != path]
-    captures = SESSION_STATE.current.captures if SESSION_STATE.current else []
-    return templates.TemplateResponse(
+    # Remove from the session's capture list in place; the remainder is what we render
+    captures = SESSION_STATE.remove_capture(path)
+    return _render_partial(
         "dashboard/partials/captures.html",
-        {"request": request, "captures": captures},
+        {"captures": captures},
+    )
+
+@router.get("/dashboard/preview/{capture_id}")
+def capture_preview(capture_id: int, full: bool = False) -> Response:
+    """Serve the JPEG preview of a logged capture."""
+    with get_session() as session:
+        path = session.exec(select(CaptureLog.path).where(CaptureLog.id == capture_id)).first()
+    if path is None:
+        return Response(status_code=404)
+    try:
+        content = _generate_fits_jpeg_bytes(path, max_dim=None if full else _PREVIEW_MAX_DIM)
+    except FileNotFoundError:
+        return Response(status_code=404)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Unable to render FITS preview for %s: %s", path, exc)
+        return Response(status_code=422)
+    return Response(
+        content=content,
+        media_type="image/jpeg",
+        headers={"Cache-Control": _PREVIEW_IMAGE_CACHE_CONTROL},
     )
 
+
 @router.get("/dashboard/partials/capture_viewer", response_class=HTMLResponse)
 def capture_viewer_partial(request: Request, path: str | None = None, target: str | None = None, index: str | None = None, started_at: str | None = None) -> Any:
     """Render a lightweight FITS preview for the selected capture."""
     preview = None
     error = None
+    etag = None
     meta = {"target": target, "index": index, "started_at": started_at, "path": path}
     if path:
-        try:
-            preview = _generate_fits_preview(path)
-        except Exception as exc:  # noqa: BLE001
-            error = f"Unable to render FITS preview: {exc}"
-    return templates.TemplateResponse(
+        mtime = _file_mtime(path)
+        if mtime is None:
+            error = "Unable to render FITS preview: Capture file missing."
+        else:
+            etag = _etag_for(path, mtime, target, index, started_at)
+            if _etag_matches(request, etag):
+                return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _PREVIEW_CACHE_CONTROL})
+            with get_session() as session:
+                capture_id = session.exec(select(CaptureLog.id).where(CaptureLog.path == path)).first()
+            if capture_id is None:
+                error = "Unable to render FITS preview: capture is not in the capture log."
+                etag = None
+            else:
+                preview = _preview_url(capture_id, mtime)
+    response = templates.TemplateResponse(
         "dashboard/partials/capture_viewer.html",
         {
             "request": request,
@@ -1227,6 +1616,10 @@ def capture_viewer_partial(request: Request, path: str | None = None, target: st
             "meta": meta,
         },
     )
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = _PREVIEW_CACHE_CONTROL
+    return response
 
 
 @router.get("/dashboard/partials/review_modal", response_class=HTMLResponse)
@@ -1237,40 +1630,40 @@ def review_modal_partial(request: Request, path: str) -> Any:
     meta = {"path": path}
     
     # Navigation logic
-    prev_capture = None
-    next_capture = None
+    prev_path = None
+    next_path = None
     current_index = 0
     total_count = 0
     existing_association = None
     
     with get_session() as session:
         # Find current capture
-        current = session.exec(select(CaptureLog).where(CaptureLog.path == path)).first()
+        current = session.exec(
+            select(CaptureLog).options(load_only(CaptureLog.id, CaptureLog.target)).where(CaptureLog.path == path)
+        ).first()
         if current:
             if current.target:
                 meta["target"] = current.target
-                # Find siblings
-                siblings = session.exec(
-                    select(CaptureLog)
+                # Neighbours, position and sibling count in one windowed row for this capture
+                order = (CaptureLog.started_at, CaptureLog.id)
+                ranked = (
+                    select(
+                        CaptureLog.id.label("id"),
+                        func.lag(CaptureLog.path).over(order_by=order).label("prev_path"),
+                        func.lead(CaptureLog.path).over(order_by=order).label("next_path"),
+                        func.row_number().over(order_by=order).label("position"),
+                        func.count().over().label("total"),
+                    )
                     .where(CaptureLog.target == current.target)
-                    .order_by(CaptureLog.started_at)
-                ).all()
-                
-                total_count = len(siblings)
-                try:
-                    # Find index of current capture
-                    # Use ID if available, else path
-                    if current.id:
-                        current_index = next(i for i, c in enumerate(siblings) if c.id == current.id)
-                    else:
-                        current_index = next(i for i, c in enumerate(siblings) if c.path == path)
-                        
-                    if current_index > 0:
-                        prev_capture = siblings[current_index - 1]
-                    if current_index < total_count - 1:
-                        next_capture = siblings[current_index + 1]
-                except StopIteration:
-                    pass
+                    .subquery()
+                )
+                nav = session.exec(
+                    select(ranked.c.prev_path, ranked.c.next_path, ranked.c.position, ranked.c.total)
+                    .where(ranked.c.id == current.id)
+                ).first()
+                if nav:
+                    prev_path, next_path, position, total_count = nav
+                    current_index = position - 1
             
             # Check for existing association
             if current.id:
@@ -1278,12 +1671,35 @@ def review_modal_partial(request: Request, path: str) -> Any:
                     select(CandidateAssociation).where(CandidateAssociation.capture_id == current.id)
                 ).first()
 
-    try:
-        preview = _generate_fits_preview(path)
-    except Exception as exc:
-        error = f"Unable to render FITS preview: {exc}"
-        
-    return templates.TemplateResponse(
+    # Navigation and association state are part of the markup, so they feed the ETag
+    # alongside the file mtime; a hit skips FITS decoding and rendering entirely.
+    etag = None
+    mtime = _file_mtime(path)
+    if mtime is not None:
+        etag = _etag_for(
+            path,
+            mtime,
+            prev_path,
+            next_path,
+            current_index,
+            total_count,
+            existing_association.id if existing_association else None,
+            existing_association.ra_deg if existing_association else None,
+            existing_association.dec_deg if existing_association else None,
+        )
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _PREVIEW_CACHE_CONTROL})
+
+    if mtime is None:
+        error = "Unable to render FITS preview: Capture file missing."
+    elif current is None or current.id is None:
+        error = "Unable to render FITS preview: capture is not in the capture log."
+        etag = None
+    else:
+        # Full resolution: the modal maps clicks on the image back to frame pixels.
+        preview = _preview_url(current.id, mtime, full=True)
+
+    response = templates.TemplateResponse(
         "dashboard/partials/review_modal.html",
         {
             "request": request,
@@ -1291,14 +1707,18 @@ def review_modal_partial(request: Request, path: str) -> Any:
             "error": error,
             "meta": meta,
             "navigation": {
-                "prev": prev_capture.path if prev_capture else None,
-                "next": next_capture.path if next_capture else None,
+                "prev": prev_path,
+                "next": next_path,
                 "current": current_index + 1,
                 "total": total_count
             },
             "association": existing_association,
         },
     )
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = _PREVIEW_CACHE_CONTROL
+    return response
 @router.post("/dashboard/targets/mode", response_class=HTMLResponse)
 async def targets_mode(request: Request) -> Any:
     """Toggle between auto and manual target selection."""
@@ -1309,7 +1729,7 @@ async def targets_mode(request: Request) -> Any:
         SESSION_STATE.set_target_mode(mode)
     except ValueError:
         error = "Unsupported mode."
-    return _render_targets_partial(request, error=error)
+    return await run_in_threadpool(_render_targets_partial, request, error=error)
 
 
 @router.post("/dashboard/targets/select", response_class=HTMLResponse)
@@ -1317,109 +1737,30 @@ async def targets_select(request: Request) -> Any:
     """Select a specific target for manual mode."""
     form = await request.form()
     trksub = (form.get("trksub") or "").strip()
-    error = None
-    targets = _load_targets()
-    if not trksub:
-        error = "Choose a target to select."
-    elif not any(t["trksub"] == trksub for t in targets):
-        error = "Target is no longer in the visible list."
-    else:
-        SESSION_STATE.select_target(trksub)
-    return _render_targets_partial(request, targets=targets, error=error)
-
-
-@router.post("/dashboard/observatory/save", response_class=HTMLResponse)
-async def observatory_save(request: Request) -> Any:
-    """Persist observatory settings from the dashboard form."""
-    form = await request.form()
-    with get_session() as session:
-        existing = session.exec(select(SiteConfig).where(SiteConfig.name == settings.site_name)).first()
-    horizon_mask_json = form.get("horizon_mask_json") or None
-    parsed_horizon = None
-    error = None
-    if horizon_mask_json:
-        import json
+    error = await run_in_threadpool(_select_visible_target, trksub)
+    return await run_in_threadpool(_render_targets_partial, request, error=error)
 
-        try:
-            parsed = json.loads(horizon_mask_json)
-
-            # Validate PVGIS format (preferred)
-            if isinstance(parsed, dict) and "outputs" in parsed:
-                horizon_profile = parsed.get("outputs", {}).get("horizon_profile", [])
-                if not isinstance(horizon_profile, list):
-                    raise ValueError("PVGIS format requires outputs.horizon_profile to be a list")
-                if horizon_profile and not all(
-                    isinstance(p, dict) and "A" in p and "H_hor" in p for p in horizon_profile
-                ):
-                    raise ValueError("PVGIS horizon_profile entries must have 'A' and 'H_hor' keys")
-                parsed_horizon = horizon_mask_json
-
-            # Validate simple format (legacy)
-            elif isinstance(parsed, list):
-                if any(
-                    not isinstance(p, dict) or "az_deg" not in p or "alt_deg" not in p for p in parsed
-                ):
-                    raise ValueError("Simple format requires a list of objects with az_deg and alt_deg")
-                parsed_horizon = horizon_mask_json
 
-            else:
-                raise ValueError(
-                    "Expected either PVGIS format (object with outputs.horizon_profile) "
-                    "or simple format (list of {az_deg, alt_deg})"
-                )
-        except Exception as exc:  # noqa: BLE001
-            error = f"Horizon mask JSON invalid: {exc}"
-
-    horizon_mask_path = None
-    if form.get("horizon_mask_path"):
-        horizon_mask_path = form.get("horizon_mask_path")
-    elif existing:
-        horizon_mask_path = existing.horizon_mask_path
-
-    payload = {
-        "name": settings.site_name,
-        "latitude": float(form.get("latitude") or 0.0),
-        "longitude": float(form.get("longitude") or 0.0),
-        "altitude_m": float(form.get("altitude_m") or 0.0),
-        "bortle": int(form.get("bortle")) if form.get("bortle") else None,
-        "horizon_mask_path": horizon_mask_path,
-        "horizon_mask_json": parsed_horizon,
-        "weather_sensors": form.get("weather_sensors") or None,
-    }
-    if error:
-        return templates.TemplateResponse(
-            "dashboard/partials/observatory.html",
-            {"request": request, "site": existing, "error": error},
-        )
-    with get_session() as session:
-        record = existing
-        if record:
-            for k, v in payload.items():
-                setattr(record, k, v)
-            session.add(record)
-            session.commit()
-            session.refresh(record)
-        else:
-            record = SiteConfig(**payload)
-            session.add(record)
-            session.commit()
-            session.refresh(record)
-    return templates.TemplateResponse(
-        "dashboard/partials/observatory.html",
-        {"request": request, "site": record, "saved": True},
-    )
+def _select_visible_target(trksub: str) -> str | None:
+    """Select ``trksub`` if it is in the visible list; returns an error message otherwise."""
+    if not trksub:
+        return "Choose a target to select."
+    if trksub not in _visible_trksubs():
+        return "Target is no longer in the visible list."
+    SESSION_STATE.select_target(trksub)
+    return None
 
 
 def _parse_list_csv(value: str | None) -> list[str]:
     if not value:
         return []
-    return [item.strip() for item in value.split(",") if item.strip()]
+    # Strip each item once; inner spaces are kept so names like "OIII 3nm" survive
+    return [stripped for item in value.split(",") if (stripped := item.strip())]
 
 
 @router.post("/dashboard/equipment/delete", response_class=HTMLResponse)
 def equipment_delete(request: Request, profile_id: int = Form(...)) -> Any:
     """Delete an equipment profile."""
-    from app.services.equipment import delete_profile
     with get_session() as session:
         delete_profile(session, profile_id)
     return equipment_partial(request)
@@ -1435,7 +1776,7 @@ async def equipment_save(request: Request) -> Any:
     # Camera
     camera_type = form.get("camera_type", "mono")
     camera_filters_str = form.get("camera_filters", "")
-    camera_filters = [f.strip() for f in camera_filters_str.split(",") if f.strip()]
+    camera_filters = _parse_list_csv(camera_filters_str)
     
     # Mount
     mount_parking = form.get("mount_supports_parking") == "on"
@@ -1445,14 +1786,6 @@ async def equipment_save(request: Request) -> Any:
     telescope_aperture = float(form.get("telescope_aperture", 0.0)) / 1000.0 # mm to m
     telescope_detector = form.get("telescope_detector", "CCD")
     
-    from app.services.equipment import (
-        EquipmentProfileSpec, 
-        CameraCapabilities, 
-        MountCapabilities,
-        TelescopeCapabilities,
-        save_profile
-    )
-    
     payload = EquipmentProfileSpec(
         camera=CameraCapabilities(
             type=camera_type,
@@ -1469,9 +1802,9 @@ async def equipment_save(request: Request) -> Any:
     
     # Save
     activate = form.get("activate") == "on"
-    save_profile(name, payload, activate=activate)
+    await run_in_threadpool(save_profile, name, payload, activate=activate)
     
-    return equipment_partial(request)
+    return await run_in_threadpool(equipment_partial, request)
 
 
 
@@ -1480,6 +1813,10 @@ async def equipment_activate(request: Request) -> Any:
     """Activate a saved profile from the dashboard."""
     form = await request.form()
     profile_id = int(form.get("profile_id"))
+    return await run_in_threadpool(_activate_equipment_profile, request, profile_id)
+
+
+def _activate_equipment_profile(request: Request, profile_id: int) -> Any:
     activate_profile(profile_id)
     profiles = list_profiles()
     return templates.TemplateResponse(
@@ -1489,49 +1826,71 @@ async def equipment_activate(request: Request) -> Any:
 
 
 @router.get("/dashboard/partials/reports_tab", response_class=HTMLResponse)
-async def reports_tab(request: Request) -> Any:
+def reports_tab(request: Request) -> Any:
     """Render the reports tab content."""
     with get_session() as session:
-        # Fetch pending measurements (reviewed=True)
-        measurements = session.exec(
-            select(Measurement).where(Measurement.reviewed == True).order_by(Measurement.target, Measurement.obs_time)
-        ).all()
-        
-        # Group by target
-        grouped = {}
-        for m in measurements:
-            if m.target not in grouped:
-                grouped[m.target] = []
-            grouped[m.target].append(m)
-            
-        pending_targets = []
-        for target, ms in grouped.items():
-            if not ms:
-                continue
-            # Calculate span
-            times = [m.obs_time for m in ms]
-            span_str = f"{min(times).strftime('%H:%M')} - {max(times).strftime('%H:%M')}"
-            pending_targets.append({
-                "name": target,
-                "count": len(ms),
-                "span": span_str
-            })
-            
-        # Fetch submission history
-        submissions = session.exec(
-            select(SubmissionLog).order_by(SubmissionLog.created_at.desc()).limit(10)
-        ).all()
+        reviewed_latest, submitted_latest, etag = _reports_tab_fingerprint(session)
+        stamps = [ts for ts in (reviewed_latest, submitted_latest) if ts]
+        headers = {"ETag": etag, "Cache-Control": _REPORTS_CACHE_CONTROL}
+        if stamps:
+            headers["Last-Modified"] = format_datetime(max(stamps).replace(tzinfo=timezone.utc), usegmt=True)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+
+        # The fingerprint is part of the key, so any review or submission yields a fresh entry
+        context = summary_cache.cached("reports_tab", {"etag": etag}, lambda: _reports_tab_context(session))
         
     return templates.TemplateResponse(
         "dashboard/partials/reports_tab.html",
-        {
-            "request": request,
-            "pending_targets": pending_targets,
-            "submissions": submissions
-        }
+        {"request": request, **context},
+        headers=headers,
     )
 
 
+def _reports_tab_fingerprint(session: Session) -> tuple[datetime | None, datetime | None, str]:
+    """Cheap fingerprint of everything the tab shows; lets HTMX swaps revalidate with a 304."""
+    reviewed_latest, reviewed_count, submitted_latest, submitted_count = session.exec(
+        select(
+            select(func.max(Measurement.created_at)).where(Measurement.reviewed == True).scalar_subquery(),
+            select(func.count(Measurement.id)).where(Measurement.reviewed == True).scalar_subquery(),
+            select(func.max(SubmissionLog.created_at)).scalar_subquery(),
+            select(func.count(SubmissionLog.id)).scalar_subquery(),
+        )
+    ).one()
+    etag = _etag_for(reviewed_latest, reviewed_count, submitted_latest, submitted_count)
+    return reviewed_latest, submitted_latest, etag
+
+
+def _reports_tab_context(session: Session) -> dict[str, Any]:
+    # Pending (reviewed) measurements grouped per target, with the span formatted by the DB
+    rows = session.exec(
+        select(
+            Measurement.target,
+            func.count(Measurement.id),
+            func.to_char(func.min(Measurement.obs_time), "HH24:MI"),
+            func.to_char(func.max(Measurement.obs_time), "HH24:MI"),
+        )
+        .where(Measurement.reviewed == True)
+        .group_by(Measurement.target)
+        .order_by(Measurement.target)
+    ).all()
+    pending_targets = [
+        {"name": target, "count": count, "span": f"{first} - {last}"}
+        for target, count, first, last in rows
+    ]
+        
+    # Fetch submission history
+    submissions = session.exec(
+        select(SubmissionLog).order_by(SubmissionLog.created_at.desc()).limit(10)
+    ).all()
+    return {"pending_targets": pending_targets, "submissions": submissions}
+
+
+# Measurements loaded by a preview, reused when its MPC80 tab is opened shortly after.
+_PREVIEW_MEASUREMENTS: TTLCache = TTLCache(maxsize=16, ttl=120)
+_PREVIEW_MEASUREMENTS_LOCK = threading.Lock()
+
+
 @router.get("/dashboard/reports/preview", response_class=HTMLResponse)
 async def reports_preview(request: Request, target: str) -> Any:
     """Render report preview modal for a specific target."""
@@ -1547,16 +1906,16 @@ async def reports_preview(request: Request, target: str) -> Any:
         if not measurements:
             return "<div>No measurements found for target.</div>"
             
-        from app.services.reporting import ReportService
         svc = ReportService(session)
         
-        # Generate both formats for preview
+        # Only ADES is shown first; the MPC80 tab fetches its block on demand
         ades_content = svc.generate_ades(measurements)
-        mpc_content = svc.generate_mpc80(measurements)
+        with _PREVIEW_MEASUREMENTS_LOCK:
+            _PREVIEW_MEASUREMENTS[target] = measurements
         
         # Get IDs for submission
         ids = [m.id for m in measurements if m.id]
-        ids_json = json.dumps(ids)
+        ids_json = orjson.dumps(ids).decode()
         
     return templates.TemplateResponse(
         "dashboard/partials/report_preview.html",
@@ -1564,13 +1923,30 @@ async def reports_preview(request: Request, target: str) -> Any:
             "request": request,
             "target": target,
             "ades_content": ades_content,
-            "mpc_content": mpc_content,
             "ids_json": ids_json,
             "count": len(measurements)
         }
     )
 
 
+@router.get("/dashboard/reports/preview/mpc80", response_class=HTMLResponse)
+def reports_preview_mpc80(target: str) -> Any:
+    """Render the MPC80 block of a report preview when its tab is first shown."""
+    with _PREVIEW_MEASUREMENTS_LOCK:
+        measurements = _PREVIEW_MEASUREMENTS.get(target)
+    if measurements is None:
+        with get_session() as session:
+            measurements = session.exec(
+                select(Measurement)
+                .where(Measurement.target == target)
+                .where(Measurement.reviewed == True)
+                .order_by(Measurement.obs_time)
+            ).all()
+    if not measurements:
+        return HTMLResponse("<div>No measurements found for target.</div>")
+    return HTMLResponse(f"<pre><code>{escape(ReportService().generate_mpc80(measurements))}</code></pre>")
+
+
 @router.post("/dashboard/reports/submit", response_class=HTMLResponse)
 async def reports_submit(request: Request) -> Any:
     """Handle report submission."""
@@ -1579,29 +1955,44 @@ async def reports_submit(request: Request) -> Any:
     format_type = form.get("format") or "ades"
     
     if not ids_json:
-        return "<div>Error: No measurements selected.</div>"
-        
+        return Response(_ERR_NO_IDS, status_code=400, media_type=_HTML_MEDIA_TYPE)
+
     try:
-        ids = json.loads(ids_json)
-    except json.JSONDecodeError:
-        return "<div>Error: Invalid measurement IDs.</div>"
-        
+        ids = orjson.loads(ids_json)
+    except orjson.JSONDecodeError:
+        return Response(_ERR_BAD_IDS, status_code=400, media_type=_HTML_MEDIA_TYPE)
+    # The ids travel as one int[] bind, so reject anything that is not a list of integers
+    if not isinstance(ids, list) or not all(type(i) is int for i in ids):
+        return Response(_ERR_BAD_IDS, status_code=400, media_type=_HTML_MEDIA_TYPE)
+
+    if not await run_in_threadpool(_submit_measurements, ids, format_type):
+        return Response(_ERR_NOT_FOUND, status_code=404, media_type=_HTML_MEDIA_TYPE)
+
+    # Return success message or refresh reports tab
+    return await run_in_threadpool(reports_tab, request)
+
+
+# Report formats the preview form can post, mapped to their ReportService generators.
+_REPORT_GENERATORS = {
+    "ades": ReportService.generate_ades,
+    "mpc": ReportService.generate_mpc80,
+    "mpc80": ReportService.generate_mpc80,
+}
+
+
+def _submit_measurements(ids: list[int], format_type: str) -> bool:
+    """Build and log a report for ``ids``; returns False when none of them exist."""
     with get_session() as session:
-        measurements = session.exec(
-            select(Measurement).where(Measurement.id.in_(ids))
-        ).all()
+        measurements = session.exec(_MEASUREMENTS_BY_IDS_STMT, params={"ids": ids}).all()
         
         if not measurements:
-            return "<div>Error: Measurements not found.</div>"
+            return False
             
-        from app.services.reporting import ReportService
         svc = ReportService(session)
         
-        # Generate payload based on selected format
-        if format_type == "ades":
-            payload = svc.generate_ades(measurements)
-        else:
-            payload = svc.generate_mpc80(measurements)
+        # Generate payload based on selected format; anything unrecognised keeps the MPC80 fallback
+        generate = _REPORT_GENERATORS.get(format_type, ReportService.generate_mpc80)
+        payload = generate(svc, measurements)
             
         # Submit
         # TODO: Real submission logic (email/API)
@@ -1611,9 +2002,27 @@ async def reports_submit(request: Request) -> Any:
         # Mark as submitted? 
         # We don't have a 'submitted' flag on Measurement yet, but we have the log.
         # Ideally we'd update Measurement status here.
-        
-    # Return success message or refresh reports tab
-    return reports_tab(request)
+    return True
+
+
+def _warm_sync_summaries() -> None:
+    """Populate the target list, KPI and Reports-tab caches from a worker thread."""
+    _load_targets()
+    refresh_daily_counts()
+    with get_session() as session:
+        _, _, etag = _reports_tab_fingerprint(session)
+        summary_cache.cached("reports_tab", {"etag": etag}, lambda: _reports_tab_context(session))
+
+
+async def prewarm_dashboard_caches(interval: float) -> None:
+    """Keep the polled dashboard summaries warm so the first visitor skips the cold queries."""
+    while True:
+        try:
+            await _warm_reports_context(summary_cache.cache_key("reports", {}))
+            await run_in_threadpool(_warm_sync_summaries)
+        except Exception:
+            logger.exception("Dashboard cache prewarm failed")
+        await asyncio.sleep(interval)
 
 
 __all__ = ["router"]
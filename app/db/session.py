@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
 
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
 
-engine = create_engine(settings.database_url, echo=False, pool_pre_ping=True)
+# Sized pool with periodic recycling instead of a SELECT 1 pre-ping on every checkout;
+# connections are replaced well before Postgres or a proxy would drop them as idle.
+_POOL_OPTIONS = {
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+    "pool_recycle": settings.db_pool_recycle_seconds,
+    "pool_pre_ping": False,
+}
+
+engine = create_engine(settings.database_url, echo=False, **_POOL_OPTIONS)
+# Same database through psycopg's async driver, for read paths that should not hold a worker thread.
+async_engine = create_async_engine(settings.database_url, echo=False, **_POOL_OPTIONS)
 
 
 def init_db() -> None:
@@ -23,3 +36,12 @@ def get_session() -> Iterator[Session]:
         yield session
     finally:
         session.close()
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    session = AsyncSession(async_engine)
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -5,10 +5,10 @@ from .capture import CaptureLog
 from .astrometry import AstrometricSolution
 from .report import Measurement
 from .submission import SubmissionLog
-from .report import Measurement
 from .equipment import EquipmentProfileRecord
 from .neocp import (
     NeoCandidate,
+    NeoCandidateRaw,
     NeoCPSnapshot,
     NeoEphemeris,
     NeoObservationPayload,
@@ -27,6 +27,7 @@ __all__ = [
     "SubmissionLog",
     "SiteConfig",
     "NeoCandidate",
+    "NeoCandidateRaw",
     "NeoCPSnapshot",
     "NeoObservationPayload",
     "NeoEphemeris",
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Column, ForeignKey, Integer
 from sqlmodel import Field, SQLModel
 
 
@@ -16,7 +17,11 @@ class CandidateAssociation(SQLModel, table=True):
     """
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    capture_id: int = Field(foreign_key="capturelog.id", index=True)
+    capture_id: int = Field(
+        sa_column=Column(
+            Integer, ForeignKey("capturelog.id", ondelete="CASCADE"), nullable=False, index=True
+        )
+    )
     ra_deg: float
     dec_deg: float
 
@@ -3,26 +3,35 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy import Column, ForeignKey, Integer, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlmodel import Field, SQLModel
 
 
 class AstrometricSolution(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    capture_id: Optional[int] = Field(default=None, foreign_key="capturelog.id", index=True)
+    capture_id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(Integer, ForeignKey("capturelog.id", ondelete="CASCADE"), index=True),
+    )
     target: Optional[str] = Field(default=None, max_length=128, index=True)
     path: str = Field(max_length=512, index=True)
-    ra_deg: Optional[float] = Field(default=None, index=True)
-    dec_deg: Optional[float] = Field(default=None, index=True)
+    ra_deg: Optional[float] = None
+    dec_deg: Optional[float] = None
     orientation_deg: Optional[float] = None
     pixel_scale_arcsec: Optional[float] = None
     uncertainty_arcsec: Optional[float] = None
     snr: Optional[float] = Field(default=None, description="Peak SNR from photometry")
     mag_inst: Optional[float] = Field(default=None, description="Instrumental magnitude estimate")
-    flags: Optional[str] = Field(default=None, description="JSON list of quality flags")
+    flags: Optional[List[str]] = Field(
+        default=None, sa_column=Column(ARRAY(Text)), description="Quality flags"
+    )
     success: bool = Field(default=False, index=True)
-    solver_info: Optional[str] = Field(default=None, description="JSON blob of solver output")
+    solver_info: Optional[Dict[str, Any]] = Field(
+        default=None, sa_column=Column(JSONB), description="Solver output"
+    )
     solved_at: datetime = Field(default_factory=datetime.utcnow, index=True)
     duration_seconds: Optional[float] = None
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -5,17 +5,25 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
 class CaptureLog(SQLModel, table=True):
+    __table_args__ = (
+        # Per-target capture listings filter on target and sort by started_at. This is the
+        # only secondary index: target-only lookups use its prefix, and nothing filters on
+        # kind/sequence/index alone, so extra B-trees would only slow frame inserts.
+        Index("ix_capturelog_target_started_at", "target", "started_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    kind: str = Field(max_length=32, index=True)
-    target: str = Field(max_length=128, index=True)
-    sequence: Optional[str] = Field(default=None, max_length=128, index=True)
-    index: Optional[int] = Field(default=None, index=True)
+    kind: str = Field(max_length=32)
+    target: str = Field(max_length=128)
+    sequence: Optional[str] = Field(default=None, max_length=128)
+    index: Optional[int] = None
     path: str = Field(max_length=512)
-    started_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    started_at: datetime = Field(default_factory=datetime.utcnow)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
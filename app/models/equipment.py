@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from sqlalchemy import Column
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
 
@@ -13,7 +15,10 @@ class EquipmentProfileRecord(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=64, index=True, unique=True)
-    payload_json: str = Field(description="JSON blob of equipment capabilities/presets")
+    payload_json: Dict[str, Any] = Field(
+        sa_column=Column(JSONB, nullable=False),
+        description="Equipment capabilities/presets",
+    )
     is_active: bool = Field(default=False, index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import gzip
 from datetime import date, datetime
-from typing import Optional
-
-from sqlalchemy import UniqueConstraint
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from pydantic import computed_field
 from sqlmodel import Field, SQLModel
 
+# Timestamps are naive UTC throughout the app, so the server default must not follow the
+# session time zone the way a bare now() would.
+_UTC_NOW = text("timezone('utc', now())")
+
 
 class NeoCandidate(SQLModel, table=True):
     """Normalized entry scraped from the MPC NEO Confirmation Page."""
@@ -35,29 +53,56 @@ class NeoCandidate(SQLModel, table=True):
     status_ut: Optional[str] = Field(
         default=None, description="Status timestamp (e.g., 'Nov. 16.77 UT')"
     )
-    raw_entry: Optional[str] = Field(
-        default=None, description="Raw MPC line text for trace/debugging"
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, server_default=_UTC_NOW, nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=_UTC_NOW, onupdate=_UTC_NOW, nullable=False),
+    )
+
+
+class NeoCandidateRaw(SQLModel, table=True):
+    """Raw MPC line for a candidate, kept apart from the hot candidate rows."""
+
+    candidate_id: str = Field(
+        sa_column=Column(
+            String, ForeignKey("neocandidate.id", ondelete="CASCADE"), primary_key=True
+        )
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    raw_entry: str = Field(description="Raw MPC line text for trace/debugging")
 
 
 class NeoCPSnapshot(SQLModel, table=True):
-    """Raw HTML snapshot captured during each NEOCP poll."""
+    """Metadata for the raw HTML snapshot captured during each NEOCP poll.
+
+    The HTML itself is archived gzip-compressed on disk, one file per checksum.
+    """
 
     __table_args__ = (UniqueConstraint("checksum", name="uq_neocp_snapshot_checksum"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     source_url: str = Field(max_length=512, description="URL used to fetch the snapshot")
     fetched_at: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
-    checksum: str = Field(
-        max_length=64,
-        index=True,
-        unique=True,
-        description="SHA-256 hash of the HTML payload for dedupe tracking",
+    checksum: bytes = Field(
+        sa_column=Column(LargeBinary(32), nullable=False, index=True),
+        description="Raw SHA-256 digest of the HTML payload for dedupe tracking",
     )
-    html: str = Field(description="Raw HTML content from MPC")
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    payload_path: Optional[str] = Field(
+        default=None,
+        max_length=512,
+        description="Gzip-compressed HTML archive file; NULL until a legacy body is archived",
+    )
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, server_default=_UTC_NOW, nullable=False)
+    )
+
+    def load_html(self) -> str | None:
+        """Read the archived HTML back from disk, if it has been archived."""
+
+        if not self.payload_path:
+            return None
+        return gzip.decompress(Path(self.payload_path).read_bytes()).decode("utf-8")
 
 
 class NeoObservationPayload(SQLModel, table=True):
@@ -76,14 +121,17 @@ class NeoObservationPayload(SQLModel, table=True):
     trksub: str = Field(index=True, max_length=16)
     output_format: str = Field(max_length=16, description="Requested MPC output format")
     ades_version: str = Field(default="2022", max_length=8)
-    payload_json: str = Field(description="JSON payload (stringified) returned by MPC")
-    checksum: str = Field(
-        max_length=64,
-        index=True,
-        description="SHA-256 hash of the payload for dedupe tracking",
+    payload_json: Any = Field(
+        sa_column=Column(JSONB, nullable=False), description="Payload returned by MPC"
+    )
+    checksum: bytes = Field(
+        sa_column=Column(LargeBinary(32), nullable=False, index=True),
+        description="Raw SHA-256 digest of the payload for dedupe tracking",
     )
     fetched_at: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, server_default=_UTC_NOW, nullable=False)
+    )
 
 
 class NeoEphemeris(SQLModel, table=True):
@@ -100,12 +148,23 @@ class NeoEphemeris(SQLModel, table=True):
             "epoch",
             name="uq_neoeph_candidate_epoch",
         ),
+        # Rows are appended in ingest order, so a BRIN range index stays tiny
+        Index(
+            "brin_neoephemeris_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    candidate_id: str = Field(foreign_key="neocandidate.id", nullable=False, index=True)
-    trksub: str = Field(max_length=16, index=True)
-    epoch: datetime = Field(index=True)
+    # Candidate ids are the trksub, so no separate trksub column is stored. Candidate lookups
+    # (including "latest epoch first") use uq_neoeph_candidate_epoch, which the table is
+    # clustered on.
+    candidate_id: str = Field(
+        sa_column=Column(String, ForeignKey("neocandidate.id", ondelete="CASCADE"), nullable=False)
+    )
+    epoch: datetime
     ra_deg: float
     dec_deg: float
     delta_au: Optional[float] = None
@@ -144,13 +203,18 @@ class NeoEphemeris(SQLModel, table=True):
     # Source tracking
     source: str = Field(default="MPC", max_length=16, description="Ephemeris source: MPC or HORIZONS")
 
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, server_default=_UTC_NOW, nullable=False)
+    )
 
 
 class NeoObservabilityBase(SQLModel):
-    candidate_id: str = Field(foreign_key="neocandidate.id", nullable=False, index=True)
-    trksub: str = Field(max_length=16, index=True)
-    night_key: date = Field(index=True, description="UTC date the plan covers")
+    # Candidate ids are the trksub, so no separate trksub column is stored. Candidate lookups
+    # (including "latest night first") use uq_neocandidate_observability_night.
+    candidate_id: str = Field(
+        sa_column=Column(String, ForeignKey("neocandidate.id", ondelete="CASCADE"), nullable=False)
+    )
+    night_key: date = Field(description="UTC date the plan covers")
     night_start: datetime
     night_end: datetime
     window_start: datetime | None = None
@@ -160,8 +224,8 @@ class NeoObservabilityBase(SQLModel):
     min_moon_separation_deg: float | None = None
     max_sun_altitude_deg: float | None = None
     score: float = 0.0
-    score_breakdown: str | None = Field(
-        default=None, description="JSON-encoded scoring components"
+    score_breakdown: dict[str, float] | None = Field(
+        default=None, sa_column=Column(JSONB), description="Scoring components"
     )
     composite_score: float | None = Field(
         default=None, description="Multi-factor composite score (0-100) for dynamic prioritization"
@@ -170,10 +234,10 @@ class NeoObservabilityBase(SQLModel):
         default=None, description="Peak altitude during observable window"
     )
     is_observable: bool = Field(default=False, description="True when window meets thresholds")
-    limiting_factors: str | None = Field(
-        default=None, description="JSON-encoded list of limiting factors"
+    limiting_factors: list[str] | None = Field(
+        default=None, sa_column=Column(ARRAY(Text)), description="Limiting factors"
     )
-    computed_at: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
+    computed_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
 
 
 class NeoObservability(NeoObservabilityBase, table=True):
@@ -185,6 +249,26 @@ class NeoObservability(NeoObservabilityBase, table=True):
             "night_key",
             name="uq_neocandidate_observability_night",
         ),
+        Index("ix_neoobservability_score", "score"),
+        # Nights and recomputations only move forward, so BRIN covers time-range scans
+        Index(
+            "brin_neoobservability_night_key",
+            "night_key",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "brin_neoobservability_computed_at",
+            "computed_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Next-target selection only ever reads observable rows, best score first
+        Index(
+            "ix_neoobservability_observable_score",
+            "score",
+            postgresql_where=text("is_observable"),
+        ),
     )
 
     id: int | None = Field(default=None, primary_key=True)
@@ -193,9 +277,15 @@ class NeoObservability(NeoObservabilityBase, table=True):
 class NeoObservabilityRead(NeoObservabilityBase):
     id: int
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def trksub(self) -> str:
+        return self.candidate_id
+
 
 __all__ = [
     "NeoCandidate",
+    "NeoCandidateRaw",
     "NeoCPSnapshot",
     "NeoObservationPayload",
     "NeoEphemeris",
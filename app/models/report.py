@@ -3,18 +3,37 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
+from sqlalchemy import Column, ForeignKey, Index, Integer, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import Field, SQLModel
 
 
 class Measurement(SQLModel, table=True):
+    __table_args__ = (
+        # Reviewed measurements form the submission queue: the reports tab groups them per
+        # target with their obs_time span, and the fingerprint reads max(created_at). Both are
+        # answered from this index without touching the heap.
+        Index(
+            "ix_measurement_review_queue",
+            "target",
+            "obs_time",
+            postgresql_include=["created_at"],
+            postgresql_where=text("reviewed"),
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    capture_id: Optional[int] = Field(default=None, foreign_key="capturelog.id", index=True)
+    # Measurements outlive their frame (they may already be reported), so only unlink them
+    capture_id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(Integer, ForeignKey("capturelog.id", ondelete="SET NULL"), index=True),
+    )
     target: str = Field(max_length=128, index=True)
     obs_time: datetime = Field(index=True)
-    ra_deg: float = Field(index=True)
-    dec_deg: float = Field(index=True)
+    ra_deg: float
+    dec_deg: float
     ra_uncert_arcsec: Optional[float] = None
     dec_uncert_arcsec: Optional[float] = None
     magnitude: Optional[float] = None
@@ -25,9 +44,11 @@ class Measurement(SQLModel, table=True):
     station_code: Optional[str] = Field(default=None, max_length=8)
     observer: Optional[str] = Field(default=None, max_length=64)
     software: Optional[str] = Field(default=None, max_length=64)
-    flags: Optional[str] = Field(default=None, description="JSON list of validation flags")
+    flags: Optional[List[str]] = Field(
+        default=None, sa_column=Column(ARRAY(Text)), description="Validation flags"
+    )
     ast_cat: Optional[str] = Field(default="Gaia2", max_length=32, description="Astrometric catalog used")
-    reviewed: bool = Field(default=False, index=True)
+    reviewed: bool = Field(default=False)
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
 
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, ForeignKey, Integer, JSON
 
 class ObservingSession(SQLModel, table=True):
     __tablename__ = "observing_sessions"
@@ -21,8 +21,11 @@ class ObservingSession(SQLModel, table=True):
     config_snapshot: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
     stats: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
     
-    # Relationships
-    events: List["SystemEvent"] = Relationship(back_populates="session")
+    # Relationships (lazy="raise": load events explicitly with selectinload or a query)
+    events: List["SystemEvent"] = Relationship(
+        back_populates="session",
+        sa_relationship_kwargs={"lazy": "raise", "passive_deletes": True},
+    )
 
 
 class SystemEvent(SQLModel, table=True):
@@ -33,5 +36,10 @@ class SystemEvent(SQLModel, table=True):
     level: str = Field(default="info")
     message: str
     
-    session_id: Optional[int] = Field(default=None, foreign_key="observing_sessions.id")
-    session: Optional[ObservingSession] = Relationship(back_populates="events")
+    session_id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(Integer, ForeignKey("observing_sessions.id", ondelete="CASCADE")),
+    )
+    session: Optional[ObservingSession] = Relationship(
+        back_populates="events", sa_relationship_kwargs={"lazy": "raise"}
+    )
@@ -3,19 +3,28 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
+from sqlalchemy import Column, Index, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import Field, SQLModel
 
 
 class SubmissionLog(SQLModel, table=True):
+    __table_args__ = (
+        # Answers "which submissions included measurement X" via measurement_ids @> ARRAY[X]
+        Index("ix_submissionlog_measurement_ids", "measurement_ids", postgresql_using="gin"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
     channel: str = Field(max_length=32, description="email|api|sftp")
     status: str = Field(max_length=32, description="pending|sent|failed|acked")
     response: Optional[str] = Field(default=None, description="Raw response or error")
     report_path: Optional[str] = Field(default=None, description="Path to archived report payload")
-    measurement_ids: Optional[str] = Field(default=None, description="JSON list of included measurement IDs")
+    measurement_ids: Optional[List[int]] = Field(
+        default=None, sa_column=Column(ARRAY(Integer)), description="Included measurement IDs"
+    )
     notes: Optional[str] = Field(default=None, max_length=255)
 
 
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from sqlalchemy import Column
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
 
@@ -22,7 +24,10 @@ class WeatherSnapshot(SQLModel, table=True):
     precipitation_probability_pct: float | None = None
     precipitation_mm: float | None = None
     cloud_cover_pct: float | None = None
-    payload: str = Field(description="Raw JSON payload returned by the provider")
+    payload: Dict[str, Any] = Field(
+        sa_column=Column(JSONB, nullable=False),
+        description="Raw payload returned by the provider",
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
 
 
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import logging
-import math
 from dataclasses import dataclass
 from datetime import datetime
 
 from app.core.config import settings
+from app.services.geometry import angular_separation_arcsec
 from app.services.nina_client import NinaBridgeService
 from app.services.prediction import EphemerisPredictionService
 from app.services.session import SESSION_STATE
@@ -86,7 +86,7 @@ class TwoStageAcquisition:
             "info",
         )
 
-        predicted_coords = self.predictor.predict(
+        predicted_coords = self.predictor.predict_cached(
             candidate_id=candidate_id,
             when=datetime.utcnow(),
         )
@@ -246,24 +246,7 @@ class TwoStageAcquisition:
             Angular separation in arcseconds
         """
 
-        # Convert to radians
-        ra1_rad = math.radians(ra1)
-        dec1_rad = math.radians(dec1)
-        ra2_rad = math.radians(ra2)
-        dec2_rad = math.radians(dec2)
-
-        # Haversine formula
-        delta_ra = ra2_rad - ra1_rad
-        delta_dec = dec2_rad - dec1_rad
-
-        a = (
-            math.sin(delta_dec / 2) ** 2
-            + math.cos(dec1_rad) * math.cos(dec2_rad) * math.sin(delta_ra / 2) ** 2
-        )
-        c = 2 * math.asin(math.sqrt(a))
-
-        # Convert radians to arcseconds
-        return math.degrees(c) * 3600.0
+        return float(angular_separation_arcsec(ra1, dec1, ra2, dec2))
 
 
 __all__ = ["TwoStageAcquisition", "AcquisitionResult"]
@@ -6,7 +6,7 @@ import logging
 import math
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Optional, Tuple
 
 import numpy as np
 from astropy.io import fits
@@ -16,24 +16,59 @@ from photutils.detection import DAOStarFinder
 from sqlmodel import Session, select
 
 from app.models import CaptureLog, NeoEphemeris, CandidateAssociation
+from app.services.geometry import angular_separation_arcsec
 from app.services.star_subtraction import CatalogStarSubtractor
 
 logger = logging.getLogger(__name__)
 
+# Detections are a structure of arrays: one float64 array per field, index-aligned.
+SourceTable = dict[str, np.ndarray]
+_SOURCE_FIELDS = ("x", "y", "flux", "peak", "snr", "ra_deg", "dec_deg")
+
+
+def _empty_sources() -> SourceTable:
+    return {name: np.empty(0) for name in _SOURCE_FIELDS}
+
+
+def _source_table(sources: Any, std: float, wcs: WCS | None) -> SourceTable:
+    """Pull DAOStarFinder columns into arrays and convert all centroids to sky in one call."""
+    x = np.asarray(sources["xcentroid"], dtype=float)
+    y = np.asarray(sources["ycentroid"], dtype=float)
+    peak = np.asarray(sources["peak"], dtype=float)
+    if wcs is not None:
+        sky = wcs.pixel_to_world(x, y)
+        ra_deg = np.asarray(sky.ra.deg, dtype=float)
+        dec_deg = np.asarray(sky.dec.deg, dtype=float)
+    else:
+        ra_deg = np.full_like(x, np.nan)
+        dec_deg = np.full_like(x, np.nan)
+    return {
+        "x": x,
+        "y": y,
+        "flux": np.asarray(sources["flux"], dtype=float),
+        "peak": peak,
+        "snr": peak / std if std else np.zeros_like(peak),
+        "ra_deg": ra_deg,
+        "dec_deg": dec_deg,
+    }
+
 
 class AnalysisService:
     def __init__(self, session: Session | None = None) -> None:
         self.session = session
 
-    def detect_sources(self, path: Path, wcs: WCS | None = None) -> List[dict[str, Any]]:
-        """Detect all sources in the image and return their centroids and properties."""
+    def detect_sources(self, path: Path, wcs: WCS | None = None) -> SourceTable:
+        """Detect all sources in the image and return their centroids and properties.
+
+        RA/Dec are NaN when no WCS is given.
+        """
         try:
             data = fits.getdata(path)
         except Exception:
-            return []
+            return _empty_sources()
 
         if data is None:
-            return []
+            return _empty_sources()
 
         data = np.asarray(data, dtype=float)
         mean, median, std = sigma_clipped_stats(data, sigma=3.0)
@@ -44,39 +79,12 @@ class AnalysisService:
             finder = DAOStarFinder(fwhm=4.0, threshold=threshold - median)
             sources = finder(data - median)
         except Exception:
-            return []
+            return _empty_sources()
 
         if sources is None or len(sources) == 0:
-            return []
-
-        results = []
-        for source in sources:
-            x = float(source["xcentroid"])
-            y = float(source["ycentroid"])
-            flux = float(source["flux"])
-            peak = float(source["peak"])
-            snr = float(peak / std) if std else 0.0
-
-            ra_deg = None
-            dec_deg = None
-
-            if wcs:
-                # Convert pixel to sky coordinates
-                sky = wcs.pixel_to_world(x, y)
-                ra_deg = float(sky.ra.deg)
-                dec_deg = float(sky.dec.deg)
+            return _empty_sources()
 
-            results.append({
-                "x": x,
-                "y": y,
-                "flux": flux,
-                "peak": peak,
-                "snr": snr,
-                "ra_deg": ra_deg,
-                "dec_deg": dec_deg,
-            })
-
-        return results
+        return _source_table(sources, std, wcs)
 
     def detect_sources_with_star_subtraction(
         self,
@@ -85,7 +93,7 @@ class AnalysisService:
         target_ra: float,
         target_dec: float,
         exclusion_radius_arcsec: float = 20.0
-    ) -> Tuple[List[dict[str, Any]], int]:
+    ) -> Tuple[SourceTable, int]:
         """
         Detect sources after subtracting field stars.
 
@@ -99,10 +107,10 @@ class AnalysisService:
             data = fits.getdata(path)
         except Exception as e:
             logger.error(f"Could not load FITS data from {path}: {e}")
-            return [], 0
+            return _empty_sources(), 0
 
         if data is None:
-            return [], 0
+            return _empty_sources(), 0
 
         data = np.asarray(data, dtype=float)
 
@@ -121,69 +129,36 @@ class AnalysisService:
             sources = finder(cleaned_data - median)
         except Exception as e:
             logger.warning(f"Source detection failed: {e}")
-            return [], stars_subtracted
+            return _empty_sources(), stars_subtracted
 
         if sources is None or len(sources) == 0:
             logger.debug("No sources detected after star subtraction")
-            return [], stars_subtracted
-
-        # Convert to results with WCS
-        results = []
-        for source in sources:
-            x = float(source["xcentroid"])
-            y = float(source["ycentroid"])
-            flux = float(source["flux"])
-            peak = float(source["peak"])
-            snr = float(peak / std) if std else 0.0
-
-            # Convert pixel to sky coordinates
-            sky = wcs.pixel_to_world(x, y)
-            ra_deg = float(sky.ra.deg)
-            dec_deg = float(sky.dec.deg)
-
-            results.append({
-                "x": x,
-                "y": y,
-                "flux": flux,
-                "peak": peak,
-                "snr": snr,
-                "ra_deg": ra_deg,
-                "dec_deg": dec_deg,
-            })
+            return _empty_sources(), stars_subtracted
 
-        logger.info(f"Detected {len(results)} sources after subtracting {stars_subtracted} catalog stars")
+        results = _source_table(sources, std, wcs)
+        logger.info(f"Detected {len(sources)} sources after subtracting {stars_subtracted} catalog stars")
         return results, stars_subtracted
 
     def find_best_match(
         self, 
-        detections: List[dict[str, Any]], 
-        predicted_ra: float, 
-        predicted_dec: float, 
+        detections: SourceTable,
+        predicted_ra: float,
+        predicted_dec: float,
         tolerance_arcsec: float = 5.0
     ) -> Optional[dict[str, Any]]:
         """Find the detection closest to the predicted position within tolerance."""
-        best_match = None
-        min_dist = float("inf")
-        
-        for det in detections:
-            ra = det.get("ra_deg")
-            dec = det.get("dec_deg")
-            if ra is None or dec is None:
-                continue
-                
-            # Simple Euclidean distance for small separations (sufficient for matching)
-            # Correct for cos(dec)
-            cos_dec = math.cos(math.radians(predicted_dec))
-            d_ra = (ra - predicted_ra) * cos_dec
-            d_dec = dec - predicted_dec
-            dist_deg = math.sqrt(d_ra**2 + d_dec**2)
-            dist_arcsec = dist_deg * 3600.0
-            
-            if dist_arcsec < tolerance_arcsec and dist_arcsec < min_dist:
-                min_dist = dist_arcsec
-                best_match = det
-                
-        return best_match
+        if detections["ra_deg"].size == 0:
+            return None
+
+        # NaN coordinates (no WCS) compare false against the tolerance and are never picked
+        dist_arcsec = angular_separation_arcsec(
+            predicted_ra, predicted_dec, detections["ra_deg"], detections["dec_deg"]
+        )
+        dist_arcsec[~(dist_arcsec < tolerance_arcsec)] = np.inf
+        best = int(np.argmin(dist_arcsec))
+        if not np.isfinite(dist_arcsec[best]):
+            return None
+        return {name: float(values[best]) for name, values in detections.items()}
 
     def auto_associate(
         self,
@@ -211,7 +186,7 @@ class AnalysisService:
             return None
 
         # 1. Find Ephemeris (nearest to capture time)
-        ephems = db.exec(select(NeoEphemeris).where(NeoEphemeris.trksub == capture.target)).all()
+        ephems = db.exec(select(NeoEphemeris).where(NeoEphemeris.candidate_id == capture.target)).all()
 
         if not ephems:
             logger.warning(f"No ephemeris found for target {capture.target}")
@@ -244,11 +219,11 @@ class AnalysisService:
         else:
             detections = self.detect_sources(Path(capture.path), wcs)
 
-        if not detections:
+        if detections["x"].size == 0:
             logger.warning(f"No sources detected in {capture.path}")
             return None
 
-        logger.info(f"Detected {len(detections)} sources")
+        logger.info(f"Detected {detections['x'].size} sources")
 
         # 3. Find Best Match
         tolerance_arcsec = 10.0
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import shutil
 import time
 from pathlib import Path
 from typing import Any
@@ -16,7 +19,7 @@ from sqlmodel import Session
 from app.core.config import settings
 from app.db.session import get_session
 from app.models import AstrometricSolution, CaptureLog, Measurement
-from app.services.solver import SolveError, solve_fits
+from app.services.solver import SolveError, _copy_wcs_to_fits, solve_fits
 
 
 class AstrometryService:
@@ -47,19 +50,27 @@ class AstrometryService:
 
             started = time.perf_counter()
             try:
-                result = solve_fits(
-                    solve_path,
-                    radius_deg=radius_deg,
-                    ra_hint=ra_hint,
-                    dec_hint=dec_hint,
-                    downsample=downsample,
-                )
+                cache_path = _solve_cache_path(solve_path, ra_hint, dec_hint, radius_deg, downsample)
+                result = _load_cached_solve(cache_path, solve_path)
+                cache_hit = result is not None
+                if result is None:
+                    result = solve_fits(
+                        solve_path,
+                        radius_deg=radius_deg,
+                        ra_hint=ra_hint,
+                        dec_hint=dec_hint,
+                        downsample=downsample,
+                    )
                 duration = time.perf_counter() - started
                 fields = self._extract_fields(result)
                 quality = self._run_photometry(solve_path)
                 flags = self._collect_flags(fields, quality)
                 # missing_rms is not a critical failure
                 critical_flags = [f for f in flags if f != "missing_rms"]
+                solved = fields.get("ra_deg") is not None and fields.get("dec_deg") is not None
+                if not cache_hit and solved and not critical_flags:
+                    # Only good solutions are cached, so a retry of a failed solve reruns the solver
+                    _store_cached_solve(cache_path, solve_path, result)
                 model = AstrometricSolution(
                     capture_id=capture.id if capture else None,
                     target=capture.target if capture else None,
@@ -71,10 +82,10 @@ class AstrometryService:
                     uncertainty_arcsec=fields.get("uncertainty_arcsec"),
                     snr=quality.get("snr") if quality else None,
                     mag_inst=quality.get("mag_inst") if quality else None,
-                    flags=json.dumps(flags) if flags else None,
+                    flags=flags or None,
                     duration_seconds=duration,
                     success=not critical_flags,
-                    solver_info=json.dumps(result),
+                    solver_info=result,
                 )
                 if capture:
                     self._persist_measurement(db, capture, fields, quality, flags)
@@ -107,7 +118,7 @@ class AstrometryService:
                     path=str(solve_path),
                     success=False,
                     duration_seconds=duration,
-                    solver_info=json.dumps({"error": str(exc)}),
+                    solver_info={"error": str(exc)},
                 )
 
             db.add(model)
@@ -206,7 +217,7 @@ class AstrometryService:
             station_code=station_code,
             observer=observer,
             software=software,
-            flags=json.dumps(flags) if flags else None,
+            flags=flags or None,
             reviewed=False,
         )
         db.add(meas)
@@ -215,6 +226,79 @@ class AstrometryService:
         return meas
 
 
+def _solve_cache_path(
+    path: Path,
+    ra_hint: float | None,
+    dec_hint: float | None,
+    radius_deg: float | None,
+    downsample: int | None,
+) -> Path | None:
+    """Content-addressed cache file for a solve of ``path`` with the given hints.
+
+    Only the pixel data is hashed: solving writes WCS keywords back into the header,
+    which must not change the key.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with fits.open(path, memmap=True, do_not_scale_image_data=True) as hdul:
+            hdu = next((h for h in hdul if h.data is not None), None)
+            if hdu is None:
+                return None
+            data = np.ascontiguousarray(hdu.data)
+            digest.update(f"{data.dtype.str}{data.shape}".encode())
+            digest.update(data.reshape(-1).view(np.uint8))
+    except Exception:
+        return None
+    digest.update(repr((ra_hint, dec_hint, radius_deg, downsample)).encode())
+    key = digest.hexdigest()
+    return Path(settings.astrometry_solve_cache_dir) / key[:2] / f"{key}.json"
+
+
+def _load_cached_solve(cache_path: Path | None, solve_path: Path) -> dict[str, Any] | None:
+    """Return the cached solve for ``solve_path`` and restore its solver side effects.
+
+    A hit may be for the same pixels at a new path, so the cached ``.wcs`` is put back
+    next to the frame and into its header; without one the hit is treated as a miss.
+    """
+
+    if cache_path is None:
+        return None
+    try:
+        result = json.loads(cache_path.read_text())
+        wcs_path = solve_path.with_suffix(".wcs")
+        if not wcs_path.exists():
+            tmp_path = wcs_path.with_suffix(".wcs.tmp")
+            shutil.copyfile(cache_path.with_suffix(".wcs"), tmp_path)
+            os.replace(tmp_path, wcs_path)
+            _copy_wcs_to_fits(solve_path)
+    except (OSError, ValueError):
+        return None
+    return result
+
+
+def _store_cached_solve(cache_path: Path | None, solve_path: Path, result: dict[str, Any]) -> None:
+    """Cache ``result`` with the frame's ``.wcs``; frames without one are not cached."""
+
+    if cache_path is None:
+        return
+    wcs_path = solve_path.with_suffix(".wcs")
+    if not wcs_path.exists():
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # The .wcs lands first, so a readable .json always has its .wcs alongside
+        tmp_path = cache_path.with_suffix(".wcs.tmp")
+        shutil.copyfile(wcs_path, tmp_path)
+        os.replace(tmp_path, cache_path.with_suffix(".wcs"))
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(result))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # A cache write failure must never fail the solve itself
+        pass
+
+
 def _safe_float(value: Any) -> float | None:
     try:
         return float(value)
@@ -347,7 +347,7 @@ def _predict_current_coords(
         try:
             with get_session() as session:
                 predictor = EphemerisPredictionService(session)
-                predicted = predictor.predict(candidate_id, when)
+                predicted = predictor.predict_cached(candidate_id, when)
         except Exception as exc:  # pragma: no cover - best-effort prediction
             logger.warning("Prediction failed for %s: %s", candidate_id, exc)
             predicted = None
@@ -9,7 +9,7 @@ from typing import Any, Optional
 from sqlmodel import Session, select
 
 from app.db.session import get_session
-from app.models import AstrometricSolution, CaptureLog, CandidateAssociation
+from app.models import CaptureLog
 
 
 def record_capture(entry: dict[str, Any], session: Optional[Session] = None) -> None:
@@ -62,9 +62,7 @@ def prune_missing_captures(session: Session | None = None) -> int:
             if not row.path:
                 continue
             if not Path(row.path).exists():
-                # Delete associated solutions and associations
-                db.exec(AstrometricSolution.__table__.delete().where(AstrometricSolution.capture_id == row.id))
-                db.exec(CandidateAssociation.__table__.delete().where(CandidateAssociation.capture_id == row.id))
+                # Solutions and associations cascade in the database; measurements are unlinked
                 db.exec(CaptureLog.__table__.delete().where(CaptureLog.id == row.id))
                 removed += 1
         db.commit()
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Iterable, Sequence
 
 import httpx
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, delete, select
 
 from app.core.config import settings
@@ -116,29 +117,39 @@ class MpcEphemerisClient:
                 NeoEphemeris.epoch <= end_utc,
             )
         )
+        mappings = []
         for entry in rows:
             epoch = _parse_epoch(entry)
             if epoch is None:
                 continue
-            model = NeoEphemeris(
-                candidate_id=candidate.id,
-                trksub=candidate.trksub,
-                epoch=epoch,
-                ra_deg=_parse_float(entry.get("ra_deg") or entry.get("ra")),
-                dec_deg=_parse_float(entry.get("dec_deg") or entry.get("dec")),
-                delta_au=_parse_float(entry.get("delta_au") or entry.get("delta")),
-                r_au=_parse_float(entry.get("r_au") or entry.get("r")),
-                rate_arcsec_per_min=_parse_float(
-                    entry.get("rate_arcsec_per_min") or entry.get("ang_rate")
-                ),
-                position_angle_deg=_parse_float(
-                    entry.get("position_angle_deg") or entry.get("pa")
-                ),
-                magnitude=_parse_float(entry.get("magnitude") or entry.get("vmag")),
-            )
-            if model.ra_deg is None or model.dec_deg is None:
+            ra_deg = _parse_float(entry.get("ra_deg") or entry.get("ra"))
+            dec_deg = _parse_float(entry.get("dec_deg") or entry.get("dec"))
+            if ra_deg is None or dec_deg is None:
                 continue
-            self.session.add(model)
+            mappings.append(
+                {
+                    "candidate_id": candidate.id,
+                    "epoch": epoch,
+                    "ra_deg": ra_deg,
+                    "dec_deg": dec_deg,
+                    "delta_au": _parse_float(entry.get("delta_au") or entry.get("delta")),
+                    "r_au": _parse_float(entry.get("r_au") or entry.get("r")),
+                    "rate_arcsec_per_min": _parse_float(
+                        entry.get("rate_arcsec_per_min") or entry.get("ang_rate")
+                    ),
+                    "position_angle_deg": _parse_float(
+                        entry.get("position_angle_deg") or entry.get("pa")
+                    ),
+                    "magnitude": _parse_float(entry.get("magnitude") or entry.get("vmag")),
+                }
+            )
+        if not mappings:
+            return
+        # One batched executemany; samples that round to an epoch already stored are skipped.
+        self.session.exec(
+            insert(NeoEphemeris).on_conflict_do_nothing(constraint="uq_neoeph_candidate_epoch"),
+            params=mappings,
+        )
 
 
 def _parse_epoch(entry: dict) -> datetime | None:
@@ -55,7 +55,7 @@ def _load_profile(session: Session) -> EquipmentProfile | None:
         select(EquipmentProfileRecord).where(EquipmentProfileRecord.is_active.is_(True)).limit(1)
     ).first()
     if active_profile:
-        return EquipmentProfileSpec.model_validate(json.loads(active_profile.payload_json))
+        return EquipmentProfileSpec.model_validate(active_profile.payload_json)
 
     record = session.exec(select(SiteConfig).where(SiteConfig.name == settings.site_name)).first()
     if record and record.equipment_profile:
@@ -94,7 +94,7 @@ def save_profile(
         record = db.exec(
             select(EquipmentProfileRecord).where(EquipmentProfileRecord.name == name)
         ).first()
-        payload_json = json.dumps(payload.model_dump())
+        payload_json = payload.model_dump()
         if record:
             record.payload_json = payload_json
             record.updated_at = datetime.utcnow()
@@ -110,7 +110,7 @@ def save_profile(
         if activate:
             site = db.exec(select(SiteConfig).where(SiteConfig.name == settings.site_name)).first()
             if site:
-                site.equipment_profile = payload_json
+                site.equipment_profile = json.dumps(payload_json)
                 db.add(site)
                 db.commit()
         return record
@@ -136,7 +136,7 @@ def activate_profile(profile_id: int, session: Session | None = None) -> Equipme
         db.refresh(record)
         site = db.exec(select(SiteConfig).where(SiteConfig.name == settings.site_name)).first()
         if site:
-            site.equipment_profile = record.payload_json
+            site.equipment_profile = json.dumps(record.payload_json)
             db.add(site)
             db.commit()
         return record
@@ -0,0 +1,24 @@
+"""Sky-geometry helpers shared by acquisition and source matching."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def angular_separation_arcsec(
+    ra0_deg: float, dec0_deg: float, ra_deg: ArrayLike, dec_deg: ArrayLike
+) -> np.ndarray:
+    """Haversine separation (arcsec) between one position and one or many others.
+
+    ``ra_deg``/``dec_deg`` may be scalars or arrays; the result has their broadcast shape.
+    """
+
+    ra0, dec0 = np.radians(ra0_deg), np.radians(dec0_deg)
+    ra = np.radians(np.asarray(ra_deg, dtype=float))
+    dec = np.radians(np.asarray(dec_deg, dtype=float))
+    a = np.sin((dec - dec0) / 2) ** 2 + np.cos(dec0) * np.cos(dec) * np.sin((ra - ra0) / 2) ** 2
+    return np.degrees(2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))) * 3600.0
+
+
+__all__ = ["angular_separation_arcsec"]
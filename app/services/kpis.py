@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
+from sqlalchemy import Date, cast, func
 from sqlmodel import Session, select
 
+from app.core import summary_cache
 from app.db.session import get_session
 from app.models import AstrometricSolution, SubmissionLog
 
@@ -22,20 +24,21 @@ class KPIService:
 
     def daily_counts(self, days: int = 7) -> dict:
         cutoff = datetime.utcnow() - timedelta(days=days)
+        # Bucket per day in SQL so only one (day, count) row per day crosses the wire
+        solved_day = cast(AstrometricSolution.solved_at, Date)
         solves = self._query(
-            select(AstrometricSolution).where(AstrometricSolution.solved_at >= cutoff)
+            select(solved_day, func.count())
+            .where(AstrometricSolution.solved_at >= cutoff)
+            .group_by(solved_day)
         ).all()
+        submitted_day = cast(SubmissionLog.created_at, Date)
         submissions = self._query(
-            select(SubmissionLog).where(SubmissionLog.created_at >= cutoff)
+            select(submitted_day, func.count())
+            .where(SubmissionLog.created_at >= cutoff)
+            .group_by(submitted_day)
         ).all()
-        solved_per_day: dict[str, int] = {}
-        for s in solves:
-            day = s.solved_at.date().isoformat()
-            solved_per_day[day] = solved_per_day.get(day, 0) + 1
-        submissions_per_day: dict[str, int] = {}
-        for sub in submissions:
-            day = sub.created_at.date().isoformat()
-            submissions_per_day[day] = submissions_per_day.get(day, 0) + 1
+        solved_per_day = {day.isoformat(): count for day, count in solves}
+        submissions_per_day = {day.isoformat(): count for day, count in submissions}
         return {
             "solved_per_day": solved_per_day,
             "submissions_per_day": submissions_per_day,
@@ -56,4 +59,22 @@ class KPIService:
         }
 
 
-__all__ = ["KPIService"]
+# The dashboard prewarm loop refreshes this well inside the TTL; a miss only happens cold.
+_DAILY_COUNTS_TTL_S = 120.0
+
+
+def refresh_daily_counts(days: int = 7) -> dict:
+    """Recompute the daily KPI rollup and publish it for the dashboard read path."""
+    with get_session() as session:
+        data = KPIService(session=session).daily_counts(days)
+    summary_cache.store(summary_cache.cache_key("kpis", {"days": days}), data, ttl=_DAILY_COUNTS_TTL_S)
+    return data
+
+
+def cached_daily_counts(days: int = 7) -> dict:
+    """Daily KPI rollup from memory, computing it only if nothing has been published yet."""
+    data = summary_cache.lookup(summary_cache.cache_key("kpis", {"days": days}))
+    return data if data is not None else refresh_daily_counts(days)
+
+
+__all__ = ["KPIService", "cached_daily_counts", "refresh_daily_counts"]
@@ -10,11 +10,12 @@ from pathlib import Path
 from typing import Iterable, List, Tuple
 
 import httpx
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, select
 
 from app.core.config import settings
 from app.db.session import get_session
-from app.models import NeoCandidate
+from app.models import NeoCandidate, NeoCandidateRaw
 
 logger = logging.getLogger(__name__)
 
@@ -114,8 +115,11 @@ def sync_candidates(
 
     def _sync(db: Session) -> List[NeoCandidate]:
         results: List[NeoCandidate] = []
+        raw_entries: dict[str, str] = {}
         now = datetime.utcnow()
         for payload in payloads:
+            if payload.raw_entry:
+                raw_entries[payload.trksub] = payload.raw_entry
             existing = db.exec(
                 select(NeoCandidate).where(NeoCandidate.trksub == payload.trksub)
             ).first()
@@ -134,12 +138,19 @@ def sync_candidates(
                     vmag=payload.vmag,
                     status=payload.status,
                     status_ut=payload.status_ut,
-                    raw_entry=payload.raw_entry,
-                    created_at=now,
-                    updated_at=now,
                 )
                 db.add(model)
                 results.append(model)
+        if raw_entries:
+            db.flush()
+            stmt = insert(NeoCandidateRaw).values(
+                [{"candidate_id": trksub, "raw_entry": raw} for trksub, raw in raw_entries.items()]
+            )
+            db.exec(
+                stmt.on_conflict_do_update(
+                    index_elements=["candidate_id"], set_={"raw_entry": stmt.excluded.raw_entry}
+                )
+            )
         db.commit()
         for record in results:
             db.refresh(record)
@@ -161,7 +172,6 @@ def _apply_payload(model: NeoCandidate, payload: CandidatePayload, timestamp: da
     model.vmag = payload.vmag
     model.status = payload.status
     model.status_ut = payload.status_ut
-    model.raw_entry = payload.raw_entry
     model.updated_at = timestamp
 
 
@@ -381,7 +391,6 @@ def _payload_differs(existing: NeoCandidate, payload: CandidatePayload) -> bool:
             existing.vmag != payload.vmag,
             existing.status != payload.status,
             existing.status_ut != payload.status_ut,
-            existing.raw_entry != payload.raw_entry,
         ]
     )
 
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
 import logging
+import os
 import time
 from dataclasses import dataclass
 from datetime import datetime
 from hashlib import sha256
+from pathlib import Path
 from typing import Iterable, Sequence
 
 import httpx
@@ -91,6 +94,21 @@ class FetchCycleStats:
     observation_stats: ObservationSyncStats
 
 
+def _archive_snapshot(payload: str, checksum: bytes) -> Path:
+    """Write the snapshot HTML to its checksum-addressed archive file and return the path."""
+
+    digest = checksum.hex()
+    path = Path(settings.neocp_snapshot_archive_dir) / digest[:2] / f"{digest}.html.gz"
+    if path.exists():
+        # Same checksum, same content: an earlier (possibly uncommitted) write already holds it
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(gzip.compress(payload.encode("utf-8")))
+    os.replace(tmp_path, path)
+    return path
+
+
 class NeoCPFetcherService:
     """Background worker that keeps the local database aligned with MPC."""
 
@@ -112,6 +130,8 @@ class NeoCPFetcherService:
         self._metrics_enabled = settings.neocp_metrics_enabled
         self._start_metrics_server()
         self._client = httpx.Client(timeout=settings.neocp_fetch_timeout)
+        # Checksum of the last snapshot known to be stored; most polls return the same feed.
+        self._last_snapshot_checksum: bytes | None = None
 
     def run_forever(self) -> None:
         logger.info(
@@ -171,22 +191,32 @@ class NeoCPFetcherService:
         )
 
     def _persist_snapshot(self, session: Session, payload: str, source_url: str) -> bool:
-        checksum = sha256(payload.encode("utf-8")).hexdigest()
+        checksum = sha256(payload.encode("utf-8")).digest()
+        if checksum == self._last_snapshot_checksum:
+            return False
         existing = session.exec(
-            select(NeoCPSnapshot).where(NeoCPSnapshot.checksum == checksum)
+            select(NeoCPSnapshot.id).where(NeoCPSnapshot.checksum == checksum)
         ).first()
         if existing:
+            self._last_snapshot_checksum = checksum
+            return False
+
+        try:
+            payload_path = _archive_snapshot(payload, checksum)
+        except OSError as exc:
+            # Losing the snapshot row is acceptable; aborting candidate sync is not
+            logger.warning("Failed to archive NEOCP snapshot, skipping it: %s", exc)
             return False
 
         snapshot = NeoCPSnapshot(
             source_url=source_url,
             checksum=checksum,
-            html=payload,
+            payload_path=str(payload_path),
             fetched_at=datetime.utcnow(),
         )
         session.add(snapshot)
         session.commit()
-        session.refresh(snapshot)
+        self._last_snapshot_checksum = checksum
         return True
 
     def _sync_observations(
@@ -260,7 +290,7 @@ class NeoCPFetcherService:
                 continue
             payload_data = response[fmt]
             serialized = json.dumps(payload_data, sort_keys=True)
-            checksum = sha256(serialized.encode("utf-8")).hexdigest()
+            checksum = sha256(serialized.encode("utf-8")).digest()
             existing = session.exec(
                 select(NeoObservationPayload).where(
                     NeoObservationPayload.trksub == trksub,
@@ -275,7 +305,7 @@ class NeoCPFetcherService:
                 trksub=trksub,
                 output_format=fmt,
                 ades_version=settings.neocp_ades_version,
-                payload_json=serialized,
+                payload_json=payload_data,
                 checksum=checksum,
                 fetched_at=fetched_at,
             )
@@ -176,7 +176,7 @@ def _fetch_target_internal(trksub: str | None = None, ignore_time: bool = False)
             .order_by(NeoObservability.score.desc())
         )
         if trksub:
-            stmt = stmt.where(NeoObservability.trksub == trksub)
+            stmt = stmt.where(NeoObservability.candidate_id == trksub)
         else:
             stmt = stmt.where(NeoObservability.is_observable.is_(True))
             now = datetime.utcnow()
@@ -186,10 +186,8 @@ def _fetch_target_internal(trksub: str | None = None, ignore_time: bool = False)
             if not ignore_time:
                 stmt = stmt.where(NeoObservability.window_start <= now)
             
-            # We can't easily filter by list in SQLModel/SQLAlchemy with a set if it's empty or large?
-            # Actually .where(NeoObservability.trksub.not_in(imaged_targets)) works.
             if imaged_targets:
-                stmt = stmt.where(NeoObservability.trksub.not_in(imaged_targets))
+                stmt = stmt.where(NeoObservability.candidate_id.not_in(imaged_targets))
                 
             stmt = stmt.limit(1)
         row = session.exec(stmt).first()
@@ -199,7 +197,7 @@ def _fetch_target_internal(trksub: str | None = None, ignore_time: bool = False)
     if cand.ra_deg is None or cand.dec_deg is None:
         raise NightSessionError(status_code=400, message="Target is missing coordinates (ra/dec).")
     return {
-        "trksub": obs.trksub,
+        "trksub": cand.trksub,
         "candidate_id": cand.id,
         "ra_deg": cand.ra_deg,
         "dec_deg": cand.dec_deg,
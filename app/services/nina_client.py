@@ -1,4 +1,5 @@
 import logging
+import threading
 import time
 from typing import Any
 
@@ -234,4 +235,35 @@ class NinaBridgeService:
         return self._request("GET", "/equipment/guider/stop")
 
 
-__all__ = ["NinaBridgeService"]
+_STATUS_CACHE: dict[str, Any] = {"ts": 0.0, "val": None}
+_STATUS_LOCK = threading.Lock()
+
+
+def cached_bridge_status(ttl: float = 1.0) -> dict[str, Any]:
+    """Return bridge ``/status``, shared across callers for ``ttl`` seconds.
+
+    Concurrent callers wait on a single in-flight request. If the bridge call
+    fails, the last good status is returned when one exists.
+    """
+    with _STATUS_LOCK:
+        if _STATUS_CACHE["val"] is not None and time.monotonic() - _STATUS_CACHE["ts"] < ttl:
+            return _STATUS_CACHE["val"]
+        try:
+            status = NinaBridgeService().get_status()
+        except Exception:
+            if _STATUS_CACHE["val"] is None:
+                raise
+            logger.warning("Bridge status unavailable; serving last known status", exc_info=True)
+            return _STATUS_CACHE["val"]
+        _STATUS_CACHE["ts"] = time.monotonic()
+        _STATUS_CACHE["val"] = status
+        return status
+
+
+def invalidate_bridge_status() -> None:
+    """Force the next ``cached_bridge_status`` call to hit the bridge."""
+    with _STATUS_LOCK:
+        _STATUS_CACHE["ts"] = 0.0
+
+
+__all__ = ["NinaBridgeService", "cached_bridge_status", "invalidate_bridge_status"]
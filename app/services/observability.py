@@ -14,6 +14,7 @@ from astropy.coordinates import AltAz, SkyCoord, get_body
 from astropy.time import Time
 import astropy.units as u
 from astroplan import FixedTarget, Observer
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, select
 
 from app.core.config import settings
@@ -291,9 +292,9 @@ class ObservabilityService:
                 "min_moon_separation_deg": min_moon_sep,
                 "max_sun_altitude_deg": max_sun_alt,
                 "score": final_score,
-                "score_breakdown": json.dumps(breakdown),
+                "score_breakdown": breakdown,
                 "is_observable": duration_minutes >= self.min_window_minutes and not reasons,
-                "limiting_factors": json.dumps(reasons) if reasons else None,
+                "limiting_factors": list(reasons) if reasons else None,
             },
             reasons,
         )
@@ -320,33 +321,33 @@ class ObservabilityService:
         if candidate.id is None:
             return None
 
-        stmt = select(NeoObservability).where(
-            NeoObservability.candidate_id == candidate.id,
-            NeoObservability.night_key == self.night_key,
-        )
-        existing = self.session.exec(stmt).first()
         base_fields = {
             "candidate_id": candidate.id,
-            "trksub": candidate.trksub,
             "night_key": self.night_key,
             "night_start": self.night_start,
             "night_end": self.night_end,
             "computed_at": datetime.utcnow(),
             "is_observable": False,
-            "limiting_factors": json.dumps(list(reasons)) if reasons else None,
+            "limiting_factors": list(reasons) if reasons else None,
         }
         if payload:
             base_fields.update(payload)
 
-        if existing:
-            for field, value in base_fields.items():
-                setattr(existing, field, value)
-            self.session.add(existing)
-            return existing
-
-        model = NeoObservability(**base_fields)
-        self.session.add(model)
-        return model
+        # Upsert on uq_neocandidate_observability_night instead of select-then-write. Only the
+        # computed fields are overwritten, so a blocked re-run keeps the last known window.
+        stmt = insert(NeoObservability).values(**base_fields)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_neocandidate_observability_night",
+            set_={
+                field: stmt.excluded[field]
+                for field in base_fields
+                if field not in ("candidate_id", "night_key")
+            },
+        )
+        return self.session.scalars(
+            stmt.returning(NeoObservability),
+            execution_options={"populate_existing": True},
+        ).one()
 
 
 __all__ = ["ObservabilityService"]
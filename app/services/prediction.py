@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Sequence
 
+from cachetools import TTLCache
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, select
 
 from app.core.config import settings
@@ -16,6 +20,11 @@ from app.services.ephemeris import MpcEphemerisClient
 
 logger = logging.getLogger(__name__)
 
+# Predictions keyed by (candidate_id, whole UTC second). Shared across service instances since
+# each one only lives for a single DB session; the TTL bounds staleness after ephemeris refreshes.
+_PREDICTION_CACHE: TTLCache = TTLCache(maxsize=512, ttl=300)
+_PREDICTION_CACHE_LOCK = threading.Lock()
+
 
 class EphemerisPredictionService:
     """Predict RA/Dec for a candidate using JPL Horizons ephemerides.
@@ -82,6 +91,30 @@ class EphemerisPredictionService:
         # Fallback: use MPC ephemerides
         return self._predict_from_mpc(candidate, when)
 
+    def predict_cached(
+        self,
+        candidate_id: str | None,
+        when: datetime,
+    ) -> tuple[float, float] | None:
+        """Like :meth:`predict`, but floored to the second and reused across calls.
+
+        Failed predictions are not cached so a transient Horizons/MPC error is retried.
+        """
+
+        if not candidate_id:
+            return None
+        bucket = when.replace(microsecond=0)
+        key = (candidate_id, bucket)
+        with _PREDICTION_CACHE_LOCK:
+            cached = _PREDICTION_CACHE.get(key)
+        if cached is not None:
+            return cached
+        predicted = self.predict(candidate_id, bucket)
+        if predicted is not None:
+            with _PREDICTION_CACHE_LOCK:
+                _PREDICTION_CACHE[key] = predicted
+        return predicted
+
     def _predict_from_horizons(
         self, candidate: NeoCandidate, when: datetime
     ) -> tuple[float, float] | None:
@@ -129,14 +162,13 @@ class EphemerisPredictionService:
             return None
 
         # Cache Horizons data in database
-        self._cache_horizons_ephemerides(candidate.id, candidate.trksub, rows_data)
+        self._cache_horizons_ephemerides(candidate.id, rows_data)
 
         # Convert to NeoEphemeris objects for interpolation
         ephemeris_rows = []
         for row_data in rows_data:
             eph = NeoEphemeris(
                 candidate_id=candidate.id,
-                trksub=candidate.trksub,
                 epoch=row_data["epoch"],
                 ra_deg=row_data["ra_deg"],
                 dec_deg=row_data["dec_deg"],
@@ -156,55 +188,46 @@ class EphemerisPredictionService:
         return self._interpolate(ephemeris_rows, when)
 
     def _cache_horizons_ephemerides(
-        self, candidate_id: str, trksub: str, rows_data: list[dict]
+        self, candidate_id: str, rows_data: list[dict]
     ) -> None:
         """Store Horizons ephemeris data in database."""
 
-        for row_data in rows_data:
-            # Check if this epoch already exists
-            existing = self.session.exec(
-                select(NeoEphemeris)
-                .where(NeoEphemeris.candidate_id == candidate_id)
-                .where(NeoEphemeris.epoch == row_data["epoch"])
-            ).first()
-
-            if existing:
-                # Update existing record
-                existing.ra_deg = row_data["ra_deg"]
-                existing.dec_deg = row_data["dec_deg"]
-                existing.ra_rate_arcsec_min = row_data.get("ra_rate_arcsec_min")
-                existing.dec_rate_arcsec_min = row_data.get("dec_rate_arcsec_min")
-                existing.azimuth_deg = row_data.get("azimuth_deg")
-                existing.elevation_deg = row_data.get("elevation_deg")
-                existing.airmass = row_data.get("airmass")
-                existing.v_mag_predicted = row_data.get("v_mag")
-                existing.solar_elongation_deg = row_data.get("solar_elongation_deg")
-                existing.lunar_elongation_deg = row_data.get("lunar_elongation_deg")
-                existing.uncertainty_3sigma_arcsec = row_data.get("uncertainty_3sigma_arcsec")
-                existing.source = "HORIZONS"
-                existing.created_at = datetime.utcnow()  # Update timestamp
-                self.session.add(existing)
-            else:
-                # Create new record
-                eph = NeoEphemeris(
-                    candidate_id=candidate_id,
-                    trksub=trksub,
-                    epoch=row_data["epoch"],
-                    ra_deg=row_data["ra_deg"],
-                    dec_deg=row_data["dec_deg"],
-                    ra_rate_arcsec_min=row_data.get("ra_rate_arcsec_min"),
-                    dec_rate_arcsec_min=row_data.get("dec_rate_arcsec_min"),
-                    azimuth_deg=row_data.get("azimuth_deg"),
-                    elevation_deg=row_data.get("elevation_deg"),
-                    airmass=row_data.get("airmass"),
-                    v_mag_predicted=row_data.get("v_mag"),
-                    solar_elongation_deg=row_data.get("solar_elongation_deg"),
-                    lunar_elongation_deg=row_data.get("lunar_elongation_deg"),
-                    uncertainty_3sigma_arcsec=row_data.get("uncertainty_3sigma_arcsec"),
-                    source="HORIZONS",
-                )
-                self.session.add(eph)
-
+        # Key by epoch so a repeated epoch keeps its last sample; ON CONFLICT DO UPDATE
+        # cannot touch the same row twice within one statement.
+        mappings = {
+            row_data["epoch"]: {
+                "candidate_id": candidate_id,
+                "epoch": row_data["epoch"],
+                "ra_deg": row_data["ra_deg"],
+                "dec_deg": row_data["dec_deg"],
+                "ra_rate_arcsec_min": row_data.get("ra_rate_arcsec_min"),
+                "dec_rate_arcsec_min": row_data.get("dec_rate_arcsec_min"),
+                "azimuth_deg": row_data.get("azimuth_deg"),
+                "elevation_deg": row_data.get("elevation_deg"),
+                "airmass": row_data.get("airmass"),
+                "v_mag_predicted": row_data.get("v_mag"),
+                "solar_elongation_deg": row_data.get("solar_elongation_deg"),
+                "lunar_elongation_deg": row_data.get("lunar_elongation_deg"),
+                "uncertainty_3sigma_arcsec": row_data.get("uncertainty_3sigma_arcsec"),
+                "source": "HORIZONS",
+            }
+            for row_data in rows_data
+        }
+        if not mappings:
+            return
+
+        stmt = insert(NeoEphemeris)
+        refreshed = {
+            name: stmt.excluded[name]
+            for name in next(iter(mappings.values()))
+            if name not in ("candidate_id", "epoch")
+        }
+        # created_at doubles as the cache timestamp, so an overwritten sample counts as fresh
+        refreshed["created_at"] = func.timezone("utc", func.now())
+        self.session.exec(
+            stmt.on_conflict_do_update(constraint="uq_neoeph_candidate_epoch", set_=refreshed),
+            params=list(mappings.values()),
+        )
         self.session.commit()
 
     def _predict_from_mpc(
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Any, List, Optional
+from xml.dom import minidom
 
+from astropy import units as u
+from astropy.coordinates import SkyCoord
+from sqlalchemy import insert
 from sqlmodel import Session, select
 
+from app.core import summary_cache
 from app.core.config import settings
 from app.models import Measurement, SubmissionLog, SiteConfig
 
@@ -97,7 +101,6 @@ class ReportService:
                 ET.SubElement(obs, "band").text = m.band or "R"
             
         # Pretty print XML
-        from xml.dom import minidom
         xml_str = minidom.parseString(ET.tostring(root)).toprettyxml(indent="  ")
         return xml_str
 
@@ -141,9 +144,6 @@ class ReportService:
             
             # Simplified generation (needs rigorous formatting)
             # Using astropy for coordinate conversion to sexagesimal
-            from astropy.coordinates import SkyCoord
-            from astropy import units as u
-            
             c = SkyCoord(ra=m.ra_deg*u.deg, dec=m.dec_deg*u.deg)
             ra_hms = c.ra.hms
             dec_dms = c.dec.dms
@@ -204,14 +204,17 @@ class ReportService:
             status=status,
             response=response,
             report_path=None, # We could save to disk
-            measurement_ids=json.dumps(measurement_ids),
+            measurement_ids=list(measurement_ids),
             notes=f"Submitted {len(measurement_ids)} observations. {validation_status}"
         )
         
         if self.session:
-            self.session.add(log)
+            # Core INSERT ... RETURNING: one round-trip, no identity-map bookkeeping or refresh SELECT.
+            log.id = self.session.exec(
+                insert(SubmissionLog).values(**log.model_dump(exclude={"id"})).returning(SubmissionLog.id)
+            ).scalar_one()
             self.session.commit()
-            self.session.refresh(log)
+            summary_cache.invalidate("reports")
             
         return log
 
@@ -216,7 +216,7 @@ class SequenceProcessor:
                 orientation_deg=header.get("CROTA2"),
                 pixel_scale_arcsec=header.get("CDELT1", 0) * 3600.0 if header.get("CDELT1") else None,
                 success=True,
-                solver_info='{"source": "NINA"}',
+                solver_info={"source": "NINA"},
                 duration_seconds=0.0,
             )
 
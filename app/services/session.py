@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any, List, Optional
@@ -74,11 +75,63 @@ class ObservingSession:
         }
 
 
+@dataclass(frozen=True)
+class SessionSnapshot:
+    """Read-only view of the session fields the dashboard polls, loaded together."""
+
+    current: ObservingSession | None
+    target_mode: str
+    selected_target: str | None
+    timezone: str
+
+
 class SessionState:
     """Database-backed tracker for the observing session."""
 
+    # Snapshots are dropped on every local write; the TTL bounds staleness from other processes.
+    _SNAPSHOT_TTL_S = 2.0
+
     def __init__(self) -> None:
         self._stop_auto_restart = False
+        self._targets_version = 0
+        self._snapshot: tuple[float, SessionSnapshot] | None = None
+
+    @property
+    def targets_version(self) -> int:
+        """Counter bumped whenever the inputs to the dashboard target list change."""
+        return self._targets_version
+
+    def bump_targets_version(self) -> None:
+        self._targets_version += 1
+
+    @property
+    def snapshot(self) -> SessionSnapshot:
+        """Current session, target mode/selection and timezone from one DB session.
+
+        Published as a single attribute, so readers never lock; writers replace it.
+        """
+        entry = self._snapshot
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        from app.models import SiteConfig
+        with get_session() as session:
+            db_session = session.exec(
+                select(DBObservingSession)
+                .where(DBObservingSession.status != "ended")
+                .order_by(DBObservingSession.start_time.desc())
+            ).first()
+            tz_name = session.exec(select(SiteConfig.timezone).where(SiteConfig.is_active == True)).first()
+            snap = SessionSnapshot(
+                current=self._to_view(db_session, session) if db_session else None,
+                target_mode=db_session.target_mode if db_session else "auto",
+                selected_target=db_session.selected_target if db_session else None,
+                timezone=tz_name or "UTC",
+            )
+        self._snapshot = (time.monotonic() + self._SNAPSHOT_TTL_S, snap)
+        return snap
+
+    def _invalidate_snapshot(self) -> None:
+        self._snapshot = None
 
     @property
     def current(self) -> ObservingSession | None:
@@ -216,6 +269,7 @@ class SessionState:
                 db_session.window_end = end
                 session.add(db_session)
                 session.commit()
+                self._invalidate_snapshot()
             else:
                 # If no session exists, we can't persist without creating one.
                 # But creating a session implies "started".
@@ -241,6 +295,7 @@ class SessionState:
             )
             session.add(event)
             session.commit()
+            self._invalidate_snapshot()
 
     def start(
         self,
@@ -298,7 +353,9 @@ class SessionState:
             )
             session.add(new_session)
             session.commit()
+            self._invalidate_snapshot()
             session.refresh(new_session)
+            self.bump_targets_version()
             
             self.log_event(f"Session started: {notes or 'No notes'}", "good")
             self.clear_stop_auto_restart()
@@ -319,6 +376,8 @@ class SessionState:
             db_session.status = "ended"
             session.add(db_session)
             session.commit()
+            self._invalidate_snapshot()
+            self.bump_targets_version()
             
             msg = f"Session ended: {reason}" if reason else "Session ended"
             self.log_event(msg, "warn")
@@ -357,6 +416,7 @@ class SessionState:
             
             session.add(db_session)
             session.commit()
+            self._invalidate_snapshot()
             return self._to_view(db_session)
 
     def reset_calibrations(self, cal_type: str | None = None) -> ObservingSession | None:
@@ -381,6 +441,7 @@ class SessionState:
             
             session.add(db_session)
             session.commit()
+            self._invalidate_snapshot()
             return self._to_view(db_session)
 
     def run_calibrations(self) -> dict:
@@ -410,12 +471,14 @@ class SessionState:
 
             if db_session:
                 stats = dict(db_session.stats)
-                captures = stats.get("captures", [])
+                captures = list(stats.get("captures", []))
                 captures.append(entry)
                 stats["captures"] = captures
                 db_session.stats = stats
                 session.add(db_session)
                 session.commit()
+                self._invalidate_snapshot()
+                self.bump_targets_version()
 
         try:
             record_capture(entry)
@@ -434,6 +497,31 @@ class SessionState:
         for entry in entries:
             self.add_capture(entry)
 
+    def remove_capture(self, path: str) -> List[dict]:
+        """Drop the capture recorded for ``path`` and return the remaining captures."""
+        with get_session() as session:
+            db_session = session.exec(
+                select(DBObservingSession)
+                .where(DBObservingSession.status != "ended")
+                .order_by(DBObservingSession.start_time.desc())
+            ).first()
+            if not db_session:
+                return []
+            stats = dict(db_session.stats)
+            # Copy the list too: mutating the ORM's own list hides the change from the flush
+            captures = list(stats.get("captures", []))
+            for idx, capture in enumerate(captures):
+                if capture.get("path") == path:
+                    del captures[idx]
+                    stats["captures"] = captures
+                    db_session.stats = stats
+                    session.add(db_session)
+                    session.commit()
+                    self._invalidate_snapshot()
+                    self.bump_targets_version()
+                    break
+            return captures
+
     @property
     def selected_preset(self) -> dict[str, Any] | None:
         # Helper to get current preset without querying full session view
@@ -462,6 +550,7 @@ class SessionState:
                 db_session.config_snapshot = config
                 session.add(db_session)
                 session.commit()
+                self._invalidate_snapshot()
             else:
                 # If no session, we can't store it?
                 # Or we start one?
@@ -512,6 +601,7 @@ class SessionState:
                 db_session.config_snapshot = config
                 session.add(db_session)
                 session.commit()
+                self._invalidate_snapshot()
                 
         return snapshot
 
@@ -553,6 +643,8 @@ class SessionState:
                     db_session.selected_target = None
                 session.add(db_session)
                 session.commit()
+                self._invalidate_snapshot()
+                self.bump_targets_version()
 
     def select_target(self, trksub: str | None, mode: str = "manual") -> None:
         with get_session() as session:
@@ -572,6 +664,8 @@ class SessionState:
                     # Usually clearing means we are done or resetting.
                 session.add(db_session)
                 session.commit()
+                self._invalidate_snapshot()
+                self.bump_targets_version()
 
     def _process_capture(self, entry: dict) -> None:
         path = entry.get("path")
@@ -665,6 +759,7 @@ class SessionState:
             db_session.status = "paused"
             session.add(db_session)
             session.commit()
+            self._invalidate_snapshot()
             self.log_event("Session paused", "warn")
             return self._to_view(db_session)
 
@@ -682,6 +777,7 @@ class SessionState:
             db_session.status = "active"
             session.add(db_session)
             session.commit()
+            self._invalidate_snapshot()
             self.log_event("Session resumed", "good")
             return self._to_view(db_session)
 
@@ -702,6 +798,7 @@ class SessionState:
                 db_session.stats = stats
                 session.add(db_session)
                 session.commit()
+                self._invalidate_snapshot()
         return entry
 
     def set_prediction(self, path: str, ra_deg: float, dec_deg: float) -> dict[str, Any]:
@@ -721,6 +818,7 @@ class SessionState:
                 db_session.stats = stats
                 session.add(db_session)
                 session.commit()
+                self._invalidate_snapshot()
         return entry
 
     @property
@@ -752,6 +850,7 @@ class SessionState:
                 db_session.stats = stats
                 session.add(db_session)
                 session.commit()
+                self._invalidate_snapshot()
                 return masters
         return {cal_type: path} # Fallback return
 
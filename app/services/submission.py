@@ -10,6 +10,7 @@ import json
 
 from sqlmodel import Session
 
+from app.core import summary_cache
 from app.core.config import settings
 from app.db.session import get_session
 from app.models import Measurement, SubmissionLog
@@ -42,6 +43,7 @@ class SubmissionService:
             db.add(log)
             db.commit()
             db.refresh(log)
+            summary_cache.invalidate("reports")
             NOTIFICATIONS.add("info" if status == "acked" else "warn", f"Submission {status}", {"id": submission_id})
             return log
 
@@ -55,6 +57,7 @@ class SubmissionService:
             db.add(log)
             db.commit()
             db.refresh(log)
+            summary_cache.invalidate("reports")
 
         if self.session:
             _persist(self.session)
@@ -74,8 +74,6 @@ class SyntheticTargetService:
         window_end_naive = full_day_end.replace(tzinfo=None)
         with get_session() as session:
             pattern = f"{self.prefix}%"
-            session.exec(delete(NeoObservability).where(NeoObservability.trksub.like(pattern)))
-            session.exec(delete(NeoEphemeris).where(NeoEphemeris.trksub.like(pattern)))
             session.exec(delete(NeoCandidate).where(NeoCandidate.trksub.like(pattern)))
             session.commit()
 
@@ -104,7 +102,6 @@ class SyntheticTargetService:
                     vmag=magnitude,
                     status="Synthetic",
                     status_ut=now.isoformat(),
-                    raw_entry="Synthetic target for testing",
                 )
                 session.add(candidate)
                 session.commit()
@@ -123,7 +120,6 @@ class SyntheticTargetService:
 
                 observability = NeoObservability(
                     candidate_id=candidate.id,
-                    trksub=candidate.trksub,
                     night_key=full_day_start.date(),
                     night_start=night_start.replace(tzinfo=None),
                     night_end=night_end.replace(tzinfo=None),
@@ -167,7 +163,6 @@ class SyntheticTargetService:
 
                 eph = NeoEphemeris(
                     candidate_id=candidate.id,
-                    trksub=candidate.trksub,
                     epoch=now.replace(tzinfo=None),
                     ra_deg=candidate.ra_deg or 0.0,
                     dec_deg=candidate.dec_deg or 0.0,
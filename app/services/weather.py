@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -101,7 +100,7 @@ class WeatherService:
             precipitation_probability_pct=metrics.get("precipitation_probability_pct"),
             precipitation_mm=metrics.get("precipitation_mm"),
             cloud_cover_pct=metrics.get("cloud_cover_pct"),
-            payload=json.dumps(payload),
+            payload=payload,
         )
         self.session.add(row)
         self.session.commit()
@@ -0,0 +1,60 @@
+"""Move NEOCP snapshot bodies from the database to the on-disk archive (dry-run by default)."""
+
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import inspect, text
+
+from app.db.session import engine, get_session
+from app.services.neocp_fetcher import _archive_snapshot
+
+_PENDING_SQL = text(
+    "SELECT s.id, s.checksum, b.html FROM neocpsnapshot s "
+    "JOIN neocpsnapshotbody b ON b.snapshot_id = s.id "
+    "WHERE s.payload_path IS NULL ORDER BY s.id"
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Archive NEOCP snapshot HTML stored in neocpsnapshotbody.")
+    parser.add_argument("--apply", action="store_true", help="Actually write files and update rows (default dry-run).")
+    args = parser.parse_args()
+
+    if not inspect(engine).has_table("neocpsnapshotbody"):
+        print("No neocpsnapshotbody table; nothing to archive.")
+        return
+
+    with get_session() as session:
+        rows = session.exec(_PENDING_SQL).all()
+        if not rows:
+            print("No snapshot bodies left to archive.")
+            return
+
+        if not args.apply:
+            print(f"[dry-run] {len(rows)} snapshot bodies would be archived.")
+            return
+
+        archived = 0
+        for snapshot_id, checksum, html in rows:
+            try:
+                path = _archive_snapshot(html, bytes(checksum))
+            except OSError as exc:  # noqa: BLE001
+                print(f"Failed to archive snapshot {snapshot_id}: {exc}")
+                continue
+            session.exec(
+                text("UPDATE neocpsnapshot SET payload_path = :path WHERE id = :id"),
+                params={"path": str(path), "id": snapshot_id},
+            )
+            session.exec(
+                text("DELETE FROM neocpsnapshotbody WHERE snapshot_id = :id"),
+                params={"id": snapshot_id},
+            )
+            # One commit per file, so a failure midway keeps every body not yet on disk
+            session.commit()
+            archived += 1
+    print(f"Archived {archived}/{len(rows)} snapshot bodies.")
+
+
+if __name__ == "__main__":
+    main()
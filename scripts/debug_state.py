@@ -25,4 +25,4 @@ with get_session() as session:
     if not valid and obs:
         print("Sample blocked reasons:")
         for o in obs[:3]:
-            print(f"  {o.trksub}: is_observable={o.is_observable}, factors={o.limiting_factors}")
+            print(f"  {o.candidate_id}: is_observable={o.is_observable}, factors={o.limiting_factors}")
@@ -192,7 +192,6 @@ def ensure_candidate_with_ephemeris(
                 vmag=vmag,
                 status="Synthetic",
                 status_ut=first_time.isoformat(),
-                raw_entry="Synthetic test object",
                 created_at=now,
                 updated_at=now,
             )
@@ -214,7 +213,6 @@ def ensure_candidate_with_ephemeris(
             session.add(
                 NeoEphemeris(
                     candidate_id=candidate.id,
-                    trksub=candidate.trksub,
                     epoch=epoch,
                     ra_deg=ra,
                     dec_deg=dec,
@@ -47,7 +47,6 @@ def verify_association_logic():
         # 3. Create Ephemeris
         ephemeris = NeoEphemeris(
             candidate_id=candidate.id,
-            trksub="TEST001",
             epoch=now,
             ra_deg=10.5,
             dec_deg=20.5,
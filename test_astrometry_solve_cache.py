@@ -0,0 +1,107 @@
+"""Tests for the content-keyed plate-solve cache in AstrometryService.solve_capture."""
+
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from astropy.io import fits
+
+from app.core.config import settings
+from app.services import astrometry
+from app.services.astrometry import AstrometryService, _solve_cache_path
+
+_SOLVED = {"solution": {"ra": 150.25, "dec": 2.5, "orientation": 90.0, "pixscale": 1.2, "rms": 0.4}}
+
+
+def _write_frame(path: Path, seed: int = 0) -> Path:
+    data = np.random.default_rng(seed).integers(0, 4000, size=(32, 32), dtype=np.uint16)
+    fits.PrimaryHDU(data).writeto(path)
+    return path
+
+
+@pytest.fixture
+def solver(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> dict:
+    """Fake solve-field: records calls and writes a .wcs next to the frame like the real one."""
+    state = {"calls": 0, "result": _SOLVED}
+
+    def fake_solve_fits(path: Path, **_: object) -> dict:
+        state["calls"] += 1
+        header = fits.Header({"CTYPE1": "RA---TAN", "CTYPE2": "DEC--TAN", "CRVAL1": 150.25, "CRVAL2": 2.5})
+        fits.PrimaryHDU(header=header).writeto(Path(path).with_suffix(".wcs"), overwrite=True)
+        return state["result"]
+
+    monkeypatch.setattr(settings, "astrometry_solve_cache_dir", str(tmp_path / "solve_cache"))
+    monkeypatch.setattr(astrometry, "solve_fits", fake_solve_fits)
+    monkeypatch.setattr(AstrometryService, "_run_photometry", lambda self, path: {"snr": 50.0, "mag_inst": -10.0})
+    return state
+
+
+def _solve(path: Path) -> object:
+    return AstrometryService(session=MagicMock()).solve_capture(path=path, ra_hint=150.0, dec_hint=2.0)
+
+
+def test_key_ignores_header_changes(tmp_path: Path) -> None:
+    frame = _write_frame(tmp_path / "frame.fits")
+    before = _solve_cache_path(frame, 150.0, 2.0, None, None)
+    fits.setval(frame, "CRVAL1", value=150.25)
+
+    assert _solve_cache_path(frame, 150.0, 2.0, None, None) == before
+
+
+def test_key_depends_on_pixels_and_hints(tmp_path: Path) -> None:
+    frame = _write_frame(tmp_path / "frame.fits")
+    other = _write_frame(tmp_path / "other.fits", seed=1)
+    key = _solve_cache_path(frame, 150.0, 2.0, None, None)
+
+    assert _solve_cache_path(other, 150.0, 2.0, None, None) != key
+    assert _solve_cache_path(frame, 150.0, 2.0, 1.0, None) != key
+    assert _solve_cache_path(frame, 150.0, 2.0, None, 2) != key
+
+
+def test_repeat_solve_is_served_from_cache(solver: dict, tmp_path: Path) -> None:
+    frame = _write_frame(tmp_path / "frame.fits")
+
+    first = _solve(frame)
+    second = _solve(frame)
+
+    assert solver["calls"] == 1
+    assert first.success and second.success
+    assert second.ra_deg == first.ra_deg == 150.25
+
+
+def test_failed_solve_is_not_cached(solver: dict, tmp_path: Path) -> None:
+    frame = _write_frame(tmp_path / "frame.fits")
+    solver["result"] = {"solution": {}}
+
+    _solve(frame)
+    _solve(frame)
+
+    assert solver["calls"] == 2
+
+
+def test_hit_at_a_new_path_restores_wcs(solver: dict, tmp_path: Path) -> None:
+    frame = _write_frame(tmp_path / "frame.fits")
+    _solve(frame)
+    copy = tmp_path / "copy" / "frame.fits"
+    copy.parent.mkdir()
+    shutil.copyfile(frame, copy)
+
+    _solve(copy)
+
+    assert solver["calls"] == 1
+    assert copy.with_suffix(".wcs").exists()
+    assert fits.getheader(copy)["CRVAL1"] == 150.25
+
+
+def test_hit_without_cached_wcs_is_a_miss(solver: dict, tmp_path: Path) -> None:
+    frame = _write_frame(tmp_path / "frame.fits")
+    _solve(frame)
+    cache_path = _solve_cache_path(frame, 150.0, 2.0, None, None)
+    cache_path.with_suffix(".wcs").unlink()
+    frame.with_suffix(".wcs").unlink()
+
+    _solve(frame)
+
+    assert solver["calls"] == 2
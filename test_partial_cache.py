@@ -0,0 +1,98 @@
+"""Tests for the dashboard partial response cache middleware."""
+
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.testclient import TestClient
+
+from app.core.partial_cache import install_partial_cache
+
+
+def _make_client() -> tuple[TestClient, dict[str, int]]:
+    app = FastAPI()
+    install_partial_cache(app, ttl=60)
+    hits = {"partial": 0, "json": 0, "missing": 0}
+
+    @app.api_route("/dashboard/partials/status", methods=["GET", "HEAD"])
+    def status_partial() -> HTMLResponse:
+        hits["partial"] += 1
+        return HTMLResponse(f"<div>render {hits['partial']}</div>", headers={"ETag": '"v1"'})
+
+    @app.get("/dashboard/partials/data")
+    def json_partial() -> JSONResponse:
+        hits["json"] += 1
+        return JSONResponse({"render": hits["json"]})
+
+    @app.get("/dashboard/partials/missing")
+    def missing_partial() -> HTMLResponse:
+        hits["missing"] += 1
+        return HTMLResponse("<div>gone</div>", status_code=404)
+
+    @app.post("/dashboard/targets/select")
+    def select_target() -> HTMLResponse:
+        return HTMLResponse("<div>ok</div>")
+
+    return TestClient(app), hits
+
+
+def test_repeat_get_is_served_from_cache_with_headers() -> None:
+    client, hits = _make_client()
+
+    first = client.get("/dashboard/partials/status")
+    second = client.get("/dashboard/partials/status")
+
+    assert hits["partial"] == 1
+    assert second.text == first.text == "<div>render 1</div>"
+    assert second.headers["etag"] == '"v1"'
+    assert second.headers["content-type"].startswith("text/html")
+    assert second.headers["content-length"] == str(len(second.content))
+
+
+def test_hx_target_is_part_of_the_key() -> None:
+    client, hits = _make_client()
+
+    client.get("/dashboard/partials/status", headers={"HX-Target": "status-panel"})
+    client.get("/dashboard/partials/status", headers={"HX-Target": "status-banner"})
+
+    assert hits["partial"] == 2
+
+
+def test_post_invalidates_cached_partials() -> None:
+    client, hits = _make_client()
+
+    client.get("/dashboard/partials/status")
+    client.post("/dashboard/targets/select")
+    after = client.get("/dashboard/partials/status")
+
+    assert hits["partial"] == 2
+    assert after.text == "<div>render 2</div>"
+
+
+def test_conditional_get_bypasses_cache() -> None:
+    client, hits = _make_client()
+
+    client.get("/dashboard/partials/status")
+    client.get("/dashboard/partials/status", headers={"If-None-Match": '"v1"'})
+
+    assert hits["partial"] == 2
+
+
+def test_non_html_and_error_responses_are_not_stored() -> None:
+    client, hits = _make_client()
+
+    client.get("/dashboard/partials/data")
+    client.get("/dashboard/partials/data")
+    client.get("/dashboard/partials/missing")
+    missing = client.get("/dashboard/partials/missing")
+
+    assert hits["json"] == 2
+    assert hits["missing"] == 2
+    assert missing.status_code == 404
+
+
+def test_head_requests_do_not_populate_cache() -> None:
+    client, hits = _make_client()
+
+    client.head("/dashboard/partials/status")
+    client.get("/dashboard/partials/status")
+
+    assert hits["partial"] == 2
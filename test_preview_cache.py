@@ -0,0 +1,121 @@
+"""Tests for the dashboard FITS preview cache (memory LRU in front of the disk cache)."""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from cachetools import LRUCache
+
+from app import dashboard
+
+
+@pytest.fixture
+def renders(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> list[tuple[Path, int | None]]:
+    """Point the preview cache at ``tmp_path`` and record every real render."""
+    calls: list[tuple[Path, int | None]] = []
+
+    def fake_render(fits_path: Path, max_dim: int | None) -> bytes:
+        calls.append((fits_path, max_dim))
+        return f"jpeg:{fits_path.name}:{max_dim}:{len(calls)}".encode()
+
+    monkeypatch.setattr(dashboard, "_PREVIEW_DIR", tmp_path / "previews")
+    monkeypatch.setattr(dashboard, "_PREVIEW_MEMORY", LRUCache(maxsize=1024 * 1024, getsizeof=len))
+    monkeypatch.setattr(dashboard, "_render_fits_jpeg", fake_render)
+    return calls
+
+
+@pytest.fixture
+def frame(tmp_path: Path) -> Path:
+    path = tmp_path / "frame.fits"
+    path.write_bytes(b"\0" * 2880)
+    return path
+
+
+def test_repeat_request_is_served_from_memory(renders, frame: Path) -> None:
+    first = dashboard._generate_fits_jpeg_bytes(str(frame))
+    second = dashboard._generate_fits_jpeg_bytes(str(frame))
+
+    assert first == second
+    assert len(renders) == 1
+
+
+def test_disk_entry_survives_a_cold_memory_cache(renders, frame: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = dashboard._generate_fits_jpeg_bytes(str(frame))
+    monkeypatch.setattr(dashboard, "_PREVIEW_MEMORY", LRUCache(maxsize=1024 * 1024, getsizeof=len))
+
+    second = dashboard._generate_fits_jpeg_bytes(str(frame))
+
+    assert second == first
+    assert len(renders) == 1
+    assert len(list(dashboard._PREVIEW_DIR.glob("*.jpg"))) == 1
+
+
+def test_rewritten_frame_gets_a_new_key(renders, frame: Path) -> None:
+    dashboard._generate_fits_jpeg_bytes(str(frame))
+    frame.write_bytes(b"\0" * 5760)
+
+    dashboard._generate_fits_jpeg_bytes(str(frame))
+
+    assert len(renders) == 2
+
+
+def test_max_dim_is_part_of_the_key(renders, frame: Path) -> None:
+    scaled = dashboard._generate_fits_jpeg_bytes(str(frame))
+    full = dashboard._generate_fits_jpeg_bytes(str(frame), max_dim=None)
+
+    assert scaled != full
+    assert [max_dim for _, max_dim in renders] == [dashboard._PREVIEW_MAX_DIM, None]
+
+
+def test_missing_frame_raises_file_not_found(renders, tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        dashboard._generate_fits_jpeg_bytes(str(tmp_path / "absent.fits"))
+    assert renders == []
+
+
+def test_prune_removes_only_expired_disk_entries(renders, frame: Path, tmp_path: Path) -> None:
+    dashboard._generate_fits_jpeg_bytes(str(frame))
+    dashboard._generate_fits_jpeg_bytes(str(frame), max_dim=None)
+    old, fresh = sorted(dashboard._PREVIEW_DIR.glob("*.jpg"))
+    os.utime(old, (0, 0))
+
+    removed = dashboard.prune_preview_cache(max_age_s=3600)
+
+    assert removed == 1
+    assert not old.exists()
+    assert fresh.exists()
+
+
+def test_concurrent_requests_render_once(renders, frame: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    started = threading.Event()
+
+    def slow_render(fits_path: Path, max_dim: int | None) -> bytes:
+        renders.append((fits_path, max_dim))
+        started.set()
+        time.sleep(0.2)
+        return b"jpeg"
+
+    monkeypatch.setattr(dashboard, "_render_fits_jpeg", slow_render)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        first = pool.submit(dashboard._generate_fits_jpeg_bytes, str(frame))
+        started.wait(timeout=5)
+        rest = [pool.submit(dashboard._generate_fits_jpeg_bytes, str(frame)) for _ in range(7)]
+        results = [first.result()] + [f.result() for f in rest]
+
+    assert results == [b"jpeg"] * 8
+    assert len(renders) == 1
+    assert dashboard._PREVIEW_RENDER_LOCKS == {}
+
+
+def test_failed_render_releases_its_lock(renders, frame: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def broken_render(fits_path: Path, max_dim: int | None) -> bytes:
+        raise ValueError("No data in FITS frame.")
+
+    monkeypatch.setattr(dashboard, "_render_fits_jpeg", broken_render)
+    with pytest.raises(ValueError):
+        dashboard._generate_fits_jpeg_bytes(str(frame))
+
+    assert dashboard._PREVIEW_RENDER_LOCKS == {}